@@ -0,0 +1,134 @@
+import asyncio
+
+import scraper
+from http_client import AsyncHttpClient
+from metrics import metrics
+from page_parser import parse_company_page
+from rate_limiter import AsyncDomainRateLimiter
+
+# Lookups kept in flight by enrich_batch_async
+ASYNC_CONCURRENCY = 1000
+
+def async_rate_limiter():
+    """Async limiter sharing the buckets of scraper's threaded rate limiter"""
+    return AsyncDomainRateLimiter(scraper.get_rate_limiter())
+
+def async_http_client():
+    """AsyncHttpClient configured from scraper's HTTP settings"""
+    return AsyncHttpClient(
+        headers=scraper.http_headers(),
+        limit_per_host=scraper.HTTP_POOL_SIZE,
+        retries=scraper.HTTP_RETRIES,
+        backoff_factor=scraper.HTTP_BACKOFF,
+        timeout=scraper.HTTP_TIMEOUT
+    )
+
+async def parse_page_async(html, url=''):
+    """Parse fetched HTML in scraper's parser pool, or a worker thread if there is none"""
+    pool = scraper.get_parser_pool()
+    if pool is None:
+        return await asyncio.to_thread(parse_company_page, html, url)
+    return await asyncio.wrap_future(pool.submit(html, url))
+
+async def search_company_info_async(company_name, domain=None, limiter=None, client=None):
+    """Async scraper.search_company_info
+
+    Waits for the domain's rate limit without blocking the event loop and,
+    when an AsyncHttpClient is given, fetches and parses the homepage first.
+    """
+    if not domain:
+        domain = scraper.extract_domain_from_company(company_name)
+    await (limiter or async_rate_limiter()).acquire(domain)
+
+    page = None
+    if client is not None:
+        url = scraper.PAGE_URL.format(domain=domain)
+        try:
+            page = await parse_page_async(await client.get_text(url), url)
+        except Exception:
+            page = None
+    return scraper.search_company_info(company_name, domain, page=page, paced=False)
+
+async def enrich_company_async(company_name, domain=None, refresh=False, limiter=None, client=None):
+    """Async scraper.enrich_company: served from the enrichment cache when possible"""
+    cache = scraper.get_enrichment_cache()
+    company_data = None
+    if cache is not None and not refresh:
+        company_data = cache.get(company_name, domain, seed=scraper.ENRICHMENT_SEED)
+        metrics.incr('cache.misses' if company_data is None else 'cache.hits')
+
+    if company_data is None:
+        company_data = await search_company_info_async(company_name, domain, limiter, client)
+        # Failed lookups are not cached so they are retried next time
+        if cache is not None and company_data['industry'] != 'Unknown':
+            cache.set(company_name, domain, company_data, seed=scraper.ENRICHMENT_SEED)
+
+    return company_data
+
+async def enrich_leads_async(company_name, domain=None, refresh=False, limiter=None, client=None):
+    """Async scraper.enrich_leads: enrich and score a single lead"""
+    try:
+        company_data = await enrich_company_async(company_name, domain, refresh, limiter, client)
+        company_data['acquisition_score'] = scraper.calculate_acquisition_fit_score(company_data)
+        return company_data
+    except Exception:
+        metrics.incr('enrich.failures')
+        company_data = scraper.empty_company_data(company_name, domain)
+        company_data['acquisition_score'] = 0
+        return company_data
+
+async def enrich_batch_async(leads, concurrency=ASYNC_CONCURRENCY, refresh=False, fetch_pages=None, score=True):
+    """Enrich (company_name, domain) pairs, yielding (i, company_data) as each lookup completes
+
+    `leads` is consumed lazily and at most `concurrency` lookups are in flight,
+    so memory stays bounded however long the input is. Results come out in
+    completion order; i is the lead's position in the input. With
+    score=False the data is returned unscored (like scraper.enrich_company)
+    and failed lookups fall back to scraper.empty_company_data.
+    """
+    fetch_pages = scraper.FETCH_PAGES if fetch_pages is None else fetch_pages
+    limiter = async_rate_limiter()
+    client = async_http_client() if fetch_pages else None
+
+    async def enrich(company_name, domain):
+        if score:
+            return await enrich_leads_async(company_name, domain, refresh, limiter, client)
+        try:
+            return await enrich_company_async(company_name, domain, refresh, limiter, client)
+        except Exception:
+            metrics.incr('enrich.failures')
+            return scraper.empty_company_data(company_name, domain)
+
+    lead_iter = iter(enumerate(leads))
+    pending = {}
+
+    def submit_next():
+        item = next(lead_iter, None)
+        if item is not None:
+            i, (company_name, domain) = item
+            pending[asyncio.ensure_future(enrich(company_name, domain))] = i
+
+    try:
+        for _ in range(max(1, concurrency)):
+            submit_next()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                i = pending.pop(task)
+                yield i, task.result()
+                submit_next()
+    finally:
+        # Reached when the consumer stops early or the generator is closed
+        for task in pending:
+            task.cancel()
+        if client is not None:
+            await client.close()
+
+def enrich_all_async(leads, **kwargs):
+    """Run enrich_batch_async to completion from synchronous code; results in input order"""
+    async def collect():
+        results = {}
+        async for i, company_data in enrich_batch_async(leads, **kwargs):
+            results[i] = company_data
+        return [results[i] for i in range(len(results))]
+    return asyncio.run(collect())
@@ -0,0 +1,157 @@
+import argparse
+import sys
+from contextlib import nullcontext
+
+import pandas as pd
+
+import scraper
+from checkpoint import CheckpointLog
+from export import export_format, write_export
+from metrics import metrics, profiled
+from ingest import CHUNK_SIZE, LEAD_COLUMNS, MissingColumnsError, iter_lead_chunks
+from pipeline import MAX_WORKERS, LeadPipeline, leads_from_frame
+from scoring import FACTOR_COLUMNS, load_weights, rescore
+from lead_sets import read_lead_set
+from lead_store import LeadStore
+
+def read_lead_chunks(path, chunksize=CHUNK_SIZE):
+    """Yield lead DataFrames from a CSV, Parquet or Arrow file"""
+    if export_format(path) not in ('parquet', 'arrow'):
+        yield from iter_lead_chunks(path, chunksize)
+        return
+
+    df = read_leads(path)
+    df = df[[col for col in LEAD_COLUMNS if col in df.columns]]
+    if 'company_name' not in df.columns:
+        raise MissingColumnsError(['company_name'])
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start:start + chunksize]
+
+def write_leads(df, path):
+    """Write leads as Parquet, Arrow, gzipped CSV or CSV depending on the file extension"""
+    write_export(df, path, export_format(path))
+
+def read_leads(path):
+    fmt = export_format(path)
+    if fmt == 'arrow':
+        return read_lead_set(path)[0]
+    return pd.read_parquet(path) if fmt == 'parquet' else pd.read_csv(path)
+
+def rescore_file(input_path, output_path, weights=None, log=print):
+    """Re-rank an already scored file from its factor columns without re-enriching"""
+    df = read_leads(input_path)
+    missing = [col for col in FACTOR_COLUMNS.values() if col not in df.columns]
+    if missing:
+        raise ValueError(f"{input_path} has no factor columns ({', '.join(missing)}); score it without --rescore first")
+    df['acquisition_score'] = rescore(df, weights)
+    df = df.sort_values('acquisition_score', ascending=False, kind='stable')
+    write_leads(df, output_path)
+    log(f"Rescored {len(df)} leads to {output_path}")
+    return df
+
+def load_checkpoint_frame(checkpoint):
+    """Enriched (unscored) leads from a checkpoint log, in row order"""
+    records = checkpoint.load()
+    store = LeadStore(len(records))
+    for i, rid in enumerate(sorted(records)):
+        store[i] = records.pop(rid)
+    return store.to_frame()
+
+def run_batch(input_path, output_path, max_workers=MAX_WORKERS, chunksize=CHUNK_SIZE,
+              checkpoint_path=None, resume=False, refresh=False, weights=None, log=print,
+              progress_callback=None, dedupe=True, pipeline=None):
+    """Enrich and score every lead in input_path, writing them to output_path by descending score
+
+    Enriched rows are appended to a checkpoint log as each chunk finishes; with
+    resume=True rows already in the log are skipped. The log is removed once
+    the output has been written. progress_callback(rows_done) is called after
+    every chunk. Pass a LeadPipeline to read its stats after the run; it then
+    takes the place of max_workers, refresh, weights and dedupe.
+    """
+    checkpoint = CheckpointLog(checkpoint_path or output_path + '.checkpoint.jsonl')
+    if not resume:
+        checkpoint.clear()
+    completed = checkpoint.completed_ids()
+    if completed:
+        log(f"Resuming: {len(completed)} leads already enriched")
+
+    if pipeline is None:
+        pipeline = LeadPipeline(max_workers=max_workers, refresh=refresh, weights=weights, dedupe=dedupe)
+    row_id = 0
+    for chunk in read_lead_chunks(input_path, chunksize):
+        row_ids = range(row_id, row_id + len(chunk))
+        row_id += len(chunk)
+        pending = [i for i, rid in enumerate(row_ids) if rid not in completed]
+        if pending:
+            enriched = pipeline.enrich(leads_from_frame(chunk.iloc[pending]))
+            checkpoint.append(zip((row_ids[i] for i in pending), enriched.to_dict('records')))
+            log(f"Enriched {row_id} leads")
+        if progress_callback:
+            progress_callback(row_id)
+
+    df = pipeline.score(load_checkpoint_frame(checkpoint))
+    df = df.sort_values('acquisition_score', ascending=False, kind='stable')
+    write_leads(df, output_path)
+    checkpoint.clear()
+
+    for name, entry in pipeline.stats.as_dict().items():
+        log(f"{name}: {entry['items']} leads in {entry['seconds']:.2f}s")
+    report = pipeline.dedupe_report()
+    if report['duplicates']:
+        log(f"dedupe: {report['duplicates']} duplicate rows ({report['saved_fraction']:.0%}) reused another row's enrichment")
+    log(f"Wrote {len(df)} prioritized leads to {output_path}")
+    return df
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Enrich and score a lead list without the Streamlit UI")
+    parser.add_argument('input', help="CSV, Parquet or Arrow file with a company_name column (domain optional)")
+    parser.add_argument('-o', '--output', required=True, help="Output file (.csv, .csv.gz, .parquet or .arrow)")
+    parser.add_argument('-w', '--workers', type=int, default=MAX_WORKERS, help="Leads enriched concurrently")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="Rows enriched between checkpoints")
+    parser.add_argument('--checkpoint', help="Checkpoint log path (default: <output>.checkpoint.jsonl)")
+    parser.add_argument('--resume', action='store_true', help="Skip leads already in the checkpoint log")
+    parser.add_argument('--refresh', action='store_true', help="Bypass the enrichment cache")
+    parser.add_argument('--no-dedupe', action='store_true',
+                        help="Enrich every row, even rows naming the same company")
+    parser.add_argument('--weights', help="JSON file of scoring weights, e.g. {\"revenue\": 40}")
+    parser.add_argument('--rescore', action='store_true',
+                        help="Input is an already scored file; only re-apply the weights")
+    parser.add_argument('--fetch-pages', action='store_true',
+                        help="Fetch and parse each company's homepage during enrichment")
+    parser.add_argument('--parse-processes', type=int, default=scraper.PARSER_PROCESSES,
+                        help="Processes parsing fetched HTML (0 parses in the fetching threads)")
+    parser.add_argument('--seed', type=int, default=scraper.ENRICHMENT_SEED,
+                        help="Make the mock enrichment reproducible: the same lead and seed always get the same data")
+    parser.add_argument('--metrics', help="Write stage timings, hot-path timers and counters to this JSON file")
+    parser.add_argument('--profile', help="Write cProfile stats of the run (all threads) to this file")
+    args = parser.parse_args(argv)
+    scraper.ENRICHMENT_SEED = args.seed
+    scraper.FETCH_PAGES = args.fetch_pages
+    scraper.PARSER_PROCESSES = args.parse_processes
+
+    log = lambda message: print(message, file=sys.stderr)
+    try:
+        weights = load_weights(args.weights) if args.weights else None
+        pipeline = LeadPipeline(max_workers=args.workers, refresh=args.refresh, weights=weights,
+                                dedupe=not args.no_dedupe)
+        with profiled(args.profile) if args.profile else nullcontext():
+            if args.rescore:
+                rescore_file(args.input, args.output, weights, log=log)
+            else:
+                run_batch(args.input, args.output, chunksize=args.chunk_size, checkpoint_path=args.checkpoint,
+                          resume=args.resume, log=log, pipeline=pipeline)
+    except (MissingColumnsError, FileNotFoundError, ValueError) as e:
+        parser.error(str(e))
+
+    if args.metrics:
+        cache = scraper.get_enrichment_cache()
+        metrics.dump(
+            args.metrics,
+            stages=pipeline.stats.as_dict(),
+            dedupe=pipeline.dedupe_report(),
+            cache=cache.stats() if cache is not None else None,
+        )
+        log(f"Wrote metrics to {args.metrics}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+import argparse
+import ast
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import scraper
+from page_parser import ParserPool, parse_company_page
+from pipeline import MAX_WORKERS, LeadPipeline, leads_from_frame
+from scoring import calculate_acquisition_fit_scores
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+# Paths are relative to this file, so the script runs from any directory
+HERE = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_PATH = os.path.join(HERE, 'sample_leads.csv')
+# HTML parsing is benchmarked on at most this many pages per size
+PARSE_SAMPLE_SIZE = 5000
+APP_PATH = os.path.join(HERE, 'main.py')
+# Seconds the app's own imports (pandas included) may add to a cold start on
+# top of Streamlit. They took ~1.0-1.2s here, down from ~1.45s with plotly,
+# bs4 and requests loaded eagerly; the budget leaves room for slower or busier
+# machines, while the DEFERRED_MODULES check catches an eager heavy import
+IMPORT_BUDGET_SECONDS = 2.0
+# Heavy modules the app must not load until they are actually used
+DEFERRED_MODULES = ('plotly.express', 'plotly.subplots', 'bs4', 'requests', 'aiohttp')
+
+def synthetic_leads(n, seed=0, sample_path=SAMPLE_PATH):
+    """Generate n leads shaped like sample_leads.csv
+
+    Names recombine the first and last words of the sample company names and
+    append a number so most rows are distinct companies.
+    """
+    sample = pd.read_csv(sample_path)
+    words = sample['company_name'].str.split()
+    firsts = words.str[0].unique()
+    lasts = words[words.str.len() > 1].str[-1].unique()
+
+    rng = np.random.default_rng(seed)
+    names = (
+        pd.Series(rng.choice(firsts, n)) + ' ' +
+        pd.Series(rng.choice(lasts, n)) + ' ' +
+        pd.Series(rng.integers(0, n, n)).astype(str)
+    )
+    domains = names.str.lower().str.replace(r'[^a-z0-9]', '', regex=True) + '.com'
+    return pd.DataFrame({'company_name': names, 'domain': domains})
+
+def synthetic_page(company_name, domain):
+    """A small company homepage with the elements parse_company_page looks for"""
+    nav = ''.join(f'<li><a href="/{section}">{section.title()}</a></li>'
+                  for section in ['products', 'pricing', 'customers', 'careers', 'blog', 'about'])
+    body = ''.join(f'<section><h2>{company_name} feature {i}</h2><p>{company_name} helps teams ship '
+                   f'faster with cloud software, analytics and support for {i * 10} integrations.</p></section>'
+                   for i in range(12))
+    return (
+        f'<html><head><title>{company_name} | Cloud Software</title>'
+        f'<meta name="description" content="{company_name} builds SaaS tools for growing teams."></head>'
+        f'<body><nav><ul>{nav}</ul></nav><main>{body}</main><footer>'
+        f'<a href="mailto:sales@{domain}">Sales</a> <a href="tel:+1-415-555-0100">Call us</a> '
+        f'<a href="https://www.linkedin.com/company/{domain.split(".")[0]}">LinkedIn</a></footer></body></html>'
+    )
+
+def disable_request_delay():
+    """Stub out rate limiting and caching so only CPU work is measured"""
+    scraper.REQUEST_DELAY = 0
+    scraper.set_rate_limiter(None)
+    scraper.CACHE_PATH = ''
+    scraper.set_enrichment_cache(None)
+
+def _per_lead(fn, items):
+    latencies = np.empty(len(items))
+    results = []
+    start = time.perf_counter()
+    for i, item in enumerate(items):
+        t0 = time.perf_counter()
+        results.append(fn(item))
+        latencies[i] = time.perf_counter() - t0
+    return time.perf_counter() - start, latencies, results
+
+def _batch(fn, arg):
+    start = time.perf_counter()
+    result = fn(arg)
+    return time.perf_counter() - start, None, result
+
+def _pipeline(leads, max_workers):
+    latencies = []
+    def timed_enrich(company_name, domain):
+        t0 = time.perf_counter()
+        data = scraper.enrich_company(company_name, domain)
+        latencies.append(time.perf_counter() - t0)
+        return data
+    pipeline = LeadPipeline(enrich_fn=timed_enrich, max_workers=max_workers)
+    start = time.perf_counter()
+    df = pipeline.run(leads)
+    return time.perf_counter() - start, np.array(latencies), df
+
+def benchmark_stages(leads_df, max_workers=MAX_WORKERS, parse_processes=None):
+    """Yield (stage, rows, callable) triples; each callable returns (seconds, latencies, result)"""
+    names = leads_df['company_name'].tolist()
+    leads = list(leads_from_frame(leads_df))
+    parse_processes = parse_processes or os.cpu_count()
+    state = {}
+
+    def detect_industry():
+        # Fresh matcher so memoized names from earlier runs don't skew the numbers
+        scraper.set_keyword_matcher(None)
+        return _per_lead(scraper.detect_industry, names)
+
+    def search_company_info():
+        scraper.set_keyword_matcher(None)
+        seconds, latencies, records = _per_lead(lambda lead: scraper.search_company_info(*lead), leads)
+        state['records'] = records
+        return seconds, latencies, records
+
+    def search_company_batch():
+        scraper.set_keyword_matcher(None)
+        domains = [domain for _, domain in leads]
+        return _batch(lambda names: scraper.search_company_batch(names, domains, seed=0), names)
+
+    def score_scalar():
+        return _per_lead(scraper.calculate_acquisition_fit_score, state['records'])
+
+    def score_vectorized():
+        return _batch(calculate_acquisition_fit_scores, pd.DataFrame(state['records']))
+
+    def pipeline():
+        scraper.set_keyword_matcher(None)
+        return _pipeline(leads, max_workers)
+
+    pages = [(synthetic_page(name, domain), f"https://{domain}/") for name, domain in leads[:PARSE_SAMPLE_SIZE]]
+
+    def parse_threads():
+        # Parsing in the enrichment threads is serialised by the GIL
+        with ThreadPoolExecutor(max_workers) as executor:
+            start = time.perf_counter()
+            results = list(executor.map(lambda page: parse_company_page(*page), pages))
+            return time.perf_counter() - start, None, results
+
+    def parse_pool():
+        with ParserPool(parse_processes) as pool:
+            list(pool.map(pages[:parse_processes]))  # start the workers outside the timing
+            start = time.perf_counter()
+            results = list(pool.map(pages))
+            return time.perf_counter() - start, None, results
+
+    yield 'detect_industry', len(leads), detect_industry
+    yield 'search_company_info', len(leads), search_company_info
+    yield 'search_company_batch', len(leads), search_company_batch
+    yield 'calculate_acquisition_fit_score', len(leads), score_scalar
+    yield 'calculate_acquisition_fit_scores', len(leads), score_vectorized
+    yield 'pipeline', len(leads), pipeline
+    yield 'parse_company_page[threads]', len(pages), parse_threads
+    yield f'parse_company_page[{parse_processes} processes]', len(pages), parse_pool
+
+def _peak_memory(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run_benchmarks(sizes=DEFAULT_SIZES, max_workers=MAX_WORKERS, memory=True, seed=0, log=print,
+                   parse_processes=None):
+    """Run every stage at every size and return a JSON-serialisable report
+
+    Timings come from a plain run; peak memory is measured in a separate run
+    under tracemalloc so its overhead doesn't distort the latency numbers.
+    """
+    disable_request_delay()
+    results = []
+    for size in sizes:
+        leads_df = synthetic_leads(size, seed=seed)
+        for stage, rows, fn in benchmark_stages(leads_df, max_workers, parse_processes):
+            seconds, latencies, _ = fn()
+            peak = _peak_memory(fn) if memory else None
+            entry = {
+                'stage': stage,
+                'rows': rows,
+                'seconds': round(seconds, 6),
+                'rows_per_second': round(rows / seconds, 1) if seconds else None,
+                'p50_ms': round(float(np.percentile(latencies, 50)) * 1000, 6) if latencies is not None and len(latencies) else None,
+                'p99_ms': round(float(np.percentile(latencies, 99)) * 1000, 6) if latencies is not None and len(latencies) else None,
+                'peak_memory_mb': round(peak / 2 ** 20, 3) if peak is not None else None,
+            }
+            results.append(entry)
+            log(f"{stage:<34} {rows:>8} rows  {entry['rows_per_second'] or 0:>12,.0f} rows/s  "
+                f"p50 {entry['p50_ms'] if entry['p50_ms'] is not None else '-'} ms  "
+                f"p99 {entry['p99_ms'] if entry['p99_ms'] is not None else '-'} ms  "
+                f"peak {entry['peak_memory_mb'] if entry['peak_memory_mb'] is not None else '-'} MB")
+
+    return {
+        'meta': {
+            'timestamp': pd.Timestamp.now().isoformat(),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'max_workers': max_workers,
+            'parse_processes': parse_processes or os.cpu_count(),
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+def app_imports(path=APP_PATH):
+    """Modules imported at the top level of the app script"""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+def measure_imports(modules, preloaded=('streamlit',), repeat=5, cwd=HERE):
+    """Median cold import time of `modules` in fresh interpreters, after `preloaded`
+
+    The interpreters run in `cwd`, so the app's own modules are importable.
+    Also reports which DEFERRED_MODULES the imports pulled in (ones that
+    `preloaded` already loads are not counted).
+    """
+    code = (
+        f"import sys, time\n"
+        f"for name in {list(preloaded)!r}: __import__(name)\n"
+        f"before = set(sys.modules)\n"
+        f"start = time.perf_counter()\n"
+        f"for name in {list(modules)!r}: __import__(name)\n"
+        f"elapsed = time.perf_counter() - start\n"
+        f"print(elapsed, *[name for name in {list(DEFERRED_MODULES)!r} if name in set(sys.modules) - before])\n"
+    )
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=cwd).stdout.split()
+        runs.append(float(out[0]))
+    return {'seconds': statistics.median(runs), 'loaded': out[1:]}
+
+def check_import_budget(path=APP_PATH, budget=IMPORT_BUDGET_SECONDS, log=print):
+    """Measure the app's imports against the budget; True if they are within it"""
+    modules = [name for name in app_imports(path) if name != 'streamlit']
+    result = measure_imports(modules, cwd=os.path.dirname(os.path.abspath(path)))
+    log(f"App imports: {result['seconds']:.3f}s on top of streamlit (budget {budget:.3f}s)")
+    if result['loaded']:
+        log(f"Loaded at startup but should be deferred: {', '.join(result['loaded'])}")
+    return result['seconds'] <= budget and not result['loaded']
+
+def compare_reports(current, baseline):
+    """Lines describing throughput change per (stage, rows) against a baseline report"""
+    previous = {(r['stage'], r['rows']): r for r in baseline['results']}
+    lines = []
+    for entry in current['results']:
+        before = previous.get((entry['stage'], entry['rows']))
+        if not before or not before['rows_per_second'] or not entry['rows_per_second']:
+            continue
+        ratio = entry['rows_per_second'] / before['rows_per_second']
+        lines.append(f"{entry['stage']:<34} {entry['rows']:>8} rows  {ratio:6.2f}x throughput vs baseline")
+    return lines
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the enrichment and scoring hot paths")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Synthetic lead counts to run")
+    parser.add_argument('-w', '--workers', type=int, default=MAX_WORKERS, help="Workers for the pipeline stage")
+    parser.add_argument('-o', '--output', default='benchmark_results.json', help="Where to write the JSON report")
+    parser.add_argument('--compare', help="Baseline JSON report to compare throughput against")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc peak memory runs")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--parse-processes', type=int, help="Processes for the HTML parsing stage (default: CPU count)")
+    parser.add_argument('--imports', action='store_true',
+                        help="Only check the app's cold import time against its budget (exit status 1 if over)")
+    parser.add_argument('--import-budget', type=float, default=IMPORT_BUDGET_SECONDS,
+                        help="Seconds allowed by --imports")
+    args = parser.parse_args(argv)
+
+    log = lambda message: print(message, file=sys.stderr)
+    if args.imports:
+        sys.exit(0 if check_import_budget(budget=args.import_budget, log=log) else 1)
+    report = run_benchmarks(args.sizes, args.workers, memory=not args.no_memory, seed=args.seed, log=log,
+                            parse_processes=args.parse_processes)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    log(f"Wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        for line in compare_reports(report, baseline):
+            log(line)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import json
+import os
+import threading
+
+class CheckpointLog:
+    """Append-only JSONL log of enriched leads keyed by row id
+
+    Each line is {"row_id": ..., "data": {...}}. Appends are flushed and
+    fsynced per batch, and a truncated final line (from a crash mid-write) is
+    ignored on load, so a restarted run can skip every row already logged.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def load(self):
+        """Return {row_id: data} for every completed row"""
+        records = {}
+        if not self.exists():
+            return records
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Partially written last line
+                    continue
+                records[entry['row_id']] = entry['data']
+        return records
+
+    def read_from(self, offset=0):
+        """Records appended at or after byte `offset`: ([(row_id, data), ...], next_offset)
+
+        Only complete lines are returned, so a line still being written is
+        picked up by the next call.
+        """
+        records = []
+        if not self.exists():
+            return records, offset
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                offset += len(line)
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Partially written line, terminated by a later append
+                    continue
+                records.append((entry['row_id'], entry['data']))
+        return records, offset
+
+    def size(self):
+        return os.path.getsize(self.path) if self.exists() else 0
+
+    def completed_ids(self):
+        return set(self.load())
+
+    def append(self, records):
+        """Durably append an iterable of (row_id, data) pairs"""
+        lines = [json.dumps({'row_id': row_id, 'data': data}) + '\n' for row_id, data in records]
+        if not lines:
+            return
+        with self._lock:
+            with open(self.path, 'ab') as f:
+                # Terminate a line left partially written by an interrupted run
+                if f.tell() > 0:
+                    with open(self.path, 'rb') as tail:
+                        tail.seek(-1, os.SEEK_END)
+                        if tail.read(1) != b'\n':
+                            f.write(b'\n')
+                f.write(''.join(lines).encode('utf-8'))
+                f.flush()
+                os.fsync(f.fileno())
+
+    def clear(self):
+        with self._lock:
+            if self.exists():
+                os.remove(self.path)
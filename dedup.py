@@ -0,0 +1,109 @@
+import re
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from scraper import CACHE_TTL, extract_domain_from_company
+
+# Trailing words dropped when canonicalising company names
+LEGAL_SUFFIXES = {
+    'inc', 'incorporated', 'llc', 'ltd', 'limited', 'corp', 'corporation', 'co', 'company',
+    'plc', 'gmbh', 'ag', 'sa', 'bv', 'pty', 'lp', 'llp',
+}
+
+def canonical_company_name(company_name):
+    """Lowercase, punctuation-free company name without trailing legal suffixes"""
+    words = re.sub(r'[^a-z0-9\s]', ' ', str(company_name).lower()).split()
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+def normalize_domain(domain):
+    """Bare lowercase host name from a domain or URL ('' if there is none)"""
+    domain = str(domain or '').strip().lower()
+    if not domain:
+        return ''
+    if '://' not in domain:
+        domain = '//' + domain
+    try:
+        host = urlsplit(domain).hostname or ''
+    except ValueError:
+        return ''
+    host = host.rstrip('.')
+    return host[4:] if host.startswith('www.') else host
+
+def entity_domain(company_name, domain=None):
+    """Domain identifying the company a lead row refers to
+
+    The normalized domain when the row has one, otherwise the domain derived
+    from the canonical company name, so 'Acme, Inc.' and 'ACME Inc' without a
+    domain and 'https://www.acme.com/' all resolve to acme.com.
+    """
+    return normalize_domain(domain) or extract_domain_from_company(canonical_company_name(company_name))
+
+def dedupe_leads(leads):
+    """Group (company_name, domain) pairs by entity
+
+    Returns (unique, inverse): one (company_name, domain) pair per entity and
+    an array mapping every input row to its entity in `unique`. Each entity
+    is looked up under its first row's name and the first normalized domain
+    any of its rows supplied, or no domain when none did, so an uploaded
+    domain is never replaced by one guessed from another row's name.
+    """
+    positions = {}
+    unique = []
+    inverse = np.empty(len(leads), dtype=np.intp)
+    for i, (company_name, domain) in enumerate(leads):
+        key = entity_domain(company_name, domain)
+        j = positions.get(key)
+        if j is None:
+            j = positions[key] = len(unique)
+            unique.append((company_name, normalize_domain(domain)))
+        elif not unique[j][1]:
+            unique[j] = (unique[j][0], normalize_domain(domain))
+        inverse[i] = j
+    return unique, inverse
+
+def dedupe_report(rows, unique):
+    """How much enrichment work deduplication saved"""
+    return {
+        'rows': rows,
+        'unique': unique,
+        'duplicates': rows - unique,
+        'saved_fraction': (rows - unique) / rows if rows else 0.0,
+    }
+
+def entity_keys(df):
+    """entity_domain of every row of a leads DataFrame"""
+    domains = df['domain'].fillna('').astype(str) if 'domain' in df.columns else [''] * len(df)
+    return [entity_domain(company_name, domain) for company_name, domain in zip(df['company_name'], domains)]
+
+def matching_rows(df, other):
+    """Boolean mask of the rows of `df` whose entity also appears in `other`"""
+    if not len(df) or not len(other):
+        return np.zeros(len(df), dtype=bool)
+    keys = set(entity_keys(other))
+    return np.fromiter((key in keys for key in entity_keys(df)), dtype=bool, count=len(df))
+
+def rows_to_enrich(upload, existing, refresh=False, max_age=CACHE_TTL, now=None):
+    """Mask of uploaded rows that an incremental merge into `existing` has to enrich
+
+    Rows whose entity is already among the existing scored leads are skipped,
+    unless that lookup failed (industry 'Unknown'), is stale or refresh is
+    set; new entities are always enriched. A lookup is stale when its
+    enriched_at is missing or more than `max_age` seconds old; leads saved
+    before enriched_at was recorded have no such column and never count as
+    stale.
+    """
+    if refresh or existing is None:
+        return np.ones(len(upload), dtype=bool)
+    fresh = np.ones(len(existing), dtype=bool)
+    if 'industry' in existing.columns:
+        fresh &= (existing['industry'] != 'Unknown').to_numpy()
+    if 'enriched_at' in existing.columns:
+        now = time.time() if now is None else now
+        enriched_at = existing['enriched_at'].to_numpy(dtype=float, na_value=np.nan)
+        # NaN (unknown age) compares False, so it counts as stale
+        fresh &= enriched_at > now - max_age
+    return ~matching_rows(upload, existing[fresh])
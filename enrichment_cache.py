@@ -0,0 +1,144 @@
+import json
+import sqlite3
+import threading
+import time
+
+def _seed_key(seed):
+    # Unseeded results are stored under '' so the key column is never NULL
+    return '' if seed is None else str(seed)
+
+class EnrichmentCache:
+    """Persistent SQLite cache of enrichment results keyed by (company_name, domain, seed)
+
+    Results drawn under different enrichment seeds (or without one) are kept
+    apart, so switching seeds never serves values drawn under another seed.
+
+    Entries expire after `ttl` seconds and the least recently used entries are
+    evicted once more than `max_entries` are stored. The connection is shared
+    between threads and guarded by a lock.
+    """
+
+    # Number of buffered access-time updates written in one transaction
+    ACCESS_FLUSH_SIZE = 1000
+
+    def __init__(self, path, ttl=7 * 24 * 3600, max_entries=500000, clock=time.time):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Access times of cache hits, written back in batches
+        self._pending_access = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS enrichment (
+                company_name TEXT NOT NULL,
+                domain TEXT NOT NULL,
+                seed TEXT NOT NULL,
+                data TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (company_name, domain, seed)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS enrichment_lru ON enrichment (last_access)")
+        self._size = self._conn.execute("SELECT COUNT(*) FROM enrichment").fetchone()[0]
+
+    def get(self, company_name, domain, seed=None):
+        """Return the data dict cached under `seed`, or None if missing or expired"""
+        now = self.clock()
+        key = (company_name, domain or '', _seed_key(seed))
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, expires_at FROM enrichment WHERE company_name = ? AND domain = ? AND seed = ?", key
+            ).fetchone()
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None
+            self._pending_access[key] = now
+            if len(self._pending_access) >= self.ACCESS_FLUSH_SIZE:
+                self._flush_access()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def _flush_access(self):
+        if not self._pending_access:
+            return
+        self._conn.execute("BEGIN")
+        self._conn.executemany(
+            "UPDATE enrichment SET last_access = ? WHERE company_name = ? AND domain = ? AND seed = ?",
+            [(when,) + key for key, when in self._pending_access.items()]
+        )
+        self._conn.execute("COMMIT")
+        self._pending_access.clear()
+
+    def set(self, company_name, domain, data, ttl=None, seed=None):
+        """Store data for (company_name, domain) under `seed`, replacing any existing entry"""
+        now = self.clock()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        key = (company_name, domain or '', _seed_key(seed))
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO enrichment VALUES (?, ?, ?, ?, ?, ?)",
+                key + (json.dumps(data), expires_at, now)
+            )
+            if cursor.rowcount:
+                self._size += 1
+            else:
+                self._conn.execute(
+                    "UPDATE enrichment SET data = ?, expires_at = ?, last_access = ? "
+                    "WHERE company_name = ? AND domain = ? AND seed = ?",
+                    (json.dumps(data), expires_at, now) + key
+                )
+            if self._size > self.max_entries:
+                self._evict(now)
+
+    def _evict(self, now):
+        # Drop expired entries first, then the least recently used ones,
+        # leaving some headroom so eviction doesn't run on every insert
+        self._flush_access()
+        self._conn.execute("DELETE FROM enrichment WHERE expires_at <= ?", (now,))
+        target = int(self.max_entries * 0.9)
+        excess = self._conn.execute("SELECT COUNT(*) FROM enrichment").fetchone()[0] - target
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM enrichment WHERE rowid IN "
+                "(SELECT rowid FROM enrichment ORDER BY last_access LIMIT ?)", (excess,)
+            )
+        self._size = self._conn.execute("SELECT COUNT(*) FROM enrichment").fetchone()[0]
+
+    def invalidate(self, company_name, domain):
+        """Remove a company's entries (under every seed) so the next lookup re-enriches it"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM enrichment WHERE company_name = ? AND domain = ?", (company_name, domain or '')
+            )
+            self._size -= cursor.rowcount
+
+    def clear(self):
+        """Remove every entry and reset the counters"""
+        with self._lock:
+            self._conn.execute("DELETE FROM enrichment")
+            self._pending_access.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Hit/miss counters and current entry count"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': self._size,
+        }
+
+    def close(self):
+        with self._lock:
+            self._flush_access()
+            self._conn.close()
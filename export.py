@@ -0,0 +1,149 @@
+import gzip
+import io
+import tempfile
+
+import numpy as np
+
+# format: (file extension, MIME type)
+EXPORT_FORMATS = {
+    'csv': ('.csv', 'text/csv'),
+    'csv.gz': ('.csv.gz', 'application/gzip'),
+    'parquet': ('.parquet', 'application/vnd.apache.parquet'),
+    'arrow': ('.arrow', 'application/vnd.apache.arrow.file'),
+}
+EXPORT_CHUNK_SIZE = 10000  # rows materialised per write
+
+def export_format(path):
+    """Export format implied by a file name's extension"""
+    lower = path.lower()
+    if lower.endswith(('.parquet', '.pq')):
+        return 'parquet'
+    if lower.endswith(('.arrow', '.feather')):
+        return 'arrow'
+    if lower.endswith('.gz'):
+        return 'csv.gz'
+    return 'csv'
+
+def score_order(df):
+    """Row positions by descending acquisition_score (stable), or None if unscored"""
+    if 'acquisition_score' not in df.columns:
+        return None
+    return np.argsort(-df['acquisition_score'].to_numpy(dtype=float), kind='stable')
+
+def iter_export_chunks(df, order=None, columns=None, chunksize=EXPORT_CHUNK_SIZE):
+    """Yield df in row order `order` (positions), chunksize rows at a time
+
+    Only one chunk of the reordered rows exists at once, instead of a full
+    sorted copy of the frame.
+    """
+    if columns is not None:
+        df = df[[col for col in columns if col in df.columns]]
+    if order is None:
+        # Plain slices are views; a positional take would copy (and, for
+        # Arrow-backed columns, re-combine every chunk of the column)
+        for start in range(0, len(df), chunksize):
+            yield df.iloc[start:start + chunksize]
+        return
+    for start in range(0, len(order), chunksize):
+        yield df.iloc[order[start:start + chunksize]]
+
+def _write_csv(chunks, target):
+    text = io.TextIOWrapper(target, encoding='utf-8', newline='')
+    for i, chunk in enumerate(chunks):
+        chunk.to_csv(text, header=i == 0, index=False)
+    text.flush()
+    text.detach()
+
+def _arrow_tables(chunks, metadata=None):
+    """Arrow tables for the chunks, all with the schema of the first one"""
+    import pyarrow as pa
+
+    schema = None
+    for chunk in chunks:
+        if schema is None:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            # An all-missing text column in the first chunk would otherwise pin the column to null
+            schema = table.schema
+            for i, field in enumerate(schema):
+                if pa.types.is_null(field.type):
+                    schema = schema.set(i, field.with_type(pa.string()))
+            if metadata:
+                schema = schema.with_metadata({**schema.metadata, **metadata})
+            yield table.cast(schema)
+        else:
+            yield pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+
+def _write_parquet(chunks, target, metadata=None):
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for table in _arrow_tables(chunks, metadata):
+            if writer is None:
+                writer = pq.ParquetWriter(target, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+def _write_arrow(chunks, target, metadata=None):
+    # Uncompressed Arrow IPC file, so it can be memory-mapped and read without copying
+    import pyarrow as pa
+
+    writer = None
+    try:
+        for table in _arrow_tables(chunks, metadata):
+            if writer is None:
+                writer = pa.ipc.new_file(target, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+def write_export(df, target, fmt='csv', order=None, columns=None, chunksize=EXPORT_CHUNK_SIZE, metadata=None):
+    """Write leads to a path or binary file object in chunks
+
+    fmt is one of EXPORT_FORMATS; rows are written in `order` (positions,
+    e.g. from score_order or LeadIndex.positions) so callers don't need a
+    sorted copy of the frame. Parquet and Arrow files keep categorical
+    columns as dictionary-encoded columns and store `metadata` (str -> str)
+    in their schema.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {', '.join(EXPORT_FORMATS)}")
+    chunks = iter_export_chunks(df, order, columns, chunksize)
+    if fmt == 'parquet':
+        _write_parquet(chunks, target, metadata)
+        return
+    if fmt == 'arrow':
+        _write_arrow(chunks, target, metadata)
+        return
+
+    owns_target = isinstance(target, str)
+    f = open(target, 'wb') if owns_target else target
+    try:
+        if fmt == 'csv.gz':
+            with gzip.GzipFile(fileobj=f, mode='wb') as compressed:
+                _write_csv(chunks, compressed)
+        else:
+            _write_csv(chunks, f)
+    finally:
+        if owns_target:
+            f.close()
+
+def export_tempfile(df, fmt='csv', order=None, columns=None, chunksize=EXPORT_CHUNK_SIZE):
+    """Write an export to an anonymous temp file and return it rewound for reading
+
+    The returned object is the unbuffered (io.RawIOBase) file, one of the
+    types st.download_button accepts. The app passes this function to the
+    button as a callable, so the export is only written when the button is
+    clicked. Streamlit then reads the whole file into memory to serve it.
+    The file is deleted when it is closed or garbage collected.
+    """
+    raw = tempfile.TemporaryFile(buffering=0)
+    buffered = io.BufferedWriter(raw)
+    write_export(df, buffered, fmt, order, columns, chunksize)
+    buffered.flush()
+    buffered.detach()
+    raw.seek(0)
+    return raw
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from metrics import metrics
+
+# Responses retried with backoff (rate limited or transient server errors)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+class CountingRetry(Retry):
+    """urllib3 Retry that counts every failed attempt in metrics ('http.retries')"""
+
+    def increment(self, *args, **kwargs):
+        metrics.incr('http.retries')
+        return super().increment(*args, **kwargs)
+
+class HttpClient:
+    """Shared keep-alive HTTP client with per-host connection pooling and retries
+
+    Each thread gets its own requests.Session (sessions are not thread-safe),
+    but every session mounts the same HTTPAdapter, so TCP/TLS connections are
+    pooled and reused across all threads.
+    """
+
+    def __init__(self, headers=None, pool_connections=100, pool_maxsize=10, retries=3,
+                 backoff_factor=0.5, timeout=(5, 15)):
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        retry = CountingRetry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+        )
+        # pool_connections: hosts kept in the pool, pool_maxsize: connections per host
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+        self._local = threading.local()
+        self._sessions = []
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """requests.Session for the calling thread"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            session.mount('http://', self.adapter)
+            session.mount('https://', self.adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def close(self):
+        """Close every thread's session and the shared connection pool"""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+        self.adapter.close()
+        self._local = threading.local()
+
+class AsyncHttpClient:
+    """asyncio counterpart of HttpClient, built on aiohttp
+
+    One ClientSession, opened on first use inside the running event loop,
+    pools keep-alive connections (at most `limit` in total and
+    `limit_per_host` per host). Connection errors, timeouts and RETRY_STATUSES
+    responses are retried with exponential backoff, honouring Retry-After.
+    aiohttp is only imported when the client is first used.
+    """
+
+    def __init__(self, headers=None, limit=100, limit_per_host=10, retries=3,
+                 backoff_factor=0.5, timeout=(5, 15), sleep=asyncio.sleep):
+        self.headers = dict(headers or {})
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.sleep = sleep
+        self._session = None
+
+    def _get_session(self):
+        if self._session is None:
+            import aiohttp
+
+            connect, read = self.timeout
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host),
+                timeout=aiohttp.ClientTimeout(sock_connect=connect, sock_read=read),
+            )
+        return self._session
+
+    def _backoff(self, attempt, retry_after=None):
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return self.backoff_factor * 2 ** attempt
+
+    async def get_text(self, url):
+        """GET url and return the decoded body, raising on a final error status"""
+        import aiohttp
+
+        session = self._get_session()
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            try:
+                async with session.get(url) as response:
+                    if response.status in RETRY_STATUSES and not last_attempt:
+                        delay = self._backoff(attempt, response.headers.get('Retry-After'))
+                    else:
+                        response.raise_for_status()
+                        return await response.text()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if last_attempt:
+                    raise
+                delay = self._backoff(attempt)
+            metrics.incr('http.retries')
+            await self.sleep(delay)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
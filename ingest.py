@@ -0,0 +1,36 @@
+import pandas as pd
+
+REQUIRED_COLUMNS = ['company_name']
+# Only these columns are used by enrichment; everything else is skipped while parsing
+LEAD_COLUMNS = ['company_name', 'domain']
+CHUNK_SIZE = 2000  # rows parsed and enriched per chunk
+
+class MissingColumnsError(ValueError):
+    """Raised when an uploaded lead file lacks a required column"""
+
+    def __init__(self, missing):
+        self.missing = missing
+        super().__init__(f"CSV must contain: {', '.join(REQUIRED_COLUMNS)}")
+
+def _check_columns(columns):
+    missing = [col for col in REQUIRED_COLUMNS if col not in columns]
+    if missing:
+        raise MissingColumnsError(missing)
+
+def validate_lead_header(source):
+    """Check the CSV header without parsing the body, then rewind the file"""
+    header = pd.read_csv(source, nrows=0)
+    source.seek(0)
+    _check_columns(header.columns)
+
+def iter_lead_chunks(source, chunksize=CHUNK_SIZE):
+    """Yield lead DataFrames from a CSV one chunk at a time
+
+    The required columns are validated on the first chunk, before any rows are
+    handed to enrichment.
+    """
+    reader = pd.read_csv(source, chunksize=chunksize, usecols=lambda col: col in LEAD_COLUMNS)
+    for i, chunk in enumerate(reader):
+        if i == 0:
+            _check_columns(chunk.columns)
+        yield chunk
@@ -0,0 +1,360 @@
+import argparse
+import heapq
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+
+import pandas as pd
+
+from batch import load_checkpoint_frame, run_batch
+from checkpoint import CheckpointLog
+from ingest import iter_lead_chunks
+from lead_sets import read_lead_set
+from lead_store import LeadStore
+from pipeline import MAX_WORKERS, LeadPipeline
+
+# Where job inputs, outputs and the queue database live (override with LEAD_JOBS_DIR)
+JOBS_DIR = os.environ.get('LEAD_JOBS_DIR', 'lead_jobs')
+# Jobs processed at once by an in-process worker (override with LEAD_JOB_WORKERS; 0 = none)
+JOB_WORKERS = int(os.environ.get('LEAD_JOB_WORKERS', 1))
+# Rows enriched between progress updates and checkpoints
+JOB_CHUNK_SIZE = 500
+POLL_INTERVAL = 1.0
+HEARTBEAT_INTERVAL = 10.0
+# A running job without a heartbeat for this long is assumed orphaned and requeued
+STALE_AFTER = 60.0
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED = (DONE, FAILED, CANCELLED)
+
+class JobCancelled(Exception):
+    """Raised inside a running job once it has been cancelled"""
+
+class JobQueue:
+    """Persistent queue of enrichment jobs backed by SQLite
+
+    Each job gets a directory under `root` holding its input CSV, checkpoint
+    log and Arrow output, so jobs and their partial results outlive the
+    Streamlit session (and the server process) that submitted them. Any
+    number of workers, in this process or others, can drain the same queue.
+    """
+
+    def __init__(self, root=JOBS_DIR, clock=time.time):
+        self.root = root
+        self.clock = clock
+        os.makedirs(root, exist_ok=True)
+        self._lock = threading.Lock()
+        # job id -> (checkpoint offset, top rows so far) for partial_top
+        self._partials = {}
+        self._partials_lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(root, 'jobs.sqlite3'), check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                status TEXT NOT NULL,
+                options TEXT NOT NULL,
+                total INTEGER NOT NULL,
+                done INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                stats TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+
+    def path(self, job_id, name):
+        """Path of a job file: 'input.csv', 'output.arrow' or 'checkpoint.jsonl'"""
+        return os.path.join(self.root, job_id, name)
+
+    def submit(self, source, name='leads.csv', options=None):
+        """Queue a lead CSV (path or binary file object) for enrichment and return the job id
+
+        options configure the job's LeadPipeline: max_workers, refresh,
+        weights, dedupe.
+        Raises ingest.MissingColumnsError without queueing anything if the
+        file lacks the required columns.
+        """
+        job_id = uuid.uuid4().hex
+        os.makedirs(os.path.join(self.root, job_id))
+        input_path = self.path(job_id, 'input.csv')
+        try:
+            if isinstance(source, str):
+                shutil.copyfile(source, input_path)
+            else:
+                source.seek(0)
+                with open(input_path, 'wb') as f:
+                    shutil.copyfileobj(source, f)
+            total = sum(len(chunk) for chunk in iter_lead_chunks(input_path))
+        except Exception:
+            shutil.rmtree(os.path.join(self.root, job_id), ignore_errors=True)
+            raise
+
+        now = self.clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, name, status, options, total, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, name, QUEUED, json.dumps(options or {}), total, now, now)
+            )
+        return job_id
+
+    def get(self, job_id):
+        """Job record as a dict, or None for an unknown id"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._record(row)
+
+    @staticmethod
+    def _record(row):
+        if row is None:
+            return None
+        job = dict(row)
+        job['options'] = json.loads(job['options'])
+        job['stats'] = json.loads(job['stats']) if job.get('stats') else None
+        return job
+
+    def counts(self):
+        """Number of jobs per status"""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def claim(self):
+        """Mark the oldest queued (or orphaned running) job as running and return it"""
+        now = self.clock()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT * FROM jobs WHERE status = ? OR (status = ? AND updated_at < ?) "
+                    "ORDER BY created_at LIMIT 1",
+                    (QUEUED, RUNNING, now - STALE_AFTER)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?", (RUNNING, now, row['id'])
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        job = self._record(row)
+        if job is not None:
+            job['status'] = RUNNING
+        return job
+
+    def heartbeat(self, job_id, done=None):
+        """Refresh a running job's heartbeat (and progress); returns its current status"""
+        with self._lock:
+            if done is None:
+                self._conn.execute(
+                    "UPDATE jobs SET updated_at = ? WHERE id = ? AND status = ?", (self.clock(), job_id, RUNNING)
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE jobs SET done = ?, updated_at = ? WHERE id = ? AND status = ?",
+                    (done, self.clock(), job_id, RUNNING)
+                )
+            row = self._conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row[0] if row else None
+
+    def finish(self, job_id, status, error=None, stats=None):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, stats = ?, updated_at = ? WHERE id = ? AND status = ?",
+                (status, error, json.dumps(stats) if stats is not None else None, self.clock(), job_id, RUNNING)
+            )
+
+    def set_done(self, job_id, done):
+        """Record a job's progress whatever its status, e.g. once it has stopped"""
+        with self._lock:
+            self._conn.execute("UPDATE jobs SET done = ? WHERE id = ?", (done, job_id))
+
+    def cancel(self, job_id):
+        """Cancel a queued or running job; a running job stops after its current chunk"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ? AND status IN (?, ?)",
+                (CANCELLED, self.clock(), job_id, QUEUED, RUNNING)
+            )
+
+    def run(self, job):
+        """Process a claimed job to completion in the calling thread"""
+        job_id = job['id']
+        options = job['options']
+
+        def on_progress(done):
+            if self.heartbeat(job_id, done) != RUNNING:
+                raise JobCancelled(job_id)
+
+        stop = threading.Event()
+        def beat():
+            # Keeps the job from looking orphaned while a long chunk is enriched
+            while not stop.wait(HEARTBEAT_INTERVAL):
+                self.heartbeat(job_id)
+        heartbeat = threading.Thread(target=beat, daemon=True)
+        heartbeat.start()
+        pipeline = LeadPipeline(
+            max_workers=options.get('max_workers', MAX_WORKERS), refresh=options.get('refresh', False),
+            weights=options.get('weights'), dedupe=options.get('dedupe', True)
+        )
+        try:
+            run_batch(
+                self.path(job_id, 'input.csv'), self.path(job_id, 'output.arrow'), chunksize=JOB_CHUNK_SIZE,
+                checkpoint_path=self.path(job_id, 'checkpoint.jsonl'), resume=True,
+                log=lambda message: None, progress_callback=on_progress, pipeline=pipeline
+            )
+            self.heartbeat(job_id, job['total'])
+            self.finish(job_id, DONE, stats={
+                'stages': pipeline.stats.as_dict(),
+                'dedupe': pipeline.dedupe_report(),
+            })
+        except JobCancelled:
+            self._record_checkpointed(job_id)
+        except Exception as e:
+            self.finish(job_id, FAILED, str(e))
+            self._record_checkpointed(job_id)
+        finally:
+            stop.set()
+            heartbeat.join()
+
+    def _record_checkpointed(self, job_id):
+        # Chunks finished after a cancel no longer update `done`, so count the log
+        checkpoint = CheckpointLog(self.path(job_id, 'checkpoint.jsonl'))
+        self.set_done(job_id, len(checkpoint.completed_ids()))
+
+    def resume(self, job_id):
+        """Requeue a failed or cancelled job; it skips the rows already in its checkpoint"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = NULL, updated_at = ? WHERE id = ? AND status IN (?, ?)",
+                (QUEUED, self.clock(), job_id, FAILED, CANCELLED)
+            )
+
+    def results(self, job_id):
+        """Scored leads of a job: the final output once done, else the rows enriched so far"""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        if job['status'] == DONE:
+            return read_lead_set(self.path(job_id, 'output.arrow'))[0]
+        checkpoint = CheckpointLog(self.path(job_id, 'checkpoint.jsonl'))
+        df = load_checkpoint_frame(checkpoint)
+        if len(df) == 0:
+            return df
+        return LeadPipeline(weights=job['options'].get('weights')).score(df)
+
+    def partial_top(self, job_id, k=5):
+        """Highest-scoring rows a job has enriched so far, best first
+
+        Only the checkpoint lines appended since the previous call are read
+        and scored, so polling a running job costs the same however many
+        rows it has already done.
+        """
+        job = self.get(job_id)
+        if job is None:
+            return pd.DataFrame()
+        checkpoint = CheckpointLog(self.path(job_id, 'checkpoint.jsonl'))
+        with self._partials_lock:
+            offset, top = self._partials.get(job_id, (0, []))
+            if checkpoint.size() < offset:
+                # The log was cleared and restarted
+                offset, top = 0, []
+            records, offset = checkpoint.read_from(offset)
+            if records:
+                store = LeadStore(len(records))
+                for i, (_, data) in enumerate(records):
+                    store[i] = data
+                scored = LeadPipeline(weights=job['options'].get('weights')).score(store.to_frame())
+                candidates = top + [
+                    (score, -row_id, row)
+                    for score, (row_id, _), row in zip(
+                        scored['acquisition_score'], records, scored.to_dict('records')
+                    )
+                ]
+                top = heapq.nlargest(k, candidates, key=lambda item: item[:2])
+            self._partials[job_id] = (offset, top)
+        return pd.DataFrame([row for _, _, row in top])
+
+    def delete(self, job_id):
+        """Remove a finished job and its files"""
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs WHERE id = ? AND status IN (?, ?, ?)", (job_id,) + FINISHED)
+        shutil.rmtree(os.path.join(self.root, job_id), ignore_errors=True)
+        with self._partials_lock:
+            self._partials.pop(job_id, None)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+class JobWorker:
+    """Background threads that claim and run jobs from a JobQueue"""
+
+    def __init__(self, queue, workers=JOB_WORKERS, poll_interval=POLL_INTERVAL):
+        self.queue = queue
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._threads = []
+
+    def run_once(self):
+        """Run the next available job in the calling thread; False if the queue is empty"""
+        job = self.queue.claim()
+        if job is None:
+            return False
+        self.queue.run(job)
+        return True
+
+    def _loop(self):
+        while not self._stop.is_set():
+            if not self.run_once():
+                self._stop.wait(self.poll_interval)
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._loop, name=f'lead-job-worker-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout=None):
+        """Stop claiming new jobs and wait for the running ones to finish"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a standalone worker for queued enrichment jobs")
+    parser.add_argument('--jobs-dir', default=JOBS_DIR, help="Queue directory shared with the app")
+    parser.add_argument('-w', '--workers', type=int, default=max(JOB_WORKERS, 1), help="Jobs processed at once")
+    args = parser.parse_args(argv)
+
+    queue = JobQueue(args.jobs_dir)
+    worker = JobWorker(queue, args.workers).start()
+    print(f"Processing jobs from {args.jobs_dir} with {args.workers} worker(s); Ctrl-C to stop", file=sys.stderr)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print("Finishing running jobs...", file=sys.stderr)
+        worker.stop()
+        queue.close()
+
+if __name__ == "__main__":
+    main()
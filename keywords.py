@@ -0,0 +1,138 @@
+import json
+import re
+from functools import lru_cache
+
+import pandas as pd
+
+# Keyword tables used to classify company names. Industries are checked in
+# order and the first one with a matching keyword wins.
+DEFAULT_KEYWORD_CONFIG = {
+    'industries': {
+        'SaaS/Tech': ['software', 'tech', 'cloud', 'saas', 'platform', 'api', 'digital', 'data', 'ai', 'ml', 'automation'],
+        'Healthcare': ['health', 'medical', 'pharma', 'biotech', 'wellness', 'care', 'clinical'],
+        'Financial Services': ['finance', 'fintech', 'bank', 'payment', 'trading', 'investment', 'crypto'],
+        'E-commerce': ['retail', 'commerce', 'marketplace', 'shop', 'store', 'ecommerce'],
+        'Manufacturing': ['manufacturing', 'industrial', 'factory', 'production', 'supply'],
+    },
+    'high_revenue': ['enterprise', 'corporate', 'global', 'international', 'systems', 'solutions'],
+    'ai_ml': ['ai', 'ml'],
+    'cloud': ['cloud', 'saas', 'platform'],
+}
+
+DEFAULT_INDUSTRY = 'Other'
+
+def load_keyword_config(path):
+    """Load keyword tables from a JSON file, falling back to the defaults for missing tables"""
+    with open(path, encoding='utf-8') as f:
+        overrides = json.load(f)
+    config = dict(DEFAULT_KEYWORD_CONFIG)
+    config.update(overrides)
+    return config
+
+def _trie_pattern(keywords):
+    """Regex alternation for `keywords` with shared prefixes factored out
+
+    The resulting pattern always prefers the longest keyword at a position.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        terminal = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if terminal:
+            return '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+class KeywordMatcher:
+    """Finds every keyword table hit in a company name with a single regex scan
+
+    All keywords are compiled into one prefix-factored alternation inside a
+    lookahead, so the scan reports a match at every position, including
+    overlapping ones. The longest keyword wins at each position, and each
+    keyword also carries the tags of any keyword that is a prefix of it, so
+    shorter keywords starting at the same position are not lost.
+    """
+
+    def __init__(self, config=None):
+        config = config or DEFAULT_KEYWORD_CONFIG
+        self.industries = list(config['industries'])
+
+        tags_by_keyword = {}
+        def add(keywords, tag):
+            for keyword in keywords:
+                tags_by_keyword.setdefault(keyword.lower(), set()).add(tag)
+
+        for industry, keywords in config['industries'].items():
+            add(keywords, ('industry', industry))
+        add(config['high_revenue'], ('high_revenue', None))
+        add(config['ai_ml'], ('ai_ml', None))
+        add(config['cloud'], ('cloud', None))
+
+        self._tags = {}
+        for keyword in tags_by_keyword:
+            tags = set()
+            for other, other_tags in tags_by_keyword.items():
+                if keyword.startswith(other):
+                    tags |= other_tags
+            self._tags[keyword] = frozenset(tags)
+
+        priority = {industry: rank for rank, industry in enumerate(self.industries)}
+        self._industry_rank = {}
+        for keyword, tags in self._tags.items():
+            ranks = [priority[value] for table, value in tags if table == 'industry']
+            if ranks:
+                self._industry_rank[keyword] = min(ranks)
+
+        self._pattern = re.compile(f'(?=({_trie_pattern(tags_by_keyword)}))')
+        self.match = lru_cache(maxsize=65536)(self._match)
+
+    def _match(self, company_name):
+        """Set of (table, value) tags whose keywords occur in company_name"""
+        tags = set()
+        for keyword in self._pattern.findall(company_name.lower()):
+            tags |= self._tags[keyword]
+        return frozenset(tags)
+
+    def industry(self, company_name):
+        return self._industry_from_tags(self.match(company_name))
+
+    def _industry_from_tags(self, tags):
+        for industry in self.industries:
+            if ('industry', industry) in tags:
+                return industry
+        return DEFAULT_INDUSTRY
+
+    def has_high_revenue_indicator(self, company_name):
+        return ('high_revenue', None) in self.match(company_name)
+
+    def has_ai_ml(self, company_name):
+        return ('ai_ml', None) in self.match(company_name)
+
+    def has_cloud(self, company_name):
+        return ('cloud', None) in self.match(company_name)
+
+    def match_series(self, names):
+        """Column-wise match: Series of tag sets aligned with `names`"""
+        keywords = names.fillna('').astype(str).str.lower().str.findall(self._pattern)
+        return keywords.map(lambda found: frozenset().union(*(self._tags[k] for k in found)))
+
+    def industry_series(self, names):
+        """Column-wise detect_industry over a Series of company names"""
+        found = names.fillna('').astype(str).str.lower().str.findall(self._pattern)
+        found = found.reset_index(drop=True).explode()
+        # Rank each keyword by its highest-priority industry, keep the best per name
+        ranks = found.map(self._industry_rank).dropna()
+        best = ranks.groupby(level=0).min()
+        labels = self.industries + [DEFAULT_INDUSTRY]
+        codes = best.reindex(range(len(names)), fill_value=len(self.industries)).astype(int)
+        return pd.Series([labels[code] for code in codes], index=names.index)
@@ -0,0 +1,193 @@
+import heapq
+from collections import OrderedDict
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+from lead_store import concat_leads
+
+HIGH_PRIORITY_SCORE = 80
+
+def _merge_sorted(positions, scores, new_positions, new_scores):
+    """Merge two descending-score position lists; ties keep existing rows first"""
+    order = np.argsort(-new_scores, kind='stable')
+    new_positions, new_scores = new_positions[order], new_scores[order]
+    at = np.searchsorted(-scores, -new_scores, side='right')
+    return np.insert(positions, at, new_positions), np.insert(scores, at, new_scores)
+
+class LeadIndex:
+    """Query layer and ranking structure over scored leads
+
+    Rows are indexed by descending acquisition_score, overall and partitioned
+    per industry. A query binary-searches the score cut-off in each selected
+    industry's partition, so it never copies or scans the whole frame, and
+    results are memoized per (min_score, industries) filter state. top() pages
+    through the ranking by merging only the head of each partition, and
+    extend() folds newly scored leads in without re-sorting existing ones.
+    """
+
+    # Filter states kept in the memo
+    MAX_CACHED_QUERIES = 16
+
+    def __init__(self, df=None):
+        self._frames = []
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._df = None
+        self._scores = np.empty(0)
+        self._order = np.empty(0, dtype=np.intp)
+        self._sorted_scores = np.empty(0)
+        self._industry_codes = np.empty(0, dtype=np.intp)
+        self.industries = []
+        self._by_industry = {}
+        self._cache = OrderedDict()
+        if df is not None:
+            self.extend(df)
+
+    def __len__(self):
+        return int(self._offsets[-1])
+
+    @property
+    def df(self):
+        """All indexed leads as one DataFrame (concatenated once per update)"""
+        if self._df is None:
+            if len(self._frames) == 1:
+                self._df = self._frames[0]
+            else:
+                self._df = concat_leads(self._frames)
+                self._frames = [self._df]
+                self._offsets = np.array([0, len(self._df)], dtype=np.int64)
+        return self._df
+
+    def extend(self, df):
+        """Add newly scored leads to the index"""
+        start = len(self)
+        scores = df['acquisition_score'].to_numpy(dtype=float)
+        positions = np.arange(start, start + len(df))
+
+        self._frames.append(df)
+        self._offsets = np.append(self._offsets, start + len(df))
+        self._df = None
+        self._cache.clear()
+
+        self._scores = np.concatenate([self._scores, scores])
+        self._order, self._sorted_scores = _merge_sorted(self._order, self._sorted_scores, positions, scores)
+
+        if 'industry' in df.columns:
+            codes, uniques = pd.factorize(df['industry'])
+            global_codes = np.full(len(df), -1, dtype=np.intp)
+            for code, industry in enumerate(uniques):
+                if industry not in self._by_industry:
+                    self.industries.append(industry)
+                    self._by_industry[industry] = (np.empty(0, dtype=np.intp), np.empty(0))
+                mask = codes == code
+                global_codes[mask] = self.industries.index(industry)
+                self._by_industry[industry] = _merge_sorted(
+                    *self._by_industry[industry], positions[mask], scores[mask]
+                )
+            self._industry_codes = np.concatenate([self._industry_codes, global_codes])
+        else:
+            self._industry_codes = np.concatenate([self._industry_codes, np.full(len(df), -1, dtype=np.intp)])
+
+    def _rows(self, positions):
+        """DataFrame rows for global positions, in the given order"""
+        if not self._frames:
+            return pd.DataFrame()
+        if len(self._frames) == 1 or not len(positions):
+            return self._frames[0].iloc[positions]
+        frame_ids = np.searchsorted(self._offsets, positions, side='right') - 1
+        parts = [
+            self._frames[frame_id].iloc[positions[frame_ids == frame_id] - self._offsets[frame_id]]
+            for frame_id in np.unique(frame_ids)
+        ]
+        rows = concat_leads(parts)
+        # Put rows back into the requested order
+        rank = np.argsort(np.argsort(frame_ids, kind='stable'), kind='stable')
+        return rows.iloc[rank]
+
+    def _partitions(self, min_score, industries):
+        """(positions, scores) of each selected partition, cut at min_score"""
+        if not industries or not self._by_industry:
+            sources = [(self._order, self._sorted_scores)]
+        else:
+            sources = [self._by_industry[i] for i in industries if i in self._by_industry]
+        partitions = []
+        for positions, scores in sources:
+            # Scores are sorted descending; count how many are >= min_score
+            count = np.searchsorted(-scores, -min_score, side='right')
+            partitions.append((positions[:count], scores[:count]))
+        return partitions
+
+    def positions(self, min_score=0, industries=None):
+        """Row positions matching the filter, ordered by descending score"""
+        return self._query(min_score, industries)['positions']
+
+    def _query(self, min_score, industries):
+        key = (min_score, frozenset(industries) if industries else None)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        partitions = self._partitions(min_score, industries)
+        if len(partitions) == 1:
+            positions = partitions[0][0]
+        elif partitions:
+            positions = np.concatenate([p for p, _ in partitions])
+            # Restore global score order across the selected industries
+            positions = positions[np.lexsort((positions, -self._scores[positions]))]
+        else:
+            positions = np.empty(0, dtype=np.intp)
+
+        result = {'positions': positions, 'frame': None, 'metrics': None}
+        self._cache[key] = result
+        if len(self._cache) > self.MAX_CACHED_QUERIES:
+            self._cache.popitem(last=False)
+        return result
+
+    def filter(self, min_score=0, industries=None):
+        """Matching rows as a DataFrame sorted by descending score (memoized)"""
+        result = self._query(min_score, industries)
+        if result['frame'] is None:
+            result['frame'] = self._rows(result['positions'])
+        return result['frame']
+
+    def count(self, min_score=0, industries=None):
+        """Number of matching rows, from the partition cut-offs alone"""
+        return sum(len(p) for p, _ in self._partitions(min_score, industries))
+
+    def top(self, k=5, min_score=0, industries=None, offset=0):
+        """Rows offset..offset+k of the ranking for the filter, highest score first
+
+        Only the first offset+k entries of each selected partition are merged,
+        so the cost depends on the page, not the dataset size.
+        """
+        partitions = self._partitions(min_score, industries)
+        if len(partitions) == 1:
+            positions = partitions[0][0][offset:offset + k]
+        else:
+            merged = heapq.merge(
+                *[zip(-scores[:offset + k], p[:offset + k]) for p, scores in partitions]
+            )
+            positions = np.array([p for _, p in islice(merged, offset, offset + k)], dtype=np.intp)
+        return self._rows(positions)
+
+    def metrics(self, min_score=0, industries=None):
+        """Summary metrics for the filtered rows, computed once per filter state"""
+        result = self._query(min_score, industries)
+        if result['metrics'] is None:
+            positions = result['positions']
+            scores = self._scores[positions]
+            top_industry = "N/A"
+            if len(positions):
+                codes = self._industry_codes[positions]
+                counts = np.bincount(codes[codes >= 0], minlength=len(self.industries))
+                if counts.any():
+                    top_industry = self.industries[int(counts.argmax())]
+            result['metrics'] = {
+                'avg_score': float(scores.mean()) if len(scores) else 0,
+                'high_priority': int((scores >= HIGH_PRIORITY_SCORE).sum()),
+                'total_leads': len(positions),
+                'top_industry': top_industry,
+            }
+        return result['metrics']
@@ -0,0 +1,117 @@
+import hashlib
+from bisect import bisect
+from functools import lru_cache
+from itertools import accumulate
+
+import numpy as np
+
+_MASK = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+
+def lead_key(company_name, domain, seed=0):
+    """Stable 64-bit key for a lead, independent of PYTHONHASHSEED and row order"""
+    digest = hashlib.blake2b(f"{seed}\x00{company_name}\x00{domain}".encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+def lead_keys(company_names, domains, seed=0):
+    """lead_key for every (company_name, domain) pair, as a uint64 array"""
+    return np.fromiter(
+        (lead_key(name, domain, seed) for name, domain in zip(company_names, domains)),
+        dtype=np.uint64, count=len(company_names)
+    )
+
+@lru_cache(maxsize=None)
+def _stream_key(stream):
+    return lead_key(stream, '', 'stream')
+
+def _mix(z):
+    # splitmix64 finaliser
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK
+    return z ^ (z >> 31)
+
+def _mix_array(z):
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+class LeadRandom:
+    """Reproducible draws for one lead and one field
+
+    The n-th draw is a hash of (lead key, stream, n), so a field's values
+    depend only on the lead and the seed, never on which other leads were
+    enriched or in what order. Implements the subset of random.Random the
+    mock enrichment uses; LeadRandomArray makes the same draws for many
+    leads at once.
+    """
+
+    __slots__ = ('_base', '_counter')
+
+    def __init__(self, key, stream):
+        self._base = key ^ _stream_key(stream)
+        self._counter = 0
+
+    def random(self):
+        self._counter += 1
+        return (_mix((self._base + self._counter * _GOLDEN) & _MASK) >> 11) * 2.0 ** -53
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
+
+    def choices(self, population, weights=None, k=1):
+        if weights is None:
+            return [self.choice(population) for _ in range(k)]
+        cumulative = list(accumulate(weights))
+        return [population[bisect(cumulative, self.random() * cumulative[-1])] for _ in range(k)]
+
+    def randint(self, a, b):
+        return a + int(self.random() * (b - a + 1))
+
+    def sample(self, population, k):
+        pool = list(population)
+        picked = []
+        for j in range(k):
+            # Swap-remove, so a shorter sample is a prefix of a longer one
+            i = int(self.random() * (len(pool) - j))
+            picked.append(pool[i])
+            pool[i] = pool[len(pool) - j - 1]
+        return picked
+
+class LeadRandomArray:
+    """LeadRandom over an array of lead keys: element i matches LeadRandom(keys[i], stream)"""
+
+    def __init__(self, keys, stream):
+        self._base = np.asarray(keys, dtype=np.uint64) ^ np.uint64(_stream_key(stream))
+        self._counter = 0
+
+    def random(self):
+        self._counter += 1
+        z = _mix_array(self._base + np.uint64((self._counter * _GOLDEN) & _MASK))
+        return (z >> np.uint64(11)).astype(np.float64) * 2.0 ** -53
+
+    def _index(self, n):
+        return (self.random() * n).astype(np.intp)
+
+    def choice(self, seq):
+        return np.asarray(seq, dtype=object)[self._index(len(seq))]
+
+    def choices(self, population, weights):
+        """One weighted pick per lead (like choices(population, weights)[0])"""
+        cumulative = np.array(list(accumulate(weights)))
+        picks = np.searchsorted(cumulative, self.random() * cumulative[-1], side='right')
+        return np.asarray(population, dtype=object)[picks]
+
+    def randint(self, a, b):
+        return a + self._index(b - a + 1)
+
+    def sample(self, population, k):
+        """(leads, k) array; row i matches LeadRandom.sample for lead i"""
+        n = len(population)
+        pool = np.tile(np.arange(n), (len(self._base), 1))
+        rows = np.arange(len(self._base))
+        picked = np.empty((len(self._base), k), dtype=np.intp)
+        for j in range(k):
+            i = self._index(n - j)
+            picked[:, j] = pool[rows, i]
+            pool[rows, i] = pool[:, n - j - 1]
+        return np.asarray(population, dtype=object)[picked]
@@ -0,0 +1,73 @@
+import json
+import os
+import re
+
+from export import write_export
+
+# Where saved scored lead sets live (override with LEAD_SETS_DIR)
+LEAD_SETS_DIR = os.environ.get('LEAD_SETS_DIR', 'lead_sets')
+LEAD_SET_EXTENSION = '.arrow'
+# Schema metadata key holding the weights the set was scored with
+WEIGHTS_KEY = 'lead_weights'
+
+def lead_set_path(name, root=LEAD_SETS_DIR):
+    """File of the saved lead set `name` (reduced to a safe file name)"""
+    safe = re.sub(r'[^A-Za-z0-9._-]+', '_', name).strip('._') or 'leads'
+    return os.path.join(root, safe + LEAD_SET_EXTENSION)
+
+def list_lead_sets(root=LEAD_SETS_DIR):
+    """Names of the saved lead sets, most recently saved first"""
+    if not os.path.isdir(root):
+        return []
+    paths = [
+        os.path.join(root, name) for name in os.listdir(root) if name.endswith(LEAD_SET_EXTENSION)
+    ]
+    paths.sort(key=os.path.getmtime, reverse=True)
+    return [os.path.basename(path)[:-len(LEAD_SET_EXTENSION)] for path in paths]
+
+def save_lead_set(df, name, weights=None, root=LEAD_SETS_DIR):
+    """Save scored leads as an uncompressed Arrow IPC file
+
+    Categorical columns are stored dictionary-encoded and come back as
+    categoricals; the scoring weights are kept in the file's schema metadata.
+    The file is written under a temporary name and then renamed, so a set
+    being opened is never half written. Returns the path.
+    """
+    os.makedirs(root, exist_ok=True)
+    path = lead_set_path(name, root)
+    tmp_path = path + '.tmp'
+    metadata = {WEIGHTS_KEY: json.dumps(weights)} if weights else None
+    try:
+        write_export(df, tmp_path, 'arrow', metadata=metadata)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+def load_lead_set(name, root=LEAD_SETS_DIR):
+    """Open the saved lead set `name`; see read_lead_set"""
+    return read_lead_set(lead_set_path(name, root))
+
+def read_lead_set(path):
+    """Open a lead set file (as written by save_lead_set) by memory-mapping it
+
+    Returns (df, weights). Nothing is parsed: numeric columns are read
+    straight from the mapped file and their pages are only read in as they
+    are used. With pandas 3 string columns stay Arrow-backed and are not
+    copied either; older pandas versions convert them to Python objects,
+    which costs time and memory proportional to the set.
+    """
+    import pyarrow as pa
+
+    with pa.memory_map(path) as mapped:
+        table = pa.ipc.open_file(mapped).read_all()
+    metadata = table.schema.metadata or {}
+    weights = json.loads(metadata[WEIGHTS_KEY.encode()]) if WEIGHTS_KEY.encode() in metadata else None
+    return table.to_pandas(split_blocks=True), weights
+
+def delete_lead_set(name, root=LEAD_SETS_DIR):
+    path = lead_set_path(name, root)
+    if os.path.exists(path):
+        os.remove(path)
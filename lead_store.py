@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+
+# Column order matches the dicts built by scraper.search_company_info
+LEAD_COLUMNS = [
+    'company_name', 'domain', 'email', 'phone', 'linkedin', 'industry',
+    'location', 'company_size', 'revenue_range', 'growth_signals', 'description'
+]
+
+# Low-cardinality columns stored as integer codes and returned as pandas categoricals
+CATEGORICAL_COLUMNS = ['industry', 'revenue_range', 'company_size', 'location']
+
+# Free-text columns whose values repeat across leads; each distinct value is stored once
+INTERNED_COLUMNS = ['growth_signals']
+
+# Numeric columns added by the pipeline rather than by enrichment (NaN when unset)
+NUMERIC_COLUMNS = ['enriched_at']
+
+class LeadStore:
+    """Preallocated columnar storage for enriched leads
+
+    Enrichment results are written straight into typed columns by row index
+    (store[i] = company_data), so no list of per-lead dicts is kept and the
+    DataFrame is built from the columns without an intermediate copy.
+    Categorical columns share one code table per column for the store's
+    lifetime, and repeated strings in the interned columns point at a single
+    object.
+    """
+
+    __slots__ = ('size', '_text', '_codes', '_categories', '_interned', '_numbers')
+
+    def __init__(self, size):
+        self.size = size
+        self._text = {
+            col: np.full(size, '', dtype=object)
+            for col in LEAD_COLUMNS if col not in CATEGORICAL_COLUMNS
+        }
+        self._codes = {col: np.full(size, -1, dtype=np.int32) for col in CATEGORICAL_COLUMNS}
+        self._categories = {col: {} for col in CATEGORICAL_COLUMNS}
+        self._interned = {col: {} for col in INTERNED_COLUMNS}
+        self._numbers = {col: np.full(size, np.nan) for col in NUMERIC_COLUMNS}
+
+    def __len__(self):
+        return self.size
+
+    def __setitem__(self, i, company_data):
+        for col, values in self._text.items():
+            value = company_data.get(col, '')
+            if col in self._interned:
+                value = self._interned[col].setdefault(value, value)
+            values[i] = value
+        for col, codes in self._codes.items():
+            value = company_data.get(col)
+            if value is None or value != value:
+                # Missing or NaN stays as the -1 (missing) code
+                continue
+            categories = self._categories[col]
+            code = categories.get(value)
+            if code is None:
+                code = categories.setdefault(value, len(categories))
+            codes[i] = code
+        for col, values in self._numbers.items():
+            value = company_data.get(col)
+            if value is not None:
+                values[i] = value
+
+    def to_frame(self):
+        """DataFrame view of the stored leads with categorical dtypes"""
+        columns = {}
+        for col in LEAD_COLUMNS:
+            if col in self._codes:
+                columns[col] = pd.Categorical.from_codes(self._codes[col], categories=list(self._categories[col]))
+            else:
+                columns[col] = self._text[col]
+        columns.update(self._numbers)
+        return pd.DataFrame(columns, copy=False)
+
+def concat_leads(frames):
+    """Concatenate lead frames, keeping categorical columns categorical
+
+    pandas falls back to object dtype when categoricals have different
+    categories, so each column is first widened to the union of categories.
+    """
+    frames = [frame for frame in frames if frame is not None]
+    if not frames:
+        return pd.DataFrame()
+    for col in CATEGORICAL_COLUMNS:
+        if not all(col in frame.columns and isinstance(frame[col].dtype, pd.CategoricalDtype) for frame in frames):
+            continue
+        categories = pd.Index([])
+        for frame in frames:
+            categories = categories.append(frame[col].cat.categories.difference(categories))
+        frames = [frame.assign(**{col: frame[col].cat.set_categories(categories)}) for frame in frames]
+    return pd.concat(frames, ignore_index=True)
@@ -1,25 +1,27 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import time
-import random
-import numpy as np
-from scraper import enrich_leads, calculate_acquisition_fit_score
-
-# Enable caching to improve performance
-@st.cache_data
-def load_sample_data():
-    """Cache sample data loading"""
-    return pd.read_csv("sample_leads.csv")
+import io
+import json
+from functools import partial
+from scraper import get_enrichment_cache
+from pipeline import MAX_WORKERS
+from ingest import MissingColumnsError, iter_lead_chunks, validate_lead_header
+from dedup import matching_rows, rows_to_enrich
+from lead_store import concat_leads
+from scoring import DEFAULT_WEIGHTS, FACTOR_COLUMNS, rescore
+from lead_index import LeadIndex
+from export import EXPORT_FORMATS, export_tempfile, score_order
+from lead_sets import list_lead_sets, load_lead_set, save_lead_set
+from jobs import CANCELLED, DONE, FAILED, FINISHED, JOB_WORKERS, QUEUED, RUNNING, JobQueue, JobWorker
+from metrics import metrics
+from static_markup import (
+    APP_STYLE, EXPORT_HEADER, HERO, LANDING_CTA, LANDING_FEATURES, LANDING_INTRO, SCORE_GUIDE,
+    SCORING_FACTORS, SCORING_HEADER
+)
 
-def enrich_lead_data(company_name, domain):
-    """Lead enrichment without caching to avoid display issues"""
-    enriched_data = enrich_leads(company_name, domain)
-    score = calculate_acquisition_fit_score(enriched_data)
-    enriched_data['acquisition_score'] = score
-    return enriched_data
+# Seconds between polls of a running background job
+JOB_POLL_SECONDS = 2
+SAMPLE_PATH = "sample_leads.csv"
 
 # Page configuration
 st.set_page_config(
@@ -30,190 +32,28 @@ st.set_page_config(
 )
 
 # Enhanced professional styling with animations
-st.markdown("""
-<style>
-    @keyframes fadeInUp {
-        from { opacity: 0; transform: translateY(20px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-    
-    @keyframes pulse {
-        0%, 100% { transform: scale(1); }
-        50% { transform: scale(1.05); }
-    }
-    
-    @keyframes countUp {
-        from { opacity: 0; transform: scale(0.8); }
-        to { opacity: 1; transform: scale(1); }
-    }
-    
-    .main {
-        background: linear-gradient(135deg, #0f1419 0%, #1a202c 100%);
-        color: white;
-    }
-    
-    .stApp {
-        background: linear-gradient(135deg, #0a0e1a 0%, #1a1f2e 25%, #2d1b3d 50%, #1a202c 75%, #0f1419 100%);
-    }
-    
-    .hero-container {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 1.5rem;
-        box-shadow: 0 10px 30px rgba(0,0,0,0.3);
-        text-align: center;
-        color: white;
-    }
-    
-    .hero-title {
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin-bottom: 0.5rem;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-    }
-    
-    .hero-subtitle {
-        font-size: 1.2rem;
-        opacity: 0.9;
-        margin-bottom: 1rem;
-    }
-    
-    .hero-badge {
-        background: rgba(255,255,255,0.2);
-        padding: 0.3rem 1rem;
-        border-radius: 20px;
-        font-size: 0.9rem;
-        display: inline-block;
-        margin: 0.2rem;
-        backdrop-filter: blur(10px);
-    }
-    
-    .metrics-container {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-        gap: 1rem;
-        margin-bottom: 1.5rem;
-    }
-    
-    .metric-card {
-        background: linear-gradient(135deg, #2d3748 0%, #4a5568 100%);
-        padding: 1.2rem;
-        border-radius: 12px;
-        text-align: center;
-        color: white;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-        border: 1px solid rgba(255,255,255,0.1);
-        transition: all 0.3s ease;
-        animation: fadeInUp 0.6s ease-out;
-        cursor: pointer;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-5px) scale(1.02);
-        box-shadow: 0 8px 25px rgba(72, 187, 120, 0.3);
-        border-color: rgba(72, 187, 120, 0.5);
-    }
-    
-    .metric-value {
-        font-size: 2rem;
-        font-weight: 700;
-        color: #48bb78;
-        margin-bottom: 0.3rem;
-        animation: countUp 1s ease-out 0.3s both;
-    }
-    
-    .metric-value:hover {
-        animation: pulse 1s infinite;
-    }
-    
-    .metric-label {
-        font-size: 0.9rem;
-        opacity: 0.8;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    .stButton > button {
-        background: linear-gradient(135deg, #48bb78 0%, #38a169 100%);
-        color: white;
-        border: none;
-        border-radius: 8px;
-        padding: 0.5rem 1.5rem;
-        font-weight: 600;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 15px rgba(72, 187, 120, 0.3);
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(72, 187, 120, 0.4);
-    }
-    
-    .css-1d391kg {
-        background: linear-gradient(180deg, #0a0e1a 0%, #1a1f2e 50%, #2d1b3d 100%);
-        border-right: 1px solid rgba(72, 187, 120, 0.2);
-    }
-    
-    .filter-chip {
-        display: inline-block;
-        background: rgba(72, 187, 120, 0.2);
-        color: #48bb78;
-        padding: 0.3rem 0.8rem;
-        border-radius: 15px;
-        font-size: 0.8rem;
-        margin: 0.2rem;
-        border: 1px solid rgba(72, 187, 120, 0.4);
-        animation: fadeInUp 0.4s ease-out;
-    }
-    
-    .lead-card {
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        cursor: pointer;
-        animation: fadeInUp 0.6s ease-out;
-    }
-    
-    .lead-card:hover {
-        transform: translateY(-3px) scale(1.01);
-        box-shadow: 0 10px 30px rgba(0,0,0,0.4);
-    }
-    
-    .score-badge {
-        animation: pulse 2s infinite;
-        transition: all 0.3s ease;
-    }
-    
-    .score-badge:hover {
-        transform: scale(1.1);
-        animation: none;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(APP_STYLE, unsafe_allow_html=True)
 
 def create_hero():
     """Create clean hero section"""
-    st.markdown("""
-    <div class="hero-container">
-        <div class="hero-title">🎯 SaaSquatch AI Lead Prioritizer</div>
-        <div class="hero-subtitle">Transform leads into acquisition-ready targets with AI intelligence</div>
-        <div>
-            <span class="hero-badge">🤖 AI-Powered</span>
-            <span class="hero-badge">📊 Smart Analytics</span>
-            <span class="hero-badge">🚀 ETA Focused</span>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HERO, unsafe_allow_html=True)
 
-def create_metrics(df):
+def create_metrics(df, summary=None):
     if df is None or df.empty:
         return
     
-    # Calculate metrics
-    score_col = 'acquisition_score' if 'acquisition_score' in df.columns else 'acquisition_fit_score'
-    avg_score = df[score_col].mean() if score_col in df.columns else 0
-    high_priority = len(df[df[score_col] >= 80]) if score_col in df.columns else 0
-    total_leads = len(df)
-    top_industry = df['industry'].value_counts().index[0] if 'industry' in df.columns and not df['industry'].value_counts().empty else "N/A"
+    # Calculate metrics (the lead index supplies them precomputed for filtered views)
+    if summary is not None:
+        avg_score = summary['avg_score']
+        high_priority = summary['high_priority']
+        total_leads = summary['total_leads']
+        top_industry = summary['top_industry']
+    else:
+        score_col = 'acquisition_score' if 'acquisition_score' in df.columns else 'acquisition_fit_score'
+        avg_score = df[score_col].mean() if score_col in df.columns else 0
+        high_priority = len(df[df[score_col] >= 80]) if score_col in df.columns else 0
+        total_leads = len(df)
+        top_industry = df['industry'].value_counts().index[0] if 'industry' in df.columns and not df['industry'].value_counts().empty else "N/A"
     
     st.markdown(
         f"""
@@ -239,20 +79,193 @@ def create_metrics(df):
         unsafe_allow_html=True
     )
 
+def get_lead_index():
+    """Lead index for the current scored leads, rebuilt only when the leads change"""
+    lead_index = st.session_state.get('lead_index')
+    if lead_index is None or lead_index.df is not st.session_state.leads_df:
+        lead_index = LeadIndex(st.session_state.leads_df)
+        st.session_state.lead_index = lead_index
+    return lead_index
+
+@st.cache_resource
+def get_job_queue():
+    """Job queue and worker pool shared by every session of this server process"""
+    queue = JobQueue()
+    if JOB_WORKERS:
+        JobWorker(queue, JOB_WORKERS).start()
+    return queue
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def show_job_progress():
+    """Poll the background job for the current upload, showing partial results as they arrive"""
+    queue = get_job_queue()
+    job_id = st.session_state.job_id
+    job = queue.get(job_id)
+    
+    if job is None or job['status'] in FINISHED:
+        if job is not None and job['status'] == DONE:
+            if job['options'].get('merge') and 'leads_df' in st.session_state:
+                merge_leads(queue.results(job_id), job['options'].get('skipped', 0))
+            else:
+                st.session_state.leads_df = queue.results(job_id)
+            st.session_state.scored_weights = job['options'].get('weights') or DEFAULT_WEIGHTS
+            if job['stats']:
+                st.session_state.pipeline_stats = job['stats']['stages']
+                st.session_state.dedupe_report = job['stats']['dedupe']
+        elif job is not None and job['status'] in (FAILED, CANCELLED):
+            # Offered for resuming from its checkpoint
+            st.session_state.stopped_job = job
+        st.session_state.pop('job_id', None)
+        st.query_params.pop('job', None)
+        st.rerun()
+    
+    st.markdown(f"### 🚀 Processing {job['name']}")
+    st.progress(job['done'] / max(job['total'], 1))
+    if job['status'] == QUEUED:
+        st.caption("⏳ Waiting for a free worker...")
+        return
+    
+    st.caption(f"✅ {job['done']} of {job['total']} leads scored so far · safe to close this tab and come back")
+    top_leads = queue.partial_top(job_id, 5)
+    if len(top_leads):
+        st.dataframe(
+            top_leads[['company_name', 'acquisition_score', 'industry', 'revenue_range']],
+            hide_index=True, use_container_width=True
+        )
+    if st.button("⏹️ Cancel"):
+        queue.cancel(job_id)
+        st.rerun()
+
+def merge_leads(enriched, skipped=0):
+    """Upsert a merge job's results into the current leads and their index
+
+    Existing rows of the same companies are replaced. When there are none,
+    the current lead index is extended in place instead of being rebuilt.
+    """
+    existing = st.session_state.leads_df
+    replaced = matching_rows(existing, enriched)
+    lead_index = st.session_state.get('lead_index')
+    if not replaced.any() and lead_index is not None and lead_index.df is existing:
+        lead_index.extend(enriched)
+        st.session_state.leads_df = lead_index.df
+    else:
+        st.session_state.leads_df = concat_leads([existing[~replaced], enriched])
+        st.session_state.pop('lead_index', None)
+    updated = int(replaced.sum())
+    st.session_state.merge_summary = (
+        f"➕ Merged upload: {len(enriched)} leads enriched ({updated} existing rows updated), "
+        f"{skipped} already scored"
+    )
+
+def submit_job(source, name, merge=False, skipped=0):
+    """Queue a lead CSV for enrichment with the sidebar settings and start following it
+
+    With merge=True the results are upserted into the current leads when the
+    job finishes, rather than replacing them.
+    """
+    options = {
+        'max_workers': st.session_state.max_workers,
+        'refresh': st.session_state.refresh_cache,
+        'weights': st.session_state.get('scoring_weights', DEFAULT_WEIGHTS),
+    }
+    if merge:
+        options.update(merge=True, skipped=skipped)
+    job_id = get_job_queue().submit(source, name, options)
+    follow_job(job_id, keep_leads=merge)
+
+def submit_merge(uploaded_file):
+    """Queue only the uploaded rows that are not already scored in the current leads"""
+    upload = pd.concat(iter_lead_chunks(uploaded_file), ignore_index=True)
+    enrich = rows_to_enrich(upload, st.session_state.leads_df, st.session_state.refresh_cache)
+    skipped = int(len(upload) - enrich.sum())
+    if not enrich.any():
+        st.session_state.merge_summary = f"➕ All {skipped} uploaded leads are already scored"
+        st.rerun()
+    source = io.BytesIO(upload[enrich].to_csv(index=False).encode('utf-8'))
+    submit_job(source, uploaded_file.name, merge=True, skipped=skipped)
+
+def follow_job(job_id, keep_leads=False):
+    # Kept in the URL so a reopened tab picks the job back up
+    st.session_state.job_id = job_id
+    st.query_params['job'] = job_id
+    if not keep_leads:
+        st.session_state.pop('leads_df', None)
+    st.session_state.pop('stopped_job', None)
+    st.rerun()
+
+def show_stopped_job():
+    """Report a failed or cancelled job and offer to resume it where it stopped"""
+    job = st.session_state.stopped_job
+    if job['status'] == FAILED:
+        st.error(f"❌ Processing {job['name']} failed: {job['error']}")
+    else:
+        st.warning(f"⏹️ Processing {job['name']} was cancelled")
+    col1, col2 = st.columns([1, 3])
+    if col1.button("🔁 Resume", use_container_width=True):
+        get_job_queue().resume(job['id'])
+        follow_job(job['id'], keep_leads=job['options'].get('merge', False))
+    col2.caption(f"{job['done']} of {job['total']} leads were enriched and checkpointed; resuming only enriches the rest")
+
+def show_lead_sets(has_leads):
+    """Save the current scored leads, or reopen a saved set (memory-mapped)"""
+    if has_leads:
+        name = st.text_input("Name", value='leads', key='lead_set_name')
+        if st.button("💾 Save Current Leads", use_container_width=True):
+            save_lead_set(
+                st.session_state.leads_df, name,
+                weights=st.session_state.get('scored_weights', DEFAULT_WEIGHTS)
+            )
+            st.toast(f"Saved {len(st.session_state.leads_df)} leads as {name}")
+    saved = list_lead_sets()
+    if not saved:
+        st.caption("No saved lead sets yet")
+        return
+    selected = st.selectbox("Saved sets", saved, key='open_lead_set')
+    if st.button("📂 Open", use_container_width=True):
+        leads_df, weights = load_lead_set(selected)
+        st.session_state.leads_df = leads_df
+        st.session_state.scored_weights = weights or DEFAULT_WEIGHTS
+        st.session_state.pop('lead_index', None)
+        st.rerun()
+
+def show_metrics():
+    """Hot-path timers and counters collected by this server process"""
+    snapshot = metrics.snapshot()
+    if not snapshot['timers'] and not snapshot['counters']:
+        st.caption("No metrics recorded yet")
+        return
+    if snapshot['timers']:
+        st.dataframe(
+            pd.DataFrame([
+                {'timer': name, 'calls': entry['count'], 'total (s)': entry['seconds'],
+                 'mean (ms)': 1000 * entry['seconds'] / entry['count'], 'max (ms)': 1000 * entry['max']}
+                for name, entry in snapshot['timers'].items()
+            ]).round(3),
+            hide_index=True, use_container_width=True
+        )
+    if snapshot['counters']:
+        st.caption(" · ".join(f"{name}: {count}" for name, count in snapshot['counters'].items()))
+    col1, col2 = st.columns(2)
+    col1.download_button("⬇️ JSON", json.dumps(snapshot, indent=2), "lead_metrics.json", "application/json",
+                         use_container_width=True)
+    if col2.button("♻️ Reset", use_container_width=True):
+        metrics.reset()
+        st.rerun()
+
 def main():
     """Main application"""
     create_hero()
     
+    if 'job_id' not in st.session_state and 'job' in st.query_params:
+        st.session_state.job_id = st.query_params['job']
+    
     # Sidebar
     with st.sidebar:
         st.markdown("### 🎛️ Control Panel")
         st.markdown("---")
         
         # Sample data option
-        if st.button("📁 Load Sample Data", type="primary", use_container_width=True):
-            sample_data = load_sample_data()
-            st.session_state.leads_df = sample_data
-            st.rerun()
+        load_sample = st.button("📁 Load Sample Data", type="primary", use_container_width=True)
         
         # File upload
         uploaded_file = st.file_uploader(
@@ -261,15 +274,59 @@ def main():
             help="Upload a CSV with columns: company_name, domain (optional)"
         )
         
-        if uploaded_file is not None:
+        st.session_state.max_workers = st.slider(
+            "⚡ Parallel Lookups", 1, 32, st.session_state.get('max_workers', MAX_WORKERS),
+            help="Number of leads enriched concurrently"
+        )
+        st.session_state.refresh_cache = st.checkbox(
+            "🔄 Refresh cached data", value=st.session_state.get('refresh_cache', False),
+            help="Re-enrich every company instead of reusing cached results"
+        )
+        has_leads = 'leads_df' in st.session_state and 'acquisition_score' in st.session_state.leads_df.columns
+        if has_leads:
+            st.session_state.merge_uploads = st.checkbox(
+                "➕ Merge uploads into current leads", value=st.session_state.get('merge_uploads', False),
+                help="Only enrich uploaded companies that aren't scored yet (or whose lookup failed) "
+                     "and add them to the current results"
+            )
+        cache = get_enrichment_cache()
+        if cache is not None:
+            cache_stats = cache.stats()
+            st.caption(f"💾 Cache: {cache_stats['entries']} companies · {cache_stats['hits']} hits / {cache_stats['misses']} misses")
+        if 'pipeline_stats' in st.session_state:
+            st.caption("⏱️ Last run: " + " · ".join(
+                f"{name} {entry['seconds']:.2f}s" for name, entry in st.session_state.pipeline_stats.items()
+            ))
+        dedupe = st.session_state.get('dedupe_report')
+        if dedupe and dedupe['duplicates']:
+            st.caption(f"🔗 Dedupe: {dedupe['rows']} rows → {dedupe['unique']} companies "
+                       f"({dedupe['saved_fraction']:.0%} fewer lookups)")
+        
+        job_counts = get_job_queue().counts()
+        if job_counts.get(QUEUED) or job_counts.get(RUNNING):
+            st.caption(f"🧵 Jobs: {job_counts.get(RUNNING, 0)} running · {job_counts.get(QUEUED, 0)} queued")
+        
+        with st.expander("🗂️ Saved Lead Sets"):
+            show_lead_sets(has_leads)
+        
+        with st.expander("📊 Performance Metrics"):
+            show_metrics()
+        
+        if load_sample:
+            submit_job(SAMPLE_PATH, SAMPLE_PATH)
+        
+        # The uploader keeps returning the same file on every rerun, so only
+        # queue it for processing the first time it is seen
+        if uploaded_file is not None and uploaded_file.file_id != st.session_state.get('uploaded_file_id'):
             try:
-                df = pd.read_csv(uploaded_file)
-                required_cols = ['company_name']
-                if all(col in df.columns for col in required_cols):
-                    st.session_state.leads_df = df
-                    st.rerun()
+                validate_lead_header(uploaded_file)
+                st.session_state.uploaded_file_id = uploaded_file.file_id
+                if has_leads and st.session_state.merge_uploads:
+                    submit_merge(uploaded_file)
                 else:
-                    st.error(f"❌ CSV must contain: {', '.join(required_cols)}")
+                    submit_job(uploaded_file, uploaded_file.name)
+            except MissingColumnsError as e:
+                st.error(f"❌ {e}")
             except Exception as e:
                 st.error(f"❌ Error reading file: {str(e)}")
         
@@ -288,105 +345,66 @@ def main():
             if st.button("🔄 Reset", use_container_width=True):
                 st.session_state.min_score = 30
                 if 'industry' in st.session_state.leads_df.columns:
-                    st.session_state.selected_industries = list(st.session_state.leads_df['industry'].unique())
+                    st.session_state.selected_industries = list(get_lead_index().industries)
             
             min_score = st.slider("🎯 Min Score", 0, 100, st.session_state.get('min_score', 70), 5)
             
             if 'industry' in st.session_state.leads_df.columns:
-                industries = st.session_state.leads_df['industry'].unique()
+                industries = get_lead_index().industries
                 selected_industries = st.multiselect("🏢 Industry", industries, default=st.session_state.get('selected_industries', industries))
             else:
                 selected_industries = []
             
             st.session_state.min_score = min_score
             st.session_state.selected_industries = selected_industries
+            
+            # Weight changes only re-combine the stored factor columns; nothing is re-enriched
+            with st.expander("⚖️ Scoring Weights"):
+                current_weights = st.session_state.get('scoring_weights', DEFAULT_WEIGHTS)
+                st.session_state.scoring_weights = {
+                    factor: st.slider(factor.title(), 0, 50, int(current_weights.get(factor, default)), 5)
+                    for factor, default in DEFAULT_WEIGHTS.items()
+                }
+            
+            leads_df = st.session_state.leads_df
+            if (st.session_state.scoring_weights != st.session_state.get('scored_weights', DEFAULT_WEIGHTS)
+                    and all(column in leads_df.columns for column in FACTOR_COLUMNS.values())):
+                leads_df['acquisition_score'] = rescore(leads_df, st.session_state.scoring_weights)
+                st.session_state.scored_weights = st.session_state.scoring_weights
+                # Scores changed in place, so the score-ordered index is stale
+                st.session_state.pop('lead_index', None)
 
     # Main content area
-    if 'leads_df' not in st.session_state:
-        st.markdown("""
-        <div style="text-align: center; padding: 3rem 2rem; background: rgba(26, 32, 44, 0.9); border-radius: 20px; margin: 2rem 0; border: 2px solid rgba(72, 187, 120, 0.3);">
-            <div style="font-size: 4rem; margin-bottom: 1.5rem;">🎯</div>
-            <h1 style="color: white; font-size: 2.5rem; margin-bottom: 1rem; font-weight: 800;">Acquisition Intelligence Engine</h1>
-            <p style="color: rgba(255,255,255,0.9); font-size: 1.2rem; line-height: 1.6; margin-bottom: 2rem; max-width: 600px; margin-left: auto; margin-right: auto;">
-                Transform raw company lists into <strong style="color: #48bb78;">strategic acquisition targets</strong> using proprietary AI scoring algorithms designed for <strong style="color: #667eea;">ETA investments</strong>
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("""
-            <div style="background: rgba(72, 187, 120, 0.1); padding: 2rem; border-radius: 15px; border: 1px solid rgba(72, 187, 120, 0.3); text-align: center; margin-bottom: 1rem;">
-                <div style="font-size: 2.5rem; margin-bottom: 1rem;">🧠</div>
-                <div style="color: #48bb78; font-weight: 700; margin-bottom: 0.8rem;">Neural Scoring</div>
-                <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem;">6-factor acquisition readiness algorithm</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style="background: rgba(102, 126, 234, 0.1); padding: 2rem; border-radius: 15px; border: 1px solid rgba(102, 126, 234, 0.3); text-align: center; margin-bottom: 1rem;">
-                <div style="font-size: 2.5rem; margin-bottom: 1rem;">⚡</div>
-                <div style="color: #667eea; font-weight: 700; margin-bottom: 0.8rem;">Lightning Enrichment</div>
-                <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem;">Instant contact discovery & validation</div>
-            </div>
-            """, unsafe_allow_html=True)
+    if 'stopped_job' in st.session_state and 'job_id' not in st.session_state:
+        show_stopped_job()
+    if 'merge_summary' in st.session_state:
+        st.success(st.session_state.pop('merge_summary'))
+    
+    if 'job_id' in st.session_state:
+        show_job_progress()
+    elif 'leads_df' not in st.session_state:
+        st.markdown(LANDING_INTRO, unsafe_allow_html=True)
         
-        with col3:
-            st.markdown("""
-            <div style="background: rgba(118, 75, 162, 0.1); padding: 2rem; border-radius: 15px; border: 1px solid rgba(118, 75, 162, 0.3); text-align: center; margin-bottom: 1rem;">
-                <div style="font-size: 2.5rem; margin-bottom: 1rem;">🎯</div>
-                <div style="color: #764ba2; font-weight: 700; margin-bottom: 0.8rem;">ETA Precision</div>
-                <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem;">Built for acquisition targeting</div>
-            </div>
-            """, unsafe_allow_html=True)
+        for col, card in zip(st.columns(3), LANDING_FEATURES):
+            col.markdown(card, unsafe_allow_html=True)
         
-        st.markdown("""
-        <div style="margin-top: 2rem; padding: 1.5rem; background: rgba(72, 187, 120, 0.1); border-radius: 12px; border: 1px solid rgba(72, 187, 120, 0.4); text-align: center;">
-            <div style="color: #48bb78; font-weight: 700; font-size: 1.1rem; margin-bottom: 0.5rem;">🚀 Ready to Transform Your Deal Flow?</div>
-            <div style="color: rgba(255,255,255,0.9);">Upload your company list or explore our sample dataset</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(LANDING_CTA, unsafe_allow_html=True)
         
     else:
-        # Process leads if not already processed
-        if 'acquisition_score' not in st.session_state.leads_df.columns:
-            st.markdown("### 🚀 Processing Leads")
-            
-            progress_bar = st.progress(0)
-            
-            enriched_leads = []
-            total_leads = len(st.session_state.leads_df)
-            
-            for i, row in st.session_state.leads_df.iterrows():
-                progress = (i + 1) / total_leads
-                progress_bar.progress(progress)
-                
-                enriched_data = enrich_lead_data(row['company_name'], row.get('domain', ''))
-                enriched_leads.append(enriched_data)
-            
-            st.session_state.leads_df = pd.DataFrame(enriched_leads)
-            
-            progress_bar.progress(1.0)
-            st.success("✅ Processing complete!")
-            time.sleep(1)
-            st.rerun()
-        
-        # Apply filters
-        filtered_df = st.session_state.leads_df.copy()
+        # Apply filters through the lead index (no full-frame copy, memoized per filter state)
+        filtered_df = st.session_state.leads_df
+        filter_metrics = None
         
         if 'acquisition_score' in filtered_df.columns:
             min_score = st.session_state.get('min_score', 70)
             selected_industries = st.session_state.get('selected_industries', [])
             
-            filtered_df = filtered_df[filtered_df['acquisition_score'] >= min_score]
-            
-            if selected_industries and 'industry' in filtered_df.columns:
-                filtered_df = filtered_df[filtered_df['industry'].isin(selected_industries)]
+            lead_index = get_lead_index()
+            filtered_df = lead_index.filter(min_score, selected_industries)
+            filter_metrics = lead_index.metrics(min_score, selected_industries)
         
         # Show metrics
-        create_metrics(filtered_df)
+        create_metrics(filtered_df, filter_metrics)
         
         # Top leads display
         if 'acquisition_score' in st.session_state.leads_df.columns:
@@ -395,9 +413,20 @@ def main():
             if len(filtered_df) == 0:
                 st.warning(f"⚠️ No leads match your criteria (Score ≥ {st.session_state.get('min_score', 70)}). Try lowering the minimum score.")
             else:
-                top_leads = filtered_df.nlargest(5, 'acquisition_score')
+                # Paged straight from the score-ordered index; no sort of the filtered rows
+                page_col, size_col = st.columns([3, 1])
+                with size_col:
+                    page_size = st.selectbox("Leads per page", [5, 10, 25, 50], key='top_page_size')
+                page_count = -(-len(filtered_df) // page_size)
+                # A narrower filter can leave the remembered page past the end
+                if st.session_state.get('top_page', 1) > page_count:
+                    st.session_state.top_page = page_count
+                with page_col:
+                    page = st.number_input("Page", min_value=1, max_value=page_count, value=1, key='top_page') if page_count > 1 else 1
+                offset = (page - 1) * page_size
+                top_leads = lead_index.top(page_size, min_score, selected_industries, offset=offset)
                 
-                for i, (_, lead) in enumerate(top_leads.iterrows(), 1):
+                for i, (_, lead) in enumerate(top_leads.iterrows(), offset + 1):
                     score = lead.get('acquisition_score', 0)
                     score_emoji = "🔥" if score >= 80 else "⚡" if score >= 60 else "📊"
                     score_color = "#48bb78" if score >= 80 else "#ed8936" if score >= 60 else "#e53e3e"
@@ -437,18 +466,10 @@ def main():
                                 st.markdown(f"**Size:** {lead.get('company_size', 'N/A')}")
         
         # Enhanced Export section
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, rgba(26, 32, 44, 0.9) 0%, rgba(45, 55, 72, 0.8) 100%); padding: 2rem; border-radius: 15px; border: 2px solid rgba(72, 187, 120, 0.3); margin: 2rem 0; position: relative; overflow: hidden;">
-            <div style="position: absolute; top: 0; right: 0; width: 100px; height: 100px; background: radial-gradient(circle, rgba(72, 187, 120, 0.1) 0%, transparent 70%); border-radius: 50%;"></div>
-            <h3 style="color: #48bb78; margin-bottom: 1rem; font-size: 1.5rem;">📤 Export Intelligence Report</h3>
-            <p style="color: rgba(255,255,255,0.9); margin-bottom: 1.5rem; font-size: 1.1rem;">Download your AI-prioritized leads with comprehensive scoring and enriched data</p>
-            <div style="display: flex; gap: 1rem; align-items: center; margin-bottom: 1rem;">
-                <span style="background: rgba(72, 187, 120, 0.2); color: #48bb78; padding: 0.3rem 0.8rem; border-radius: 15px; font-size: 0.9rem;">📊 CSV Format</span>
-                <span style="background: rgba(102, 126, 234, 0.2); color: #667eea; padding: 0.3rem 0.8rem; border-radius: 15px; font-size: 0.9rem;">🔄 Real-time Data</span>
-                <span style="background: rgba(237, 137, 54, 0.2); color: #ed8936; padding: 0.3rem 0.8rem; border-radius: 15px; font-size: 0.9rem;">🎯 CRM Ready</span>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(EXPORT_HEADER, unsafe_allow_html=True)
+        
+        export_labels = {'csv': "CSV", 'csv.gz': "CSV (gzip)", 'parquet': "Parquet", 'arrow': "Arrow"}
+        export_fmt = st.selectbox("Export format", list(EXPORT_FORMATS), format_func=export_labels.get, key='export_format')
         
         if st.button("💾 Download Prioritized Leads", type="primary", use_container_width=True):
             display_columns = [
@@ -456,21 +477,25 @@ def main():
                 'email', 'phone', 'linkedin', 'domain', 'location', 'company_size'
             ]
             
-            available_columns = [col for col in display_columns if col in filtered_df.columns]
-            display_df = filtered_df[available_columns] if len(filtered_df) > 0 else st.session_state.leads_df[available_columns]
-            
-            if 'acquisition_score' in display_df.columns:
-                display_df = display_df.sort_values('acquisition_score', ascending=False)
+            # filtered_df comes out of the lead index already in score order; the
+            # unfiltered fallback is written through a score-ordered position array
+            if len(filtered_df) > 0:
+                display_df, order = filtered_df, None
+            else:
+                display_df = st.session_state.leads_df
+                order = score_order(display_df)
             
-            csv = display_df.to_csv(index=False)
+            # Only generated when the button is clicked, chunk by chunk into a temp file
+            export_file = partial(export_tempfile, display_df, export_fmt, order=order, columns=display_columns)
+            extension, mime = EXPORT_FORMATS[export_fmt]
             timestamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"ai_prioritized_leads_{timestamp}.csv"
+            filename = f"ai_prioritized_leads_{timestamp}{extension}"
             
             st.download_button(
                 label=f"📥 Download {len(display_df)} Prioritized Leads",
-                data=csv,
+                data=export_file,
                 file_name=filename,
-                mime="text/csv",
+                mime=mime,
                 use_container_width=True
             )
             
@@ -487,90 +512,15 @@ def main():
         
         # How It Works section at the end
         st.markdown("---")
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, rgba(72, 187, 120, 0.15) 0%, rgba(102, 126, 234, 0.15) 100%); padding: 2rem; border-radius: 15px; border: 2px solid rgba(72, 187, 120, 0.3); margin: 2rem 0;">
-            <div style="text-align: center; margin-bottom: 2rem;">
-                <h2 style="color: #48bb78; font-size: 2rem; margin-bottom: 0.5rem;">🧠 AI Scoring Algorithm</h2>
-                <p style="color: rgba(255,255,255,0.9); font-size: 1.1rem;">Our proprietary 6-factor acquisition readiness engine</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("""
-            <div style="background: rgba(72, 187, 120, 0.2); padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(72, 187, 120, 0.4); margin-bottom: 1rem;">
-                <div style="font-size: 2rem; margin-bottom: 0.5rem;">💰</div>
-                <div style="color: #48bb78; font-weight: 700; font-size: 1.2rem; margin-bottom: 0.5rem;">Revenue (30%)</div>
-                <div style="color: rgba(255,255,255,0.9); line-height: 1.5;">Financial health assessment</div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown("""
-            <div style="background: rgba(102, 126, 234, 0.2); padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(102, 126, 234, 0.4);">
-                <div style="font-size: 2rem; margin-bottom: 0.5rem;">🏢</div>
-                <div style="color: #667eea; font-weight: 700; font-size: 1.2rem; margin-bottom: 0.5rem;">Industry (20%)</div>
-                <div style="color: rgba(255,255,255,0.9); line-height: 1.5;">Market compatibility</div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(SCORING_HEADER, unsafe_allow_html=True)
         
-        with col2:
-            st.markdown("""
-            <div style="background: rgba(118, 75, 162, 0.2); padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(118, 75, 162, 0.4); margin-bottom: 1rem;">
-                <div style="font-size: 2rem; margin-bottom: 0.5rem;">📈</div>
-                <div style="color: #764ba2; font-weight: 700; font-size: 1.2rem; margin-bottom: 0.5rem;">Growth (20%)</div>
-                <div style="color: rgba(255,255,255,0.9); line-height: 1.5;">Expansion signals</div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown("""
-            <div style="background: rgba(237, 137, 54, 0.2); padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(237, 137, 54, 0.4);">
-                <div style="font-size: 2rem; margin-bottom: 0.5rem;">📧</div>
-                <div style="color: #ed8936; font-weight: 700; font-size: 1.2rem; margin-bottom: 0.5rem;">Contact (10%)</div>
-                <div style="color: rgba(255,255,255,0.9); line-height: 1.5;">Verified information</div>
-            </div>
-            """, unsafe_allow_html=True)
+        for col, cards in zip(st.columns(3), SCORING_FACTORS):
+            for card in cards:
+                col.markdown(card, unsafe_allow_html=True)
         
-        with col3:
-            st.markdown("""
-            <div style="background: rgba(56, 178, 172, 0.2); padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(56, 178, 172, 0.4); margin-bottom: 1rem;">
-                <div style="font-size: 2rem; margin-bottom: 0.5rem;">👥</div>
-                <div style="color: #38b2ac; font-weight: 700; font-size: 1.2rem; margin-bottom: 0.5rem;">Size (10%)</div>
-                <div style="color: rgba(255,255,255,0.9); line-height: 1.5;">Company scale</div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown("""
-            <div style="background: rgba(245, 101, 101, 0.2); padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(245, 101, 101, 0.4);">
-                <div style="font-size: 2rem; margin-bottom: 0.5rem;">📍</div>
-                <div style="color: #f56565; font-weight: 700; font-size: 1.2rem; margin-bottom: 0.5rem;">Location (10%)</div>
-                <div style="color: rgba(255,255,255,0.9); line-height: 1.5;">Geographic advantage</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div style="background: rgba(26, 32, 44, 0.8); padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(72, 187, 120, 0.3); margin: 2rem 0; text-align: center;">
-            <h3 style="color: #48bb78; margin-bottom: 1rem;">Score Guide</h3>
-            <div style="display: flex; justify-content: space-around; flex-wrap: wrap; gap: 1rem;">
-                <div style="padding: 1rem; background: rgba(72, 187, 120, 0.1); border-radius: 8px; min-width: 150px;">
-                    <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">🔥</div>
-                    <div style="color: #48bb78; font-weight: 700;">80-100</div>
-                    <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem;">High Priority</div>
-                </div>
-                <div style="padding: 1rem; background: rgba(237, 137, 54, 0.1); border-radius: 8px; min-width: 150px;">
-                    <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">⚡</div>
-                    <div style="color: #ed8936; font-weight: 700;">60-79</div>
-                    <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem;">Medium Priority</div>
-                </div>
-                <div style="padding: 1rem; background: rgba(229, 62, 62, 0.1); border-radius: 8px; min-width: 150px;">
-                    <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">📊</div>
-                    <div style="color: #e53e3e; font-weight: 700;">Below 60</div>
-                    <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem;">Needs Review</div>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(SCORE_GUIDE, unsafe_allow_html=True)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Includes Streamlit's own rerun work, so the sidebar shows the cost of a page interaction
+    with metrics.timer('ui.rerun'):
+        main()
\ No newline at end of file
@@ -0,0 +1,121 @@
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Record hot-path timers and counters (set LEAD_METRICS=0 to turn them off)
+METRICS_ENABLED = os.environ.get('LEAD_METRICS', '1') != '0'
+
+class Metrics:
+    """Thread-safe named timers and counters
+
+    Timers accumulate call count, total and slowest wall-clock time; counters
+    are plain integers. One process-wide instance (`metrics`) is shared by the
+    enrichment code, the batch runner and the app.
+    """
+
+    def __init__(self, enabled=METRICS_ENABLED, clock=time.perf_counter):
+        self.enabled = enabled
+        self.clock = clock
+        self._timers = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def timer(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.add_time(name, self.clock() - start)
+
+    def add_time(self, name, seconds):
+        if not self.enabled:
+            return
+        with self._lock:
+            entry = self._timers.get(name)
+            if entry is None:
+                entry = self._timers[name] = {'count': 0, 'seconds': 0.0, 'max': 0.0}
+            entry['count'] += 1
+            entry['seconds'] += seconds
+            if seconds > entry['max']:
+                entry['max'] = seconds
+
+    def incr(self, name, n=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def snapshot(self):
+        """{'timers': {name: {count, seconds, max}}, 'counters': {name: n}}"""
+        with self._lock:
+            return {
+                'timers': {name: dict(entry) for name, entry in sorted(self._timers.items())},
+                'counters': dict(sorted(self._counters.items())),
+            }
+
+    def reset(self):
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+
+    def dump(self, path, **extra):
+        """Write the snapshot (plus any extra sections) as JSON"""
+        report = self.snapshot()
+        report.update(extra)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+metrics = Metrics()
+
+@contextmanager
+def profiled(path):
+    """cProfile the block, including threads it starts, and write pstats to path
+
+    Before Python 3.12 cProfile only sees the thread that enables it, so
+    every thread started inside the block (e.g. the enrichment workers) gets
+    its own profiler; all of them are merged into one file, readable with
+    `python -m pstats` or snakeviz. From 3.12 cProfile is built on
+    sys.monitoring, which sees every thread but allows only one active
+    profiler, so the main one is used alone.
+    """
+    profiles = []
+    lock = threading.Lock()
+    per_thread = sys.version_info < (3, 12)
+
+    def start_thread_profile(frame, event, arg):
+        profile = cProfile.Profile()
+        try:
+            # Replaces this hook for the rest of the thread
+            profile.enable()
+        except Exception:
+            # Never let profiling take a worker thread down
+            sys.setprofile(None)
+            return
+        with lock:
+            profiles.append(profile)
+
+    main_profile = cProfile.Profile()
+    if per_thread:
+        threading.setprofile(start_thread_profile)
+    main_profile.enable()
+    try:
+        yield
+    finally:
+        main_profile.disable()
+        if per_thread:
+            threading.setprofile(None)
+        stats = pstats.Stats(main_profile)
+        with lock:
+            for profile in profiles:
+                profile.disable()
+                stats.add(profile)
+        stats.dump_stats(path)
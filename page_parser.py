@@ -0,0 +1,83 @@
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin
+
+EMAIL_RE = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}')
+MAX_CONTACTS = 3  # emails / phone numbers kept per page
+
+def _unique(values):
+    return list(dict.fromkeys(value for value in values if value))[:MAX_CONTACTS]
+
+def parse_company_page(html, url=''):
+    """Extract the few facts enrichment needs from a company homepage
+
+    Returns a small dict (title, description, emails, phones, linkedin) rather
+    than the parsed tree, so it is cheap to send back from a parser process.
+    """
+    # Imported here so importing the enrichment code doesn't load bs4
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+
+    title = soup.title.get_text(strip=True) if soup.title else ''
+    meta = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
+    description = meta.get('content', '').strip() if meta else ''
+
+    emails, phones, linkedin = [], [], ''
+    for link in soup.find_all('a', href=True):
+        href = link['href'].strip()
+        lower = href.lower()
+        if lower.startswith('mailto:'):
+            emails.append(href[len('mailto:'):].split('?')[0])
+        elif lower.startswith('tel:'):
+            phones.append(href[len('tel:'):])
+        elif not linkedin and 'linkedin.com/company/' in lower:
+            linkedin = urljoin(url, href)
+    if not emails:
+        # Plain-text addresses when there are no mailto: links
+        emails = EMAIL_RE.findall(soup.get_text(' '))
+
+    return {
+        'title': title,
+        'description': description,
+        'emails': _unique(emails),
+        'phones': _unique(phones),
+        'linkedin': linkedin,
+    }
+
+class ParserPool:
+    """Process pool that parses fetched HTML off the fetching threads
+
+    Fetching stays in the enrichment threads (I/O bound); each thread hands
+    the raw HTML to a parser process and blocks on the compact result, so
+    parsing runs on all cores instead of contending for the GIL. Workers are
+    spawned rather than forked, since the parent is multi-threaded.
+    """
+
+    def __init__(self, processes=None):
+        self.processes = processes or multiprocessing.cpu_count()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes, mp_context=multiprocessing.get_context('spawn')
+        )
+
+    def submit(self, html, url=''):
+        """Future for parse_company_page(html, url)"""
+        return self._executor.submit(parse_company_page, html, url)
+
+    def parse(self, html, url=''):
+        return self.submit(html, url).result()
+
+    def map(self, pages, chunksize=16):
+        """parse_company_page over (html, url) pairs, in order"""
+        htmls, urls = zip(*pages) if pages else ((), ())
+        return self._executor.map(parse_company_page, htmls, urls, chunksize=chunksize)
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,272 @@
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+import scraper
+from scraper import (
+    enrich_leads, enrich_company, enrich_companies, empty_company_data, extract_domain_from_company,
+    generate_company_description, generate_contact_email, generate_linkedin_url, lead_rng
+)
+from scoring import score_leads
+from lead_store import LeadStore
+from dedup import dedupe_leads, dedupe_report
+from metrics import metrics
+
+# Number of leads enriched in parallel (override with LEAD_ENRICHMENT_WORKERS)
+MAX_WORKERS = int(os.environ.get('LEAD_ENRICHMENT_WORKERS', 8))
+# Leads queued per worker at any time
+IN_FLIGHT_PER_WORKER = 4
+# Leads generated per search_company_batch call on the seeded batch path
+BATCH_ENRICH_SIZE = 1000
+
+def leads_from_frame(df):
+    """Yield (company_name, domain) pairs from an uploaded leads DataFrame"""
+    has_domain = 'domain' in df.columns
+    for row in df.itertuples(index=False):
+        domain = getattr(row, 'domain', '') if has_domain else ''
+        # Empty CSV cells come through as NaN
+        if pd.isna(domain):
+            domain = ''
+        yield row.company_name, domain
+
+def enrich_batch(leads, max_workers=MAX_WORKERS, progress_callback=None, enrich_fn=enrich_leads, results=None):
+    """Enrich (company_name, domain) pairs concurrently, preserving input order
+
+    Results are written to results[i] for the i-th lead; pass a preallocated
+    container such as a LeadStore to avoid building a list of dicts.
+    progress_callback(done, total) is invoked from the calling thread, so it is
+    safe to update Streamlit elements from it.
+    """
+    leads = list(leads)
+    total = len(leads)
+    if results is None:
+        results = [None] * total
+    if total == 0:
+        return results
+
+    workers = max(1, min(int(max_workers), total))
+    lead_iter = iter(enumerate(leads))
+    pending = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        def submit_next():
+            item = next(lead_iter, None)
+            if item is not None:
+                i, (company_name, domain) = item
+                pending[executor.submit(enrich_fn, company_name, domain)] = i
+
+        # Keep a bounded window of leads in flight so finished futures (and
+        # their results) don't pile up for large batches
+        for _ in range(workers * IN_FLIGHT_PER_WORKER):
+            submit_next()
+
+        done_count = 0
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[pending.pop(future)] = future.result()
+                done_count += 1
+                if progress_callback:
+                    progress_callback(done_count, total)
+                submit_next()
+
+    return results
+
+class PipelineStats:
+    """Per-stage run counts, item counts and wall-clock time"""
+
+    def __init__(self):
+        self.stages = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name, items=0):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                entry = self.stages.setdefault(name, {'runs': 0, 'items': 0, 'seconds': 0.0})
+                entry['runs'] += 1
+                entry['items'] += items
+                entry['seconds'] += elapsed
+
+    def as_dict(self):
+        with self._lock:
+            return {name: dict(entry) for name, entry in self.stages.items()}
+
+def _safe_enrich(enrich_fn, company_name, domain):
+    # Failed lookups get no enriched_at, which is how score() recognises them
+    try:
+        return dict(enrich_fn(company_name, domain), enriched_at=time.time())
+    except Exception:
+        metrics.incr('enrich.failures')
+        return empty_company_data(company_name, domain)
+
+def _rename_fanned_rows(df, unique, inverse):
+    """Regenerate name-derived fields of fanned-out rows spelled differently from their entity's first row
+
+    The LinkedIn URL and description are regenerated for the row's own name.
+    When none of the entity's rows supplied a domain, the row also gets the
+    domain derived from its own name and a contact email on it, as if it had
+    been enriched on its own. Values taken from a fetched page are kept.
+    """
+    names = df['company_name'].to_numpy(dtype=object)
+    first_names = np.array([company_name for company_name, _ in unique], dtype=object)[inverse]
+    entity_domains = np.array([domain for _, domain in unique], dtype=object)[inverse]
+    rows = np.flatnonzero(names != first_names)
+    if not len(rows):
+        return
+    linkedin = df['linkedin'].to_numpy(dtype=object, copy=True)
+    description = df['description'].to_numpy(dtype=object, copy=True)
+    domain = df['domain'].to_numpy(dtype=object, copy=True)
+    email = df['email'].to_numpy(dtype=object, copy=True)
+    industry = df['industry'].astype(object).to_numpy()
+    for i in rows:
+        first_name = first_names[i]
+        if linkedin[i] == generate_linkedin_url(first_name):
+            linkedin[i] = generate_linkedin_url(names[i])
+        if industry[i] == industry[i] and description[i] == generate_company_description(first_name, industry[i]):
+            description[i] = generate_company_description(names[i], industry[i])
+        if not entity_domains[i]:
+            own_domain = extract_domain_from_company(names[i])
+            if not email[i] or email[i].endswith('@' + domain[i]):
+                email[i] = generate_contact_email(names[i], own_domain, lead_rng(names[i], own_domain)('email'))
+            domain[i] = own_domain
+    df['linkedin'] = linkedin
+    df['description'] = description
+    df['domain'] = domain
+    df['email'] = email
+
+class LeadPipeline:
+    """Enrich-then-score pipeline where each stage runs exactly once per batch
+
+    enrich_fn(company_name, domain) returns an unscored data dict and
+    score_fn(df) returns a DataFrame of score columns (at least
+    acquisition_score) for the enriched frame; either can be swapped out.
+    Stage timings accumulate in `stats`, so a stage that runs more than once
+    per batch shows up as extra runs. With the default enrich_fn, an
+    enrichment seed set and page fetching off, leads are enriched in
+    vectorized batches (scraper.enrich_companies) instead of one at a time;
+    the results are the same.
+    """
+
+    def __init__(self, enrich_fn=enrich_company, score_fn=score_leads,
+                 max_workers=MAX_WORKERS, refresh=False, weights=None, dedupe=True):
+        self.batch_enrich = enrich_fn is enrich_company
+        self.refresh = refresh
+        if refresh and enrich_fn is enrich_company:
+            enrich_fn = partial(enrich_company, refresh=True)
+        if weights and score_fn is score_leads:
+            score_fn = partial(score_leads, weights=weights)
+        self.enrich_fn = enrich_fn
+        self.score_fn = score_fn
+        self.max_workers = max_workers
+        self.dedupe = dedupe
+        self.stats = PipelineStats()
+        self.rows_seen = 0
+        self.rows_enriched = 0
+
+    def enrich(self, leads, progress_callback=None):
+        """Enrichment stage: list of (company_name, domain) -> DataFrame
+
+        With dedupe on, rows naming the same company (by normalized domain or
+        canonical name) are enriched once and the result is copied to each of
+        them. A company is looked up under a domain one of its rows supplied
+        (normalized), so every row of it gets that domain. Each row keeps its
+        own company_name, and a generated LinkedIn URL or description is
+        regenerated for that name; when no row supplied a domain, so does the
+        domain derived from the name and the email on it. Values taken from a
+        fetched page are shared as they are, as is every other field.
+
+        Every successfully enriched row gets an enriched_at timestamp
+        (seconds since the epoch) of its lookup; a result served from the
+        enrichment cache is at most scraper.CACHE_TTL older than that. Rows
+        whose lookup failed are left without one.
+        """
+        leads = list(leads)
+        inverse = None
+        if self.dedupe:
+            with self.stats.stage('dedupe', len(leads)):
+                unique, inverse = dedupe_leads(leads)
+            if len(unique) == len(leads):
+                inverse = None
+            leads_to_enrich = unique
+        else:
+            leads_to_enrich = leads
+        self.rows_seen += len(leads)
+        self.rows_enriched += len(leads_to_enrich)
+
+        with self.stats.stage('enrich', len(leads_to_enrich)):
+            if self.batch_enrich and scraper.ENRICHMENT_SEED is not None and not scraper.FETCH_PAGES:
+                store = self._enrich_vectorized(leads_to_enrich, progress_callback)
+            else:
+                store = enrich_batch(
+                    leads_to_enrich,
+                    max_workers=self.max_workers,
+                    progress_callback=progress_callback,
+                    enrich_fn=partial(_safe_enrich, self.enrich_fn),
+                    results=LeadStore(len(leads_to_enrich))
+                )
+            df = store.to_frame()
+
+        if inverse is not None:
+            # Fan the unique results back out to every original row
+            df = df.iloc[inverse].reset_index(drop=True)
+            df['company_name'] = [company_name for company_name, _ in leads]
+            _rename_fanned_rows(df, unique, inverse)
+        return df
+
+    def _enrich_vectorized(self, leads, progress_callback=None):
+        store = LeadStore(len(leads))
+        for start in range(0, len(leads), BATCH_ENRICH_SIZE):
+            batch = leads[start:start + BATCH_ENRICH_SIZE]
+            enriched_at = time.time()
+            for i, company_data in enumerate(enrich_companies(batch, refresh=self.refresh), start):
+                company_data['enriched_at'] = enriched_at
+                store[i] = company_data
+            if progress_callback:
+                progress_callback(start + len(batch), len(leads))
+        return store
+
+    def dedupe_report(self):
+        """Rows seen vs. rows actually enriched across this pipeline's runs"""
+        return dedupe_report(self.rows_seen, self.rows_enriched)
+
+    def score(self, df):
+        """Scoring stage: adds the factor and acquisition_score columns in place
+
+        Rows whose lookup failed (enriched rows without an enriched_at) score
+        0 on every column, so they rank below every real lead.
+        """
+        with self.stats.stage('score', len(df)):
+            scores = self.score_fn(df)
+            if 'enriched_at' in df.columns:
+                failed = df['enriched_at'].isna().to_numpy()
+                if failed.any():
+                    scores.loc[failed] = 0
+            for column in scores.columns:
+                df[column] = scores[column]
+            return df
+
+    def run(self, leads, progress_callback=None):
+        return self.score(self.enrich(leads, progress_callback))
+
+    def run_chunks(self, chunks, progress_callback=None):
+        """Enrich and score lead DataFrames as they arrive, yielding each scored chunk
+
+        progress_callback(done, total) reports progress within the current chunk.
+        """
+        offset = 0
+        for chunk in chunks:
+            scored = self.run(leads_from_frame(chunk), progress_callback)
+            # Keep row labels continuous across chunks
+            scored.index = pd.RangeIndex(offset, offset + len(scored))
+            offset += len(scored)
+            yield scored
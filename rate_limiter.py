@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import time
+
+# Tolerance for floating point drift when comparing token counts
+_EPSILON = 1e-9
+
+class TokenBucket:
+    """Token bucket refilled continuously at `rate` tokens per second"""
+
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.clock = clock
+        self.updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def wait_time(self, tokens=1):
+        """Seconds until `tokens` are available (0 if available now)"""
+        self._refill()
+        if self.tokens + _EPSILON >= tokens:
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+
+    def consume(self, tokens=1):
+        self.tokens -= tokens
+
+    def is_full(self):
+        self._refill()
+        return self.tokens + _EPSILON >= self.capacity
+
+class DomainRateLimiter:
+    """Per-domain token buckets with an optional global ceiling
+
+    Requests to different domains only contend on the global bucket (if one is
+    configured), so unrelated hosts proceed in parallel while each host still
+    sees at most `rate` requests per second after an initial `burst`.
+    The clock and sleep functions are injectable so the limiter can be driven
+    by a fake clock in tests.
+    """
+
+    # Idle buckets are dropped once this many domains are tracked
+    MAX_TRACKED_DOMAINS = 10000
+
+    def __init__(self, rate, burst=1, global_rate=None, global_burst=None,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._global = None
+        if global_rate:
+            self._global = TokenBucket(global_rate, global_burst or max(1, global_rate), clock)
+
+    def _bucket(self, domain):
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            if len(self._buckets) >= self.MAX_TRACKED_DOMAINS:
+                self._prune()
+            bucket = TokenBucket(self.rate, self.burst, self.clock)
+            self._buckets[domain] = bucket
+        return bucket
+
+    def _prune(self):
+        # A full bucket behaves exactly like a fresh one, so dropping it is lossless
+        for domain in [d for d, b in self._buckets.items() if b.is_full()]:
+            del self._buckets[domain]
+
+    def try_acquire(self, domain=None):
+        """Take a token for `domain` if possible; return seconds to wait otherwise"""
+        with self._lock:
+            waits = []
+            bucket = self._bucket(domain or '') if self.rate else None
+            if bucket is not None:
+                waits.append(bucket.wait_time())
+            if self._global is not None:
+                waits.append(self._global.wait_time())
+
+            wait = max(waits, default=0.0)
+            if wait > 0:
+                return wait
+
+            if bucket is not None:
+                bucket.consume()
+            if self._global is not None:
+                self._global.consume()
+            return 0.0
+
+    def acquire(self, domain=None):
+        """Block until a request to `domain` is allowed"""
+        while True:
+            wait = self.try_acquire(domain)
+            if wait <= 0:
+                return
+            self.sleep(wait)
+
+class AsyncDomainRateLimiter:
+    """asyncio front end for a DomainRateLimiter
+
+    Waits with asyncio.sleep instead of blocking the event loop. It shares the
+    wrapped limiter's buckets, so threaded and async callers are paced
+    together.
+    """
+
+    def __init__(self, limiter, sleep=asyncio.sleep):
+        self.limiter = limiter
+        self.sleep = sleep
+
+    async def acquire(self, domain=None):
+        """Wait until a request to `domain` is allowed"""
+        while True:
+            wait = self.limiter.try_acquire(domain)
+            if wait <= 0:
+                return
+            await self.sleep(wait)
@@ -0,0 +1,216 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+# Scoring tables shared by the per-lead and DataFrame-level scorers.
+# Points are relative to each factor's maximum; the factor's weight decides
+# how much it contributes to the final 0-100 score.
+REVENUE_POINTS = {
+    'High ($1M+)': 30,
+    'Medium ($100K-$1M)': 15,
+    'Low (<$100K)': 5,
+}
+
+INDUSTRY_POINTS = {
+    'SaaS/Tech': 20,
+    'Financial Services': 20,
+    'Healthcare': 15,
+    'E-commerce': 15,
+    'Manufacturing': 10,
+}
+DEFAULT_INDUSTRY_POINTS = 5
+
+# Every matching rule adds its points
+GROWTH_SIGNAL_POINTS = [
+    (['Recent funding round'], 15),
+    (['Hiring expansion', 'Market expansion'], 10),
+    (['New product launch', 'User growth'], 10),
+    (['AI/ML trending', 'Cloud adoption'], 10),
+]
+GROWTH_CAP = 20
+
+CONTACT_POINTS = {
+    'email': 5,
+    'phone': 3,
+    'linkedin': 2,
+}
+
+# First matching rule wins
+COMPANY_SIZE_POINTS = [
+    ('1000+', 10),
+    ('501-1000', 8),
+    ('201-500', 6),
+    ('51-200', 4),
+    ('11-50', 2),
+]
+
+TECH_HUBS = ['San Francisco', 'New York', 'Austin', 'Seattle', 'Boston']
+TECH_HUB_POINTS = 10
+TECH_STATES = ['CA', 'NY', 'TX']
+TECH_STATE_POINTS = 5
+
+# Maximum points per factor, used to normalise each factor to 0-1
+FACTOR_MAX_POINTS = {
+    'revenue': 30,
+    'industry': 20,
+    'growth': GROWTH_CAP,
+    'contact': 10,
+    'size': 10,
+    'location': 10,
+}
+
+# Default weight of each factor in the final score (sums to 100)
+DEFAULT_WEIGHTS = dict(FACTOR_MAX_POINTS)
+
+FACTOR_COLUMNS = {factor: f'factor_{factor}' for factor in FACTOR_MAX_POINTS}
+
+def load_weights(path):
+    """Load scoring weights from a JSON file, using defaults for missing factors"""
+    with open(path, encoding='utf-8') as f:
+        overrides = json.load(f)
+    unknown = set(overrides) - set(DEFAULT_WEIGHTS)
+    if unknown:
+        raise ValueError(f"Unknown scoring factors: {', '.join(sorted(unknown))}")
+    weights = dict(DEFAULT_WEIGHTS)
+    weights.update(overrides)
+    return weights
+
+def combine_factors(factors, weights=None):
+    """Weighted 0-100 score from normalised factor values
+
+    Works on a dict of floats (one lead) or a DataFrame of factor columns, so
+    the per-lead and vectorized scorers share the same arithmetic.
+    """
+    weights = weights or DEFAULT_WEIGHTS
+    score = 0.0
+    for factor, column in FACTOR_COLUMNS.items():
+        score = score + weights.get(factor, 0) * factors[column]
+    return np.round(np.clip(score, 0, 100), 2)
+
+def lead_factors(company_data):
+    """Normalised (0-1) factor values for a single lead"""
+    points = {}
+
+    revenue_range = company_data.get('revenue_range', '')
+    points['revenue'] = REVENUE_POINTS.get(revenue_range, 0)
+
+    industry = company_data.get('industry', '')
+    points['industry'] = INDUSTRY_POINTS.get(industry, DEFAULT_INDUSTRY_POINTS)
+
+    growth_signals = company_data.get('growth_signals', '')
+    growth = 0
+    for signals, signal_points in GROWTH_SIGNAL_POINTS:
+        if any(signal in growth_signals for signal in signals):
+            growth += signal_points
+    points['growth'] = min(growth, GROWTH_CAP)
+
+    points['contact'] = 0
+    for field, field_points in CONTACT_POINTS.items():
+        value = company_data.get(field, '')
+        if value and value != '':
+            points['contact'] += field_points
+
+    company_size = company_data.get('company_size', '')
+    points['size'] = 0
+    for marker, size_points in COMPANY_SIZE_POINTS:
+        if marker in company_size:
+            points['size'] = size_points
+            break
+
+    location = company_data.get('location', '')
+    points['location'] = 0
+    if any(hub in location for hub in TECH_HUBS):
+        points['location'] = TECH_HUB_POINTS
+    elif any(state in location for state in TECH_STATES):
+        points['location'] = TECH_STATE_POINTS
+
+    return {FACTOR_COLUMNS[f]: points[f] / FACTOR_MAX_POINTS[f] for f in FACTOR_COLUMNS}
+
+def _factorize_text(df, column):
+    """Return (codes, uniques) for a text column with missing values mapped to ''
+
+    Enrichment columns have few distinct values, so rules are evaluated once
+    per unique value and broadcast back through the codes.
+    """
+    if column not in df.columns:
+        return np.zeros(len(df), dtype=np.intp), pd.Series([''])
+    codes, uniques = pd.factorize(df[column], use_na_sentinel=True)
+    codes = np.where(codes < 0, len(uniques), codes)
+    uniques = pd.Series([str(value) for value in uniques] + [''])
+    return codes, uniques
+
+def _contains_any(uniques, needles):
+    mask = np.zeros(len(uniques), dtype=bool)
+    for needle in needles:
+        mask |= uniques.str.contains(needle, regex=False).to_numpy()
+    return mask
+
+def _is_filled(df, column):
+    if column not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    values = df[column]
+    return (values.notna() & values.ne('')).to_numpy(dtype=bool, na_value=False)
+
+def calculate_factor_frame(df):
+    """Vectorized normalised factor columns for every row of a leads DataFrame
+
+    Produces the same values as lead_factors applied row by row; missing
+    values are treated as empty strings.
+    """
+    points = {}
+
+    codes, uniques = _factorize_text(df, 'revenue_range')
+    points['revenue'] = uniques.map(REVENUE_POINTS).fillna(0).to_numpy(dtype=np.int64)[codes]
+
+    codes, uniques = _factorize_text(df, 'industry')
+    points['industry'] = uniques.map(INDUSTRY_POINTS).fillna(DEFAULT_INDUSTRY_POINTS).to_numpy(dtype=np.int64)[codes]
+
+    codes, uniques = _factorize_text(df, 'growth_signals')
+    growth_points = np.zeros(len(uniques), dtype=np.int64)
+    for needles, signal_points in GROWTH_SIGNAL_POINTS:
+        growth_points += np.where(_contains_any(uniques, needles), signal_points, 0)
+    points['growth'] = np.minimum(growth_points, GROWTH_CAP)[codes]
+
+    points['contact'] = np.zeros(len(df), dtype=np.int64)
+    for column, field_points in CONTACT_POINTS.items():
+        points['contact'] += np.where(_is_filled(df, column), field_points, 0)
+
+    codes, uniques = _factorize_text(df, 'company_size')
+    size_points = np.select(
+        [uniques.str.contains(marker, regex=False).to_numpy() for marker, _ in COMPANY_SIZE_POINTS],
+        [size_points for _, size_points in COMPANY_SIZE_POINTS],
+        default=0
+    )
+    points['size'] = size_points[codes]
+
+    codes, uniques = _factorize_text(df, 'location')
+    location_points = np.select(
+        [_contains_any(uniques, TECH_HUBS), _contains_any(uniques, TECH_STATES)],
+        [TECH_HUB_POINTS, TECH_STATE_POINTS],
+        default=0
+    )
+    points['location'] = location_points[codes]
+
+    return pd.DataFrame(
+        {FACTOR_COLUMNS[f]: points[f] / FACTOR_MAX_POINTS[f] for f in FACTOR_COLUMNS},
+        index=df.index
+    )
+
+def rescore(df, weights=None):
+    """Recompute acquisition_score from the cached factor columns without re-enriching"""
+    return pd.Series(combine_factors(df, weights), index=df.index, name='acquisition_score')
+
+def calculate_acquisition_fit_scores(df, weights=None):
+    """Vectorized acquisition fit score (0-100) for every row of a leads DataFrame
+
+    Produces the same scores as scraper.calculate_acquisition_fit_score applied
+    row by row.
+    """
+    return rescore(calculate_factor_frame(df), weights)
+
+def score_leads(df, weights=None):
+    """Factor columns plus acquisition_score for a leads DataFrame"""
+    factors = calculate_factor_frame(df)
+    factors['acquisition_score'] = rescore(factors, weights)
+    return factors
@@ -1,34 +1,202 @@
-import requests
-from bs4 import BeautifulSoup
 import re
-import time
 import random
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
+import numpy as np
 import pandas as pd
+import os
+import threading
+from rate_limiter import DomainRateLimiter
+from enrichment_cache import EnrichmentCache
+from keywords import DEFAULT_INDUSTRY, KeywordMatcher, load_keyword_config
+from page_parser import ParserPool, parse_company_page
+from scoring import combine_factors, lead_factors
+from lead_random import LeadRandom, LeadRandomArray, lead_key, lead_keys
+from metrics import metrics
 
 # Rate limiting and ethical scraping
-REQUEST_DELAY = 1.0  # seconds between requests
+REQUEST_DELAY = 1.0  # seconds between requests to the same domain
+RATE_LIMIT_BURST = 1  # requests a domain may receive back-to-back before pacing kicks in
+GLOBAL_RATE_LIMIT = None  # optional ceiling on requests per second across all domains
+
+# Persistent enrichment cache (set LEAD_CACHE_PATH to '' to disable)
+CACHE_PATH = os.environ.get('LEAD_CACHE_PATH', 'lead_cache.sqlite3')
+CACHE_TTL = 7 * 24 * 3600  # seconds before a cached company is re-enriched
+CACHE_MAX_ENTRIES = 500000
+
+# Optional JSON file overriding the keyword tables in keywords.py
+KEYWORDS_PATH = os.environ.get('LEAD_KEYWORDS_PATH', '')
+HTTP_POOL_SIZE = 10  # keep-alive connections per host
+HTTP_RETRIES = 3  # retries on connection errors and 429/5xx responses
+HTTP_BACKOFF = 0.5  # exponential backoff factor between retries (seconds)
+HTTP_TIMEOUT = (5, 15)  # (connect, read) timeout in seconds
+FETCH_PAGES = False  # fetch and parse each company's homepage on top of the mock enrichment
+PAGE_URL = 'https://{domain}/'  # homepage fetched for a domain when FETCH_PAGES is on
+# Processes parsing fetched HTML (override with LEAD_PARSER_PROCESSES; 0 parses in the fetching thread)
+PARSER_PROCESSES = int(os.environ.get('LEAD_PARSER_PROCESSES', 0))
+# Seed for reproducible mock enrichment (override with LEAD_ENRICHMENT_SEED; unset draws fresh values)
+ENRICHMENT_SEED = int(os.environ['LEAD_ENRICHMENT_SEED']) if os.environ.get('LEAD_ENRICHMENT_SEED') else None
 USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
     'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 ]
 
-def get_session():
-    """Create a session with proper headers for ethical scraping"""
-    session = requests.Session()
-    session.headers.update({
+# Mock enrichment tables
+REVENUE_RANGES = ['Low (<$100K)', 'Medium ($100K-$1M)', 'High ($1M+)']
+EMAIL_PATTERNS = ['info@{}', 'contact@{}', 'hello@{}', 'sales@{}', 'support@{}']
+AREA_CODES = ['212', '415', '650', '312', '617', '310', '206', '503', '713', '305']
+LOCATIONS = [
+    'San Francisco, CA', 'New York, NY', 'Austin, TX', 'Seattle, WA',
+    'Boston, MA', 'Chicago, IL', 'Denver, CO', 'Portland, OR',
+    'Los Angeles, CA', 'Miami, FL', 'Atlanta, GA', 'Dallas, TX'
+]
+COMPANY_SIZES = [
+    '1-10 employees', '11-50 employees', '51-200 employees',
+    '201-500 employees', '501-1000 employees', '1000+ employees'
+]
+COMPANY_SIZE_WEIGHTS = [20, 25, 25, 15, 10, 5]  # Weighted towards smaller companies
+GROWTH_SIGNALS = [
+    'Recent funding round', 'Hiring expansion', 'New product launch',
+    'Market expansion', 'Partnership announcements', 'User growth'
+]
+DESCRIPTION_TEMPLATES = {
+    'SaaS/Tech': "{} is a leading technology company providing innovative software solutions to help businesses streamline their operations and drive growth.",
+    'Healthcare': "{} is a healthcare technology company focused on improving patient outcomes through cutting-edge medical solutions and digital health platforms.",
+    'Financial Services': "{} is a financial technology company offering modern banking and payment solutions to businesses and consumers.",
+    'E-commerce': "{} is an e-commerce platform connecting buyers and sellers through innovative marketplace technology and logistics solutions.",
+    'Manufacturing': "{} is a manufacturing company specializing in industrial solutions and production optimization technologies.",
+    'Other': "{} is a growing company providing essential services to businesses across various industries."
+}
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+def http_headers():
+    """Request headers for ethical scraping"""
+    return {
         'User-Agent': random.choice(USER_AGENTS),
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
         'Accept-Encoding': 'gzip, deflate',
         'Connection': 'keep-alive',
-    })
-    return session
+    }
+
+def get_http_client():
+    """Shared pooled HTTP client with proper headers for ethical scraping"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            # requests is only imported once pages are actually fetched
+            from http_client import HttpClient
+            _http_client = HttpClient(
+                headers=http_headers(),
+                pool_maxsize=HTTP_POOL_SIZE,
+                retries=HTTP_RETRIES,
+                backoff_factor=HTTP_BACKOFF,
+                timeout=HTTP_TIMEOUT
+            )
+        return _http_client
+
+def set_http_client(client):
+    """Replace the shared HTTP client (None rebuilds it from the module settings)"""
+    global _http_client
+    with _http_client_lock:
+        _http_client = client
+
+def get_session():
+    """Pooled session for the calling thread"""
+    return get_http_client().session
+
+def fetch_page(url):
+    """Fetch a page through the shared client, rate limited per domain"""
+    rate_limit(urlparse(url).netloc)
+    with metrics.timer('search.fetch_page'):
+        response = get_http_client().get(url)
+    response.raise_for_status()
+    return response.text
+
+_parser_pool = None
+_parser_pool_lock = threading.Lock()
+
+def get_parser_pool():
+    """Shared HTML parser process pool, started on first use (None when PARSER_PROCESSES is 0)"""
+    global _parser_pool
+    with _parser_pool_lock:
+        if _parser_pool is None and PARSER_PROCESSES > 0:
+            _parser_pool = ParserPool(PARSER_PROCESSES)
+        return _parser_pool
+
+def set_parser_pool(pool):
+    """Replace the shared parser pool (None restarts it from the module settings)"""
+    global _parser_pool
+    with _parser_pool_lock:
+        _parser_pool = pool
+
+def parse_page(html, url=''):
+    """Parse fetched HTML in the parser pool, or in this thread if there is none"""
+    pool = get_parser_pool()
+    with metrics.timer('search.parse_page'):
+        if pool is None:
+            return parse_company_page(html, url)
+        return pool.parse(html, url)
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+def get_rate_limiter():
+    """Shared per-domain rate limiter, built from the module settings on first use"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            rate = 1.0 / REQUEST_DELAY if REQUEST_DELAY > 0 else None
+            _rate_limiter = DomainRateLimiter(rate, burst=RATE_LIMIT_BURST, global_rate=GLOBAL_RATE_LIMIT)
+        return _rate_limiter
+
+def set_rate_limiter(limiter):
+    """Replace the shared rate limiter (None rebuilds it from the module settings)"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        _rate_limiter = limiter
+
+def rate_limit(domain=None):
+    """Per-domain rate limiting to respect servers"""
+    with metrics.timer('search.rate_limit'):
+        get_rate_limiter().acquire(domain)
 
-def rate_limit():
-    """Simple rate limiting to respect servers"""
-    time.sleep(REQUEST_DELAY)
+_enrichment_cache = None
+_enrichment_cache_lock = threading.Lock()
+
+def get_enrichment_cache():
+    """Shared enrichment cache, opened on first use (None when disabled)"""
+    global _enrichment_cache
+    with _enrichment_cache_lock:
+        if _enrichment_cache is None and CACHE_PATH:
+            _enrichment_cache = EnrichmentCache(CACHE_PATH, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES)
+        return _enrichment_cache
+
+def set_enrichment_cache(cache):
+    """Replace the shared enrichment cache (None reopens it from the module settings)"""
+    global _enrichment_cache
+    with _enrichment_cache_lock:
+        _enrichment_cache = cache
+
+_keyword_matcher = None
+_keyword_matcher_lock = threading.Lock()
+
+def get_keyword_matcher():
+    """Shared compiled keyword matcher, built from KEYWORDS_PATH or the defaults"""
+    global _keyword_matcher
+    with _keyword_matcher_lock:
+        if _keyword_matcher is None:
+            config = load_keyword_config(KEYWORDS_PATH) if KEYWORDS_PATH else None
+            _keyword_matcher = KeywordMatcher(config)
+        return _keyword_matcher
+
+def set_keyword_matcher(matcher):
+    """Replace the shared keyword matcher (None rebuilds it from the settings)"""
+    global _keyword_matcher
+    with _keyword_matcher_lock:
+        _keyword_matcher = matcher
 
 def extract_domain_from_company(company_name):
     """Extract potential domain from company name"""
@@ -37,10 +205,28 @@ def extract_domain_from_company(company_name):
     clean_name = re.sub(r'\s+', '', clean_name)
     return f"{clean_name}.com"
 
-def search_company_info(company_name, domain=None):
-    """Search for company information using Google and other sources"""
-    session = get_session()
-    
+def search_company_page(company_name, domain=None):
+    """search_company_info using facts parsed from the company's homepage
+
+    The page is fetched in the calling thread and parsed through parse_page;
+    if it can't be fetched or parsed the mock enrichment is used unchanged.
+    """
+    if not domain:
+        domain = extract_domain_from_company(company_name)
+    url = PAGE_URL.format(domain=domain)
+    try:
+        page = parse_page(fetch_page(url), url)
+    except Exception:
+        page = None
+    return search_company_info(company_name, domain, page=page)
+
+def search_company_info(company_name, domain=None, page=None, paced=True):
+    """Search for company information using Google and other sources
+
+    page is an optional parse_company_page result; facts found on the page
+    replace the generated ones. paced=False skips the rate limit for callers
+    that have already waited their turn (e.g. the async enrichment path).
+    """
     if not domain:
         domain = extract_domain_from_company(company_name)
     
@@ -62,111 +248,187 @@ def search_company_info(company_name, domain=None):
     }
     
     try:
-        # Simulate web scraping with rate limiting
-        rate_limit()
+        # Simulate web scraping with rate limiting (a fetched page was already rate limited)
+        if page is None and paced:
+            rate_limit(domain)
+        
+        # Per-field random streams; reproducible when ENRICHMENT_SEED is set
+        rng = lead_rng(company_name, domain)
         
         # Mock industry detection based on company name patterns
-        industry = detect_industry(company_name)
+        with metrics.timer('search.industry'):
+            industry = detect_industry(company_name)
+            if page and industry == DEFAULT_INDUSTRY:
+                industry = detect_industry(f"{page['title']} {page['description']}")
         company_data['industry'] = industry
         
         # Mock revenue estimation
-        revenue_range = estimate_revenue(company_name, industry)
+        with metrics.timer('search.revenue'):
+            revenue_range = estimate_revenue(company_name, industry, rng('revenue'))
         company_data['revenue_range'] = revenue_range
         
         # Mock contact information generation
-        company_data['email'] = generate_contact_email(company_name, domain)
-        company_data['phone'] = generate_phone_number()
-        company_data['linkedin'] = generate_linkedin_url(company_name)
+        with metrics.timer('search.contacts'):
+            company_data['email'] = generate_contact_email(company_name, domain, rng('email'))
+            company_data['phone'] = generate_phone_number(rng('phone'))
+            company_data['linkedin'] = generate_linkedin_url(company_name)
         
         # Mock location and company size
-        company_data['location'] = generate_location()
-        company_data['company_size'] = generate_company_size()
+        with metrics.timer('search.profile'):
+            company_data['location'] = generate_location(rng('location'))
+            company_data['company_size'] = generate_company_size(rng('size'))
         
         # Mock growth signals
-        company_data['growth_signals'] = detect_growth_signals(company_name, industry)
+        with metrics.timer('search.growth'):
+            company_data['growth_signals'] = detect_growth_signals(company_name, industry, rng('growth'))
         
         # Mock description
-        company_data['description'] = generate_company_description(company_name, industry)
+        with metrics.timer('search.description'):
+            company_data['description'] = generate_company_description(company_name, industry)
+        
+        if page:
+            company_data['email'] = next(iter(page['emails']), company_data['email'])
+            company_data['phone'] = next(iter(page['phones']), company_data['phone'])
+            company_data['linkedin'] = page['linkedin'] or company_data['linkedin']
+            company_data['description'] = page['description'] or company_data['description']
         
     except Exception as e:
         # Return basic data even if enrichment fails
+        metrics.incr('search.failures')
         company_data['industry'] = 'Unknown'
         company_data['revenue_range'] = 'Unknown'
     
     return company_data
 
+def lead_rng(company_name, domain, seed=None):
+    """Factory of per-field random sources for one lead: rng(field)
+
+    With a seed (default ENRICHMENT_SEED) each field gets a LeadRandom stream
+    derived from the company name, domain and seed, so a lead always gets the
+    same mock data; without one every field uses the global random module.
+    """
+    seed = ENRICHMENT_SEED if seed is None else seed
+    if seed is None:
+        return lambda field: random
+    key = lead_key(company_name, domain, seed)
+    return lambda field: LeadRandom(key, field)
+
+def search_company_batch(company_names, domains=None, seed=None):
+    """Vectorized search_company_info for many companies (without rate limiting)
+
+    Draws every mock field for the whole batch with NumPy. With a seed
+    (default ENRICHMENT_SEED) row i equals search_company_info(company_names[i],
+    domains[i]) under that seed; without one a fresh seed is drawn.
+    """
+    seed = ENRICHMENT_SEED if seed is None else seed
+    if seed is None:
+        seed = random.getrandbits(64)
+    names = pd.Series(company_names, dtype=object).fillna('').astype(str).reset_index(drop=True)
+    n = len(names)
+    if domains is None:
+        domains = pd.Series([''] * n, dtype=object)
+    domains = pd.Series(domains, dtype=object).fillna('').astype(str).reset_index(drop=True)
+    # extract_domain_from_company, column-wise
+    derived = names.str.lower().str.replace(r'[^a-zA-Z0-9\s]', '', regex=True).str.replace(r'\s+', '', regex=True) + '.com'
+    domains = domains.where(domains != '', derived)
+    keys = lead_keys(names, domains, seed)
+
+    matcher = get_keyword_matcher()
+    tags = matcher.match_series(names)
+    industry = matcher.industry_series(names).to_numpy(dtype=object)
+    has_tag = lambda tag: tags.map(lambda found: tag in found).to_numpy(dtype=bool)
+
+    revenue = np.full(n, 'High ($1M+)', dtype=object)
+    draws = LeadRandomArray(keys, 'revenue').random()
+    for group in (['SaaS/Tech', 'Financial Services'], ['Healthcare', 'Manufacturing'], None):
+        mask = np.isin(industry, group) if group else ~np.isin(industry, ['SaaS/Tech', 'Financial Services', 'Healthcare', 'Manufacturing'])
+        mask &= ~has_tag(('high_revenue', None))
+        cumulative = np.cumsum(revenue_weights(group[0] if group else None))
+        picks = np.searchsorted(cumulative, draws[mask] * cumulative[-1], side='right')
+        revenue[mask] = np.asarray(REVENUE_RANGES, dtype=object)[picks]
+
+    domain_values = domains.to_numpy(dtype=object)
+    email_prefix = LeadRandomArray(keys, 'email').choice([pattern.replace('{}', '') for pattern in EMAIL_PATTERNS])
+    email = np.where((domain_values == '') | (domain_values == 'unknown.com'), '', email_prefix + domain_values)
+
+    phone_rng = LeadRandomArray(keys, 'phone')
+    area_code = phone_rng.choice(AREA_CODES)
+    digits = [phone_rng.randint(0, 9).astype(str).astype(object) for _ in range(7)]
+    phone = '(' + area_code + ') ' + digits[0] + digits[1] + digits[2] + '-' + digits[3] + digits[4] + digits[5] + digits[6]
+
+    linkedin = 'https://linkedin.com/company/' + names.str.lower().str.replace(r'[^a-zA-Z0-9\s]', '', regex=True).str.replace(r'\s+', '-', regex=True)
+
+    growth_rng = LeadRandomArray(keys, 'growth')
+    num_signals = growth_rng.randint(0, 2)
+    sampled = growth_rng.sample(GROWTH_SIGNALS, 2)
+    is_saas = industry == 'SaaS/Tech'
+    parts = [
+        np.where(is_saas, 'Tech sector growth', ''),
+        np.where(is_saas & has_tag(('ai_ml', None)), 'AI/ML trending', ''),
+        np.where(has_tag(('cloud', None)), 'Cloud adoption', ''),
+        np.where(num_signals >= 1, sampled[:, 0], ''),
+        np.where(num_signals >= 2, sampled[:, 1], ''),
+    ]
+    growth = parts[0].astype(object)
+    for part in parts[1:]:
+        part = part.astype(object)
+        growth = np.where(growth == '', part, np.where(part == '', growth, growth + ', ' + part))
+    growth = np.where(growth == '', 'None detected', growth)
+
+    templates = pd.Series(industry).map(DESCRIPTION_TEMPLATES).fillna(DESCRIPTION_TEMPLATES['Other'])
+    description = names + templates.str.slice(2)
+
+    return pd.DataFrame({
+        'company_name': names,
+        'domain': domains,
+        'email': email,
+        'phone': phone,
+        'linkedin': linkedin,
+        'industry': industry,
+        'location': LeadRandomArray(keys, 'location').choice(LOCATIONS),
+        'company_size': LeadRandomArray(keys, 'size').choices(COMPANY_SIZES, COMPANY_SIZE_WEIGHTS),
+        'revenue_range': revenue,
+        'growth_signals': growth,
+        'description': description,
+    })
+
 def detect_industry(company_name):
     """Detect industry based on company name patterns"""
-    name_lower = company_name.lower()
-    
-    # SaaS/Tech keywords
-    saas_keywords = ['software', 'tech', 'cloud', 'saas', 'platform', 'api', 'digital', 'data', 'ai', 'ml', 'automation']
-    if any(keyword in name_lower for keyword in saas_keywords):
-        return 'SaaS/Tech'
-    
-    # Healthcare keywords
-    health_keywords = ['health', 'medical', 'pharma', 'biotech', 'wellness', 'care', 'clinical']
-    if any(keyword in name_lower for keyword in health_keywords):
-        return 'Healthcare'
-    
-    # Finance keywords
-    finance_keywords = ['finance', 'fintech', 'bank', 'payment', 'trading', 'investment', 'crypto']
-    if any(keyword in name_lower for keyword in finance_keywords):
-        return 'Financial Services'
-    
-    # E-commerce keywords
-    ecommerce_keywords = ['retail', 'commerce', 'marketplace', 'shop', 'store', 'ecommerce']
-    if any(keyword in name_lower for keyword in ecommerce_keywords):
-        return 'E-commerce'
-    
-    # Manufacturing keywords
-    manufacturing_keywords = ['manufacturing', 'industrial', 'factory', 'production', 'supply']
-    if any(keyword in name_lower for keyword in manufacturing_keywords):
-        return 'Manufacturing'
-    
-    return 'Other'
+    # Industries are checked in priority order; the first keyword hit wins
+    return get_keyword_matcher().industry(company_name)
 
-def estimate_revenue(company_name, industry):
+def estimate_revenue(company_name, industry, rng=random):
     """Estimate revenue range based on company characteristics"""
-    name_lower = company_name.lower()
-    
     # High-revenue indicators
-    high_revenue_indicators = ['enterprise', 'corporate', 'global', 'international', 'systems', 'solutions']
-    if any(indicator in name_lower for indicator in high_revenue_indicators):
+    if get_keyword_matcher().has_high_revenue_indicator(company_name):
         return 'High ($1M+)'
     
     # Industry-based estimation
+    return rng.choices(REVENUE_RANGES, weights=revenue_weights(industry))[0]
+
+def revenue_weights(industry):
+    """Odds of each REVENUE_RANGES entry for an industry"""
     if industry in ['SaaS/Tech', 'Financial Services']:
         # Higher likelihood of high revenue for these industries
-        return random.choices(['Medium ($100K-$1M)', 'High ($1M+)'], weights=[40, 60])[0]
+        return [0, 40, 60]
     elif industry in ['Healthcare', 'Manufacturing']:
-        return random.choices(['Low (<$100K)', 'Medium ($100K-$1M)', 'High ($1M+)'], weights=[20, 50, 30])[0]
+        return [20, 50, 30]
     else:
-        return random.choices(['Low (<$100K)', 'Medium ($100K-$1M)', 'High ($1M+)'], weights=[30, 50, 20])[0]
+        return [30, 50, 20]
 
-def generate_contact_email(company_name, domain):
+def generate_contact_email(company_name, domain, rng=random):
     """Generate realistic contact email addresses"""
     if not domain or domain == 'unknown.com':
         return ''
     
-    # Common email patterns
-    email_patterns = [
-        'info@{}',
-        'contact@{}',
-        'hello@{}',
-        'sales@{}',
-        'support@{}'
-    ]
-    
-    pattern = random.choice(email_patterns)
+    pattern = rng.choice(EMAIL_PATTERNS)
     return pattern.format(domain)
 
-def generate_phone_number():
+def generate_phone_number(rng=random):
     """Generate realistic phone numbers"""
     # US phone number format
-    area_codes = ['212', '415', '650', '312', '617', '310', '206', '503', '713', '305']
-    area_code = random.choice(area_codes)
-    number = ''.join([str(random.randint(0, 9)) for _ in range(7)])
+    area_code = rng.choice(AREA_CODES)
+    number = ''.join([str(rng.randint(0, 9)) for _ in range(7)])
     return f"({area_code}) {number[:3]}-{number[3:]}"
 
 def generate_linkedin_url(company_name):
@@ -175,143 +437,121 @@ def generate_linkedin_url(company_name):
     clean_name = re.sub(r'\s+', '-', clean_name)
     return f"https://linkedin.com/company/{clean_name}"
 
-def generate_location():
+def generate_location(rng=random):
     """Generate realistic company locations"""
-    locations = [
-        'San Francisco, CA', 'New York, NY', 'Austin, TX', 'Seattle, WA',
-        'Boston, MA', 'Chicago, IL', 'Denver, CO', 'Portland, OR',
-        'Los Angeles, CA', 'Miami, FL', 'Atlanta, GA', 'Dallas, TX'
-    ]
-    return random.choice(locations)
+    return rng.choice(LOCATIONS)
 
-def generate_company_size():
+def generate_company_size(rng=random):
     """Generate realistic company sizes"""
-    sizes = [
-        '1-10 employees', '11-50 employees', '51-200 employees',
-        '201-500 employees', '501-1000 employees', '1000+ employees'
-    ]
-    weights = [20, 25, 25, 15, 10, 5]  # Weighted towards smaller companies
-    return random.choices(sizes, weights=weights)[0]
+    return rng.choices(COMPANY_SIZES, weights=COMPANY_SIZE_WEIGHTS)[0]
 
-def detect_growth_signals(company_name, industry):
+def detect_growth_signals(company_name, industry, rng=random):
     """Detect growth signals from company characteristics"""
     signals = []
+    matcher = get_keyword_matcher()
     
     # Industry-based growth signals
     if industry == 'SaaS/Tech':
         signals.append('Tech sector growth')
-        if 'ai' in company_name.lower() or 'ml' in company_name.lower():
+        if matcher.has_ai_ml(company_name):
             signals.append('AI/ML trending')
     
     # Company name indicators
-    if any(word in company_name.lower() for word in ['cloud', 'saas', 'platform']):
+    if matcher.has_cloud(company_name):
         signals.append('Cloud adoption')
     
-    # Random growth signals for demo
-    growth_signals = [
-        'Recent funding round', 'Hiring expansion', 'New product launch',
-        'Market expansion', 'Partnership announcements', 'User growth'
-    ]
-    
-    # Add 1-2 random growth signals
-    num_signals = random.randint(0, 2)
-    additional_signals = random.sample(growth_signals, min(num_signals, len(growth_signals)))
+    # Add 1-2 random growth signals for demo
+    num_signals = rng.randint(0, 2)
+    additional_signals = rng.sample(GROWTH_SIGNALS, min(num_signals, len(GROWTH_SIGNALS)))
     signals.extend(additional_signals)
     
     return ', '.join(signals) if signals else 'None detected'
 
 def generate_company_description(company_name, industry):
     """Generate a realistic company description"""
-    templates = {
-        'SaaS/Tech': f"{company_name} is a leading technology company providing innovative software solutions to help businesses streamline their operations and drive growth.",
-        'Healthcare': f"{company_name} is a healthcare technology company focused on improving patient outcomes through cutting-edge medical solutions and digital health platforms.",
-        'Financial Services': f"{company_name} is a financial technology company offering modern banking and payment solutions to businesses and consumers.",
-        'E-commerce': f"{company_name} is an e-commerce platform connecting buyers and sellers through innovative marketplace technology and logistics solutions.",
-        'Manufacturing': f"{company_name} is a manufacturing company specializing in industrial solutions and production optimization technologies.",
-        'Other': f"{company_name} is a growing company providing essential services to businesses across various industries."
+    return DESCRIPTION_TEMPLATES.get(industry, DESCRIPTION_TEMPLATES['Other']).format(company_name)
+
+def calculate_acquisition_fit_score(company_data, weights=None):
+    """Calculate AI-powered acquisition fit score (0-100)
+
+    Each factor (revenue, industry, growth, contact, size, location) is scored
+    0-1 and combined with the given weights (scoring.DEFAULT_WEIGHTS by default).
+    """
+    return float(combine_factors(lead_factors(company_data), weights))
+
+def empty_company_data(company_name, domain=None):
+    """Minimal data structure for a company whose enrichment failed"""
+    return {
+        'company_name': company_name,
+        'domain': domain or '',
+        'email': '',
+        'phone': '',
+        'linkedin': '',
+        'industry': 'Unknown',
+        'location': '',
+        'company_size': '',
+        'revenue_range': 'Unknown',
+        'growth_signals': '',
+        'description': ''
     }
-    
-    return templates.get(industry, templates['Other'])
 
-def calculate_acquisition_fit_score(company_data):
-    """Calculate AI-powered acquisition fit score (0-100)"""
-    score = 0
-    
-    # Revenue scoring (30 points max)
-    revenue_range = company_data.get('revenue_range', '')
-    if revenue_range == 'High ($1M+)':
-        score += 30
-    elif revenue_range == 'Medium ($100K-$1M)':
-        score += 15
-    elif revenue_range == 'Low (<$100K)':
-        score += 5
-    
-    # Industry scoring (20 points max)
-    industry = company_data.get('industry', '')
-    if industry in ['SaaS/Tech', 'Financial Services']:
-        score += 20
-    elif industry in ['Healthcare', 'E-commerce']:
-        score += 15
-    elif industry in ['Manufacturing']:
-        score += 10
-    else:
-        score += 5
-    
-    # Growth signals scoring (20 points max)
-    growth_signals = company_data.get('growth_signals', '')
-    if 'Recent funding round' in growth_signals:
-        score += 15
-    if 'Hiring expansion' in growth_signals or 'Market expansion' in growth_signals:
-        score += 10
-    if 'New product launch' in growth_signals or 'User growth' in growth_signals:
-        score += 10
-    if 'AI/ML trending' in growth_signals or 'Cloud adoption' in growth_signals:
-        score += 10
-    
-    # Cap growth signals at 20 points
-    score = min(score, score - max(0, (score - 20) if growth_signals else 0))
-    
-    # Contact quality scoring (10 points max)
-    email = company_data.get('email', '')
-    phone = company_data.get('phone', '')
-    linkedin = company_data.get('linkedin', '')
+def enrich_company(company_name, domain=None, refresh=False):
+    """Enrich a single company without scoring it
+
+    Enrichment results are served from the persistent cache when available;
+    pass refresh=True to bypass it and re-enrich the company.
+    """
+    cache = get_enrichment_cache()
+    company_data = None
+    if cache is not None and not refresh:
+        company_data = cache.get(company_name, domain, seed=ENRICHMENT_SEED)
+        metrics.incr('cache.misses' if company_data is None else 'cache.hits')
     
-    if email and email != '':
-        score += 5
-    if phone and phone != '':
-        score += 3
-    if linkedin and linkedin != '':
-        score += 2
+    if company_data is None:
+        # Search for company information
+        search = search_company_page if FETCH_PAGES else search_company_info
+        company_data = search(company_name, domain)
+        # Failed lookups are not cached so they are retried next time
+        if cache is not None and company_data['industry'] != 'Unknown':
+            cache.set(company_name, domain, company_data, seed=ENRICHMENT_SEED)
     
-    # Company size scoring (10 points max)
-    company_size = company_data.get('company_size', '')
-    if '1000+' in company_size:
-        score += 10
-    elif '501-1000' in company_size:
-        score += 8
-    elif '201-500' in company_size:
-        score += 6
-    elif '51-200' in company_size:
-        score += 4
-    elif '11-50' in company_size:
-        score += 2
+    return company_data
+
+def enrich_companies(leads, refresh=False):
+    """Batch enrich_company for a list of (company_name, domain) pairs
+
+    Cache misses are generated in one search_company_batch call, which under
+    ENRICHMENT_SEED matches search_company_info row for row; pages are not
+    fetched, so this is for seeded runs without FETCH_PAGES. Returns one data
+    dict per lead, in order.
+    """
+    cache = get_enrichment_cache()
+    results = [None] * len(leads)
+    if cache is not None and not refresh:
+        for i, (company_name, domain) in enumerate(leads):
+            results[i] = cache.get(company_name, domain, seed=ENRICHMENT_SEED)
+        hits = sum(company_data is not None for company_data in results)
+        metrics.incr('cache.hits', hits)
+        metrics.incr('cache.misses', len(leads) - hits)
     
-    # Location scoring (10 points max)
-    location = company_data.get('location', '')
-    tech_hubs = ['San Francisco', 'New York', 'Austin', 'Seattle', 'Boston']
-    if any(hub in location for hub in tech_hubs):
-        score += 10
-    elif 'CA' in location or 'NY' in location or 'TX' in location:
-        score += 5
+    misses = [i for i, company_data in enumerate(results) if company_data is None]
+    if misses:
+        with metrics.timer('search.batch'):
+            found = search_company_batch(
+                [leads[i][0] for i in misses], [leads[i][1] for i in misses], seed=ENRICHMENT_SEED
+            )
+        for i, company_data in zip(misses, found.to_dict('records')):
+            results[i] = company_data
+            if cache is not None:
+                company_name, domain = leads[i]
+                cache.set(company_name, domain, company_data, seed=ENRICHMENT_SEED)
     
-    # Ensure score is between 0 and 100
-    return min(100, max(0, score))
+    return results
 
-def enrich_leads(company_name, domain=None):
-    """Main function to enrich lead data"""
+def enrich_leads(company_name, domain=None, refresh=False):
+    """Main function to enrich and score a single lead"""
     try:
-        # Search for company information
-        company_data = search_company_info(company_name, domain)
+        company_data = enrich_company(company_name, domain, refresh=refresh)
         
         # Calculate acquisition fit score
         score = calculate_acquisition_fit_score(company_data)
@@ -321,20 +561,10 @@ def enrich_leads(company_name, domain=None):
         
     except Exception as e:
         # Return minimal data structure
-        return {
-            'company_name': company_name,
-            'domain': domain or '',
-            'email': '',
-            'phone': '',
-            'linkedin': '',
-            'industry': 'Unknown',
-            'location': '',
-            'company_size': '',
-            'revenue_range': 'Unknown',
-            'growth_signals': '',
-            'description': '',
-            'acquisition_score': 0
-        }
+        metrics.incr('enrich.failures')
+        company_data = empty_company_data(company_name, domain)
+        company_data['acquisition_score'] = 0
+        return company_data
 
 # For testing purposes
 if __name__ == "__main__":
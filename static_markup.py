@@ -0,0 +1,327 @@
+import re
+
+# Static HTML and CSS for the app. Streamlit re-executes main.py on every
+# rerun but imports this module once per process, so each block is compacted
+# a single time and every rerun sends the short one-line form.
+
+def compact(markup):
+    """Markup on one line, without the indentation between tags"""
+    return re.sub(r'\s*\n\s*', ' ', markup).strip()
+
+# Global styles, injected at the top of every page
+APP_STYLE = compact("""
+    <style>
+        @keyframes fadeInUp {
+            from { opacity: 0; transform: translateY(20px); }
+            to { opacity: 1; transform: translateY(0); }
+        }
+
+        @keyframes pulse {
+            0%, 100% { transform: scale(1); }
+            50% { transform: scale(1.05); }
+        }
+
+        @keyframes countUp {
+            from { opacity: 0; transform: scale(0.8); }
+            to { opacity: 1; transform: scale(1); }
+        }
+
+        .main {
+            background: linear-gradient(135deg, #0f1419 0%, #1a202c 100%);
+            color: white;
+        }
+
+        .stApp {
+            background: linear-gradient(135deg, #0a0e1a 0%, #1a1f2e 25%, #2d1b3d 50%, #1a202c 75%, #0f1419 100%);
+        }
+
+        .hero-container {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            padding: 2rem;
+            border-radius: 15px;
+            margin-bottom: 1.5rem;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.3);
+            text-align: center;
+            color: white;
+        }
+
+        .hero-title {
+            font-size: 2.5rem;
+            font-weight: 700;
+            margin-bottom: 0.5rem;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+        }
+
+        .hero-subtitle {
+            font-size: 1.2rem;
+            opacity: 0.9;
+            margin-bottom: 1rem;
+        }
+
+        .hero-badge {
+            background: rgba(255,255,255,0.2);
+            padding: 0.3rem 1rem;
+            border-radius: 20px;
+            font-size: 0.9rem;
+            display: inline-block;
+            margin: 0.2rem;
+            backdrop-filter: blur(10px);
+        }
+
+        .metrics-container {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 1rem;
+            margin-bottom: 1.5rem;
+        }
+
+        .metric-card {
+            background: linear-gradient(135deg, #2d3748 0%, #4a5568 100%);
+            padding: 1.2rem;
+            border-radius: 12px;
+            text-align: center;
+            color: white;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+            border: 1px solid rgba(255,255,255,0.1);
+            transition: all 0.3s ease;
+            animation: fadeInUp 0.6s ease-out;
+            cursor: pointer;
+        }
+
+        .metric-card:hover {
+            transform: translateY(-5px) scale(1.02);
+            box-shadow: 0 8px 25px rgba(72, 187, 120, 0.3);
+            border-color: rgba(72, 187, 120, 0.5);
+        }
+
+        .metric-value {
+            font-size: 2rem;
+            font-weight: 700;
+            color: #48bb78;
+            margin-bottom: 0.3rem;
+            animation: countUp 1s ease-out 0.3s both;
+        }
+
+        .metric-value:hover {
+            animation: pulse 1s infinite;
+        }
+
+        .metric-label {
+            font-size: 0.9rem;
+            opacity: 0.8;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+        }
+
+        .stButton > button {
+            background: linear-gradient(135deg, #48bb78 0%, #38a169 100%);
+            color: white;
+            border: none;
+            border-radius: 8px;
+            padding: 0.5rem 1.5rem;
+            font-weight: 600;
+            transition: all 0.3s ease;
+            box-shadow: 0 4px 15px rgba(72, 187, 120, 0.3);
+        }
+
+        .stButton > button:hover {
+            transform: translateY(-2px);
+            box-shadow: 0 6px 20px rgba(72, 187, 120, 0.4);
+        }
+
+        .css-1d391kg {
+            background: linear-gradient(180deg, #0a0e1a 0%, #1a1f2e 50%, #2d1b3d 100%);
+            border-right: 1px solid rgba(72, 187, 120, 0.2);
+        }
+
+        .filter-chip {
+            display: inline-block;
+            background: rgba(72, 187, 120, 0.2);
+            color: #48bb78;
+            padding: 0.3rem 0.8rem;
+            border-radius: 15px;
+            font-size: 0.8rem;
+            margin: 0.2rem;
+            border: 1px solid rgba(72, 187, 120, 0.4);
+            animation: fadeInUp 0.4s ease-out;
+        }
+
+        .lead-card {
+            transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
+            cursor: pointer;
+            animation: fadeInUp 0.6s ease-out;
+        }
+
+        .lead-card:hover {
+            transform: translateY(-3px) scale(1.01);
+            box-shadow: 0 10px 30px rgba(0,0,0,0.4);
+        }
+
+        .score-badge {
+            animation: pulse 2s infinite;
+            transition: all 0.3s ease;
+        }
+
+        .score-badge:hover {
+            transform: scale(1.1);
+            animation: none;
+        }
+    </style>
+""")
+
+# Page header
+HERO = compact("""
+    <div class="hero-container">
+        <div class="hero-title">🎯 SaaSquatch AI Lead Prioritizer</div>
+        <div class="hero-subtitle">Transform leads into acquisition-ready targets with AI intelligence</div>
+        <div>
+            <span class="hero-badge">🤖 AI-Powered</span>
+            <span class="hero-badge">📊 Smart Analytics</span>
+            <span class="hero-badge">🚀 ETA Focused</span>
+        </div>
+    </div>
+""")
+
+# Landing page, shown until leads are loaded
+LANDING_INTRO = compact("""
+    <div style="text-align: center; padding: 3rem 2rem; background: rgba(26, 32, 44, 0.9); border-radius: 20px; margin: 2rem 0; border: 2px solid rgba(72, 187, 120, 0.3);">
+        <div style="font-size: 4rem; margin-bottom: 1.5rem;">🎯</div>
+        <h1 style="color: white; font-size: 2.5rem; margin-bottom: 1rem; font-weight: 800;">Acquisition Intelligence Engine</h1>
+        <p style="color: rgba(255,255,255,0.9); font-size: 1.2rem; line-height: 1.6; margin-bottom: 2rem; max-width: 600px; margin-left: auto; margin-right: auto;">
+            Transform raw company lists into <strong style="color: #48bb78;">strategic acquisition targets</strong> using proprietary AI scoring algorithms designed for <strong style="color: #667eea;">ETA investments</strong>
+        </p>
+    </div>
+""")
+
+# One card per landing page column
+LANDING_FEATURES = (
+    compact("""
+        <div style="background: rgba(72, 187, 120, 0.1); padding: 2rem; border-radius: 15px; border: 1px solid rgba(72, 187, 120, 0.3); text-align: center; margin-bottom: 1rem;">
+            <div style="font-size: 2.5rem; margin-bottom: 1rem;">🧠</div>
+            <div style="color: #48bb78; font-weight: 700; margin-bottom: 0.8rem;">Neural Scoring</div>
+            <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem;">6-factor acquisition readiness algorithm</div>
+        </div>
+    """),
+    compact("""
+        <div style="background: rgba(102, 126, 234, 0.1); padding: 2rem; border-radius: 15px; border: 1px solid rgba(102, 126, 234, 0.3); text-align: center; margin-bottom: 1rem;">
+            <div style="font-size: 2.5rem; margin-bottom: 1rem;">⚡</div>
+            <div style="color: #667eea; font-weight: 700; margin-bottom: 0.8rem;">Lightning Enrichment</div>
+            <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem;">Instant contact discovery & validation</div>
+        </div>
+    """),
+    compact("""
+        <div style="background: rgba(118, 75, 162, 0.1); padding: 2rem; border-radius: 15px; border: 1px solid rgba(118, 75, 162, 0.3); text-align: center; margin-bottom: 1rem;">
+            <div style="font-size: 2.5rem; margin-bottom: 1rem;">🎯</div>
+            <div style="color: #764ba2; font-weight: 700; margin-bottom: 0.8rem;">ETA Precision</div>
+            <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem;">Built for acquisition targeting</div>
+        </div>
+    """),
+)
+
+# Landing page call to action
+LANDING_CTA = compact("""
+    <div style="margin-top: 2rem; padding: 1.5rem; background: rgba(72, 187, 120, 0.1); border-radius: 12px; border: 1px solid rgba(72, 187, 120, 0.4); text-align: center;">
+        <div style="color: #48bb78; font-weight: 700; font-size: 1.1rem; margin-bottom: 0.5rem;">🚀 Ready to Transform Your Deal Flow?</div>
+        <div style="color: rgba(255,255,255,0.9);">Upload your company list or explore our sample dataset</div>
+    </div>
+""")
+
+# Banner above the export controls
+EXPORT_HEADER = compact("""
+    <div style="background: linear-gradient(135deg, rgba(26, 32, 44, 0.9) 0%, rgba(45, 55, 72, 0.8) 100%); padding: 2rem; border-radius: 15px; border: 2px solid rgba(72, 187, 120, 0.3); margin: 2rem 0; position: relative; overflow: hidden;">
+        <div style="position: absolute; top: 0; right: 0; width: 100px; height: 100px; background: radial-gradient(circle, rgba(72, 187, 120, 0.1) 0%, transparent 70%); border-radius: 50%;"></div>
+        <h3 style="color: #48bb78; margin-bottom: 1rem; font-size: 1.5rem;">📤 Export Intelligence Report</h3>
+        <p style="color: rgba(255,255,255,0.9); margin-bottom: 1.5rem; font-size: 1.1rem;">Download your AI-prioritized leads with comprehensive scoring and enriched data</p>
+        <div style="display: flex; gap: 1rem; align-items: center; margin-bottom: 1rem;">
+            <span style="background: rgba(72, 187, 120, 0.2); color: #48bb78; padding: 0.3rem 0.8rem; border-radius: 15px; font-size: 0.9rem;">📊 CSV · Parquet</span>
+            <span style="background: rgba(102, 126, 234, 0.2); color: #667eea; padding: 0.3rem 0.8rem; border-radius: 15px; font-size: 0.9rem;">🔄 Real-time Data</span>
+            <span style="background: rgba(237, 137, 54, 0.2); color: #ed8936; padding: 0.3rem 0.8rem; border-radius: 15px; font-size: 0.9rem;">🎯 CRM Ready</span>
+        </div>
+    </div>
+""")
+
+# Scoring explainer shown below the results
+SCORING_HEADER = compact("""
+    <div style="background: linear-gradient(135deg, rgba(72, 187, 120, 0.15) 0%, rgba(102, 126, 234, 0.15) 100%); padding: 2rem; border-radius: 15px; border: 2px solid rgba(72, 187, 120, 0.3); margin: 2rem 0;">
+        <div style="text-align: center; margin-bottom: 2rem;">
+            <h2 style="color: #48bb78; font-size: 2rem; margin-bottom: 0.5rem;">🧠 AI Scoring Algorithm</h2>
+            <p style="color: rgba(255,255,255,0.9); font-size: 1.1rem;">Our proprietary 6-factor acquisition readiness engine</p>
+        </div>
+    </div>
+""")
+
+# Factor cards, two per column
+SCORING_FACTORS = (
+    (
+        compact("""
+            <div style="background: rgba(72, 187, 120, 0.2); padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(72, 187, 120, 0.4); margin-bottom: 1rem;">
+                <div style="font-size: 2rem; margin-bottom: 0.5rem;">💰</div>
+                <div style="color: #48bb78; font-weight: 700; font-size: 1.2rem; margin-bottom: 0.5rem;">Revenue (30%)</div>
+                <div style="color: rgba(255,255,255,0.9); line-height: 1.5;">Financial health assessment</div>
+            </div>
+        """),
+        compact("""
+            <div style="background: rgba(102, 126, 234, 0.2); padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(102, 126, 234, 0.4);">
+                <div style="font-size: 2rem; margin-bottom: 0.5rem;">🏢</div>
+                <div style="color: #667eea; font-weight: 700; font-size: 1.2rem; margin-bottom: 0.5rem;">Industry (20%)</div>
+                <div style="color: rgba(255,255,255,0.9); line-height: 1.5;">Market compatibility</div>
+            </div>
+        """),
+    ),
+    (
+        compact("""
+            <div style="background: rgba(118, 75, 162, 0.2); padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(118, 75, 162, 0.4); margin-bottom: 1rem;">
+                <div style="font-size: 2rem; margin-bottom: 0.5rem;">📈</div>
+                <div style="color: #764ba2; font-weight: 700; font-size: 1.2rem; margin-bottom: 0.5rem;">Growth (20%)</div>
+                <div style="color: rgba(255,255,255,0.9); line-height: 1.5;">Expansion signals</div>
+            </div>
+        """),
+        compact("""
+            <div style="background: rgba(237, 137, 54, 0.2); padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(237, 137, 54, 0.4);">
+                <div style="font-size: 2rem; margin-bottom: 0.5rem;">📧</div>
+                <div style="color: #ed8936; font-weight: 700; font-size: 1.2rem; margin-bottom: 0.5rem;">Contact (10%)</div>
+                <div style="color: rgba(255,255,255,0.9); line-height: 1.5;">Verified information</div>
+            </div>
+        """),
+    ),
+    (
+        compact("""
+            <div style="background: rgba(56, 178, 172, 0.2); padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(56, 178, 172, 0.4); margin-bottom: 1rem;">
+                <div style="font-size: 2rem; margin-bottom: 0.5rem;">👥</div>
+                <div style="color: #38b2ac; font-weight: 700; font-size: 1.2rem; margin-bottom: 0.5rem;">Size (10%)</div>
+                <div style="color: rgba(255,255,255,0.9); line-height: 1.5;">Company scale</div>
+            </div>
+        """),
+        compact("""
+            <div style="background: rgba(245, 101, 101, 0.2); padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(245, 101, 101, 0.4);">
+                <div style="font-size: 2rem; margin-bottom: 0.5rem;">📍</div>
+                <div style="color: #f56565; font-weight: 700; font-size: 1.2rem; margin-bottom: 0.5rem;">Location (10%)</div>
+                <div style="color: rgba(255,255,255,0.9); line-height: 1.5;">Geographic advantage</div>
+            </div>
+        """),
+    ),
+)
+
+# Score band legend
+SCORE_GUIDE = compact("""
+    <div style="background: rgba(26, 32, 44, 0.8); padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(72, 187, 120, 0.3); margin: 2rem 0; text-align: center;">
+        <h3 style="color: #48bb78; margin-bottom: 1rem;">Score Guide</h3>
+        <div style="display: flex; justify-content: space-around; flex-wrap: wrap; gap: 1rem;">
+            <div style="padding: 1rem; background: rgba(72, 187, 120, 0.1); border-radius: 8px; min-width: 150px;">
+                <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">🔥</div>
+                <div style="color: #48bb78; font-weight: 700;">80-100</div>
+                <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem;">High Priority</div>
+            </div>
+            <div style="padding: 1rem; background: rgba(237, 137, 54, 0.1); border-radius: 8px; min-width: 150px;">
+                <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">⚡</div>
+                <div style="color: #ed8936; font-weight: 700;">60-79</div>
+                <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem;">Medium Priority</div>
+            </div>
+            <div style="padding: 1rem; background: rgba(229, 62, 62, 0.1); border-radius: 8px; min-width: 150px;">
+                <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">📊</div>
+                <div style="color: #e53e3e; font-weight: 700;">Below 60</div>
+                <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem;">Needs Review</div>
+            </div>
+        </div>
+    </div>
+""")
@@ -0,0 +1,66 @@
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# The app's modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Keep the tests away from the on-disk enrichment cache
+os.environ.setdefault('LEAD_CACHE_PATH', '')
+
+class StubServer:
+    """Local keep-alive HTTP server answering GETs from a script of (status, headers, body) responses
+
+    Each response waits `delay` seconds first; `connections` collects the
+    client address of every connection a request arrived on.
+    """
+
+    def __init__(self):
+        self.responses = []
+        self.requests = 0
+        self.delay = 0
+        self.connections = set()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                stub.requests += 1
+                stub.connections.add(self.client_address)
+                status, headers, body = stub.responses.pop(0) if stub.responses else (200, {}, 'ok')
+                if stub.delay:
+                    time.sleep(stub.delay)
+                body = body.encode('utf-8')
+                try:
+                    self.send_response(status)
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except OSError:
+                    # The client gave up waiting
+                    pass
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/'
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def server():
+    stub = StubServer()
+    yield stub
+    stub.close()
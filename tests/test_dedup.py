@@ -0,0 +1,30 @@
+import pytest
+
+import scraper
+from dedup import dedupe_leads
+from pipeline import LeadPipeline
+
+@pytest.fixture
+def seeded(monkeypatch):
+    monkeypatch.setattr(scraper, 'ENRICHMENT_SEED', 7)
+    monkeypatch.setattr(scraper, 'rate_limit', lambda domain=None: None)
+
+def test_group_is_looked_up_under_a_supplied_domain():
+    leads = [('Acme Inc', ''), ('Acme', 'acme.com'), ('ACME, Inc.', 'https://www.acme.com/')]
+    unique, inverse = dedupe_leads(leads)
+    assert unique == [('Acme Inc', 'acme.com')]
+    assert inverse.tolist() == [0, 0, 0]
+
+def test_supplied_domain_survives_fan_out_when_first_row_has_none(seeded):
+    leads = [('Acme Inc', ''), ('Acme', 'acme.com'), ('ACME, Inc.', 'https://www.acme.com/')]
+    df = LeadPipeline().enrich(leads)
+    assert df['domain'].tolist() == ['acme.com'] * 3
+    assert all(email.endswith('@acme.com') for email in df['email'])
+    assert df['company_name'].tolist() == [name for name, _ in leads]
+
+def test_rows_without_domains_keep_their_own(seeded):
+    leads = [('Acme Inc', ''), ('ACME', ''), ('Globex', 'globex.com')]
+    deduped = LeadPipeline().enrich(leads)
+    separate = LeadPipeline(dedupe=False).enrich(leads)
+    for column in ['domain', 'email', 'linkedin', 'description']:
+        assert deduped[column].tolist() == separate[column].tolist(), column
@@ -0,0 +1,108 @@
+import pytest
+
+import scraper
+from enrichment_cache import EnrichmentCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = EnrichmentCache(str(tmp_path / 'cache.sqlite3'), ttl=60, max_entries=10, clock=clock)
+    yield cache
+    cache.close()
+
+def test_round_trip_and_counters(cache):
+    assert cache.get('Acme', 'acme.com') is None
+    cache.set('Acme', 'acme.com', {'industry': 'SaaS/Tech'})
+    assert cache.get('Acme', 'acme.com') == {'industry': 'SaaS/Tech'}
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'entries': 1}
+
+def test_missing_domain_is_the_empty_domain(cache):
+    cache.set('Acme', None, {'x': 1})
+    assert cache.get('Acme', '') == {'x': 1}
+
+def test_entries_expire_after_ttl(cache, clock):
+    cache.set('Acme', '', {'x': 1})
+    clock.now += 59
+    assert cache.get('Acme', '') == {'x': 1}
+    clock.now += 1
+    assert cache.get('Acme', '') is None
+    cache.set('Acme', '', {'x': 2}, ttl=3600)
+    clock.now += 600
+    assert cache.get('Acme', '') == {'x': 2}
+
+def test_set_replaces_an_entry(cache):
+    cache.set('Acme', '', {'x': 1})
+    cache.set('Acme', '', {'x': 2})
+    assert cache.get('Acme', '') == {'x': 2}
+    assert cache.stats()['entries'] == 1
+
+def test_entries_are_kept_apart_by_seed(cache):
+    cache.set('Acme', '', {'seed': None})
+    cache.set('Acme', '', {'seed': 1}, seed=1)
+    assert cache.get('Acme', '') == {'seed': None}
+    assert cache.get('Acme', '', seed=1) == {'seed': 1}
+    assert cache.get('Acme', '', seed=2) is None
+    cache.invalidate('Acme', '')
+    assert cache.get('Acme', '', seed=1) is None
+    assert cache.stats()['entries'] == 0
+
+def test_least_recently_used_entries_are_evicted(cache, clock):
+    for i in range(10):
+        clock.now += 1
+        cache.set(f'Company {i}', '', {'i': i})
+    # Touch the oldest entry so it survives
+    clock.now += 1
+    assert cache.get('Company 0', '') == {'i': 0}
+    clock.now += 1
+    cache.set('Company 10', '', {'i': 10})
+
+    assert cache.stats()['entries'] == 9
+    assert cache.get('Company 0', '') == {'i': 0}
+    assert cache.get('Company 1', '') is None
+    assert cache.get('Company 10', '') == {'i': 10}
+
+def test_expired_entries_are_evicted_first(cache, clock):
+    for i in range(9):
+        clock.now += 1
+        cache.set(f'Company {i}', '', {'i': i})
+    # The most recently used entry, but expired by the time eviction runs
+    clock.now += 1
+    cache.set('Stale', '', {'x': 0}, ttl=1)
+    clock.now += 2
+    cache.set('Company 9', '', {'i': 9})
+
+    assert cache.stats()['entries'] == 9
+    assert cache.get('Stale', '') is None
+    assert cache.get('Company 0', '') is None
+    assert all(cache.get(f'Company {i}', '') == {'i': i} for i in range(1, 10))
+
+def test_entries_persist_across_connections(tmp_path, clock):
+    path = str(tmp_path / 'cache.sqlite3')
+    cache = EnrichmentCache(path, clock=clock)
+    cache.set('Acme', '', {'x': 1}, seed=3)
+    cache.close()
+    cache = EnrichmentCache(path, clock=clock)
+    assert cache.get('Acme', '', seed=3) == {'x': 1}
+    assert cache.stats()['entries'] == 1
+    cache.close()
+
+def test_refresh_bypasses_the_cache(cache, monkeypatch):
+    monkeypatch.setattr(scraper, '_enrichment_cache', cache)
+    monkeypatch.setattr(scraper, 'rate_limit', lambda domain=None: None)
+    cache.set('Acme Cloud', '', {'industry': 'cached'}, seed=scraper.ENRICHMENT_SEED)
+
+    assert scraper.enrich_company('Acme Cloud')['industry'] == 'cached'
+    fresh = scraper.enrich_company('Acme Cloud', refresh=True)
+    assert fresh['industry'] == 'SaaS/Tech'
+    # The refreshed result replaces the cached one
+    assert scraper.enrich_company('Acme Cloud') == fresh
@@ -0,0 +1,72 @@
+import asyncio
+import socket
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+
+from http_client import AsyncHttpClient
+from metrics import metrics
+
+def fetch(url, **kwargs):
+    """Run get_text with a recording sleep; returns (text or exception, sleeps)"""
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+
+    async def run():
+        async with AsyncHttpClient(sleep=sleep, backoff_factor=0.5, **kwargs) as client:
+            try:
+                return await client.get_text(url)
+            except Exception as e:
+                return e
+
+    return asyncio.run(run()), sleeps
+
+def test_success_is_not_retried(server):
+    server.responses = [(200, {}, 'hello')]
+    assert fetch(server.url) == ('hello', [])
+    assert server.requests == 1
+
+def test_retry_after_is_honoured(server):
+    server.responses = [(503, {'Retry-After': '7'}, ''), (429, {'Retry-After': '0.25'}, ''), (200, {}, 'done')]
+    assert fetch(server.url) == ('done', [7.0, 0.25])
+    assert server.requests == 3
+
+def test_exponential_backoff_without_retry_after(server):
+    server.responses = [(500, {}, ''), (502, {}, ''), (200, {}, 'done')]
+    assert fetch(server.url) == ('done', [0.5, 1.0])
+
+def test_unparseable_retry_after_falls_back_to_backoff(server):
+    server.responses = [(503, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}, ''), (200, {}, 'done')]
+    assert fetch(server.url) == ('done', [0.5])
+
+def test_gives_up_after_the_last_retry(server):
+    server.responses = [(503, {'Retry-After': '1'}, '')] * 4
+    result, sleeps = fetch(server.url, retries=3)
+    assert isinstance(result, aiohttp.ClientResponseError) and result.status == 503
+    assert sleeps == [1.0, 1.0, 1.0]
+    assert server.requests == 4
+
+def test_client_errors_are_not_retried(server):
+    server.responses = [(404, {}, 'missing')]
+    result, sleeps = fetch(server.url)
+    assert isinstance(result, aiohttp.ClientResponseError) and result.status == 404
+    assert sleeps == []
+    assert server.requests == 1
+
+def test_connection_errors_are_retried():
+    # A port nothing listens on
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        url = f'http://127.0.0.1:{sock.getsockname()[1]}/'
+    result, sleeps = fetch(url, retries=2)
+    assert isinstance(result, aiohttp.ClientConnectionError)
+    assert sleeps == [0.5, 1.0]
+
+def test_retries_are_counted(server):
+    before = metrics.snapshot()['counters'].get('http.retries', 0)
+    server.responses = [(503, {}, ''), (200, {}, 'done')]
+    fetch(server.url)
+    assert metrics.snapshot()['counters'].get('http.retries', 0) - before == (1 if metrics.enabled else 0)
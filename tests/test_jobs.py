@@ -0,0 +1,31 @@
+import os
+
+import pytest
+
+import jobs
+import scraper
+from jobs import CANCELLED, JobQueue
+
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sample_leads.csv')
+
+def test_cancelled_job_records_checkpointed_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper, 'rate_limit', lambda domain=None: None)
+    monkeypatch.setattr(jobs, 'JOB_CHUNK_SIZE', 5)
+    queue = JobQueue(str(tmp_path))
+    job_id = queue.submit(SAMPLE_PATH, 'sample_leads.csv', {'max_workers': 1})
+
+    heartbeat = queue.heartbeat
+    def cancel_after_first_chunk(job_id, done=None):
+        status = heartbeat(job_id, done)
+        if done == 5:
+            # Cancelled while the second chunk is being enriched
+            queue.cancel(job_id)
+        return status
+    monkeypatch.setattr(queue, 'heartbeat', cancel_after_first_chunk)
+
+    queue.run(queue.claim())
+
+    job = queue.get(job_id)
+    assert job['status'] == CANCELLED
+    assert job['done'] == 10
+    queue.close()
@@ -0,0 +1,85 @@
+import random
+
+import pandas as pd
+import pytest
+
+from keywords import DEFAULT_KEYWORD_CONFIG, KeywordMatcher
+
+# The if/any() chains the matcher replaced, kept verbatim as the reference
+def original_detect_industry(company_name):
+    name_lower = company_name.lower()
+    saas_keywords = ['software', 'tech', 'cloud', 'saas', 'platform', 'api', 'digital', 'data', 'ai', 'ml', 'automation']
+    if any(keyword in name_lower for keyword in saas_keywords):
+        return 'SaaS/Tech'
+    health_keywords = ['health', 'medical', 'pharma', 'biotech', 'wellness', 'care', 'clinical']
+    if any(keyword in name_lower for keyword in health_keywords):
+        return 'Healthcare'
+    finance_keywords = ['finance', 'fintech', 'bank', 'payment', 'trading', 'investment', 'crypto']
+    if any(keyword in name_lower for keyword in finance_keywords):
+        return 'Financial Services'
+    ecommerce_keywords = ['retail', 'commerce', 'marketplace', 'shop', 'store', 'ecommerce']
+    if any(keyword in name_lower for keyword in ecommerce_keywords):
+        return 'E-commerce'
+    manufacturing_keywords = ['manufacturing', 'industrial', 'factory', 'production', 'supply']
+    if any(keyword in name_lower for keyword in manufacturing_keywords):
+        return 'Manufacturing'
+    return 'Other'
+
+def original_high_revenue(company_name):
+    high_revenue_indicators = ['enterprise', 'corporate', 'global', 'international', 'systems', 'solutions']
+    return any(indicator in company_name.lower() for indicator in high_revenue_indicators)
+
+def original_ai_ml(company_name):
+    return 'ai' in company_name.lower() or 'ml' in company_name.lower()
+
+def original_cloud(company_name):
+    return any(word in company_name.lower() for word in ['cloud', 'saas', 'platform'])
+
+KEYWORDS = sorted({
+    keyword
+    for table in ('high_revenue', 'ai_ml', 'cloud')
+    for keyword in DEFAULT_KEYWORD_CONFIG[table]
+} | {keyword for keywords in DEFAULT_KEYWORD_CONFIG['industries'].values() for keyword in keywords})
+FILLER = ['acme', 'north', 'blue', 'river', 'Inc', 'LLC', '&', 'Co.', 'group', 'partners']
+
+def random_names(rng, n):
+    names = []
+    for _ in range(n):
+        parts = []
+        for _ in range(rng.randint(1, 4)):
+            word = rng.choice(KEYWORDS) if rng.random() < 0.6 else rng.choice(FILLER)
+            if rng.random() < 0.3:
+                # Glue words together so keywords overlap and share prefixes
+                word += rng.choice(KEYWORDS)
+            parts.append(word.upper() if rng.random() < 0.2 else word.capitalize())
+        names.append(' '.join(parts))
+    return names
+
+# Names where several industries, overlapping keywords or prefixes compete
+EDGE_CASES = [
+    'Fintech Partners', 'DataCare Health', 'Caretech', 'Mail Systems', 'HTML Shop', 'Domain Store',
+    'Supplychain Commerce', 'Paymentplatform', 'Bankai', 'eCommerce Cloud', 'Healthcare Retail',
+    'Industrial Bank', 'Digital Pharma', 'Email Factory', 'Plain Name', '',
+]
+
+@pytest.fixture(scope='module')
+def matcher():
+    return KeywordMatcher()
+
+@pytest.mark.parametrize('seed', range(3))
+def test_matcher_agrees_with_any_chains(matcher, seed):
+    for name in random_names(random.Random(seed), 2000) + EDGE_CASES:
+        assert matcher.industry(name) == original_detect_industry(name), name
+        assert matcher.has_high_revenue_indicator(name) == original_high_revenue(name), name
+        assert matcher.has_ai_ml(name) == original_ai_ml(name), name
+        assert matcher.has_cloud(name) == original_cloud(name), name
+
+def test_industry_series_matches_scalar(matcher):
+    names = pd.Series(random_names(random.Random(42), 2000) + EDGE_CASES)
+    expected = [original_detect_industry(name) for name in names]
+    assert matcher.industry_series(names).tolist() == expected
+
+def test_first_industry_in_config_order_wins():
+    config = dict(DEFAULT_KEYWORD_CONFIG)
+    config['industries'] = {'Healthcare': ['care'], 'SaaS/Tech': ['caretech']}
+    assert KeywordMatcher(config).industry('Caretech Labs') == 'Healthcare'
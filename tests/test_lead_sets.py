@@ -0,0 +1,26 @@
+import pandas as pd
+
+from lead_sets import list_lead_sets, load_lead_set, read_lead_set, save_lead_set
+
+def test_round_trip_keeps_categoricals_and_weights(tmp_path):
+    df = pd.DataFrame({
+        'company_name': ['Acme', 'Globex'],
+        'industry': pd.Categorical(['SaaS/Tech', 'Other']),
+        'acquisition_score': [90.0, 40.0],
+    })
+    path = save_lead_set(df, 'q3 leads', weights={'revenue': 50}, root=str(tmp_path))
+
+    loaded, weights = load_lead_set('q3 leads', root=str(tmp_path))
+    assert weights == {'revenue': 50}
+    assert isinstance(loaded['industry'].dtype, pd.CategoricalDtype)
+    assert loaded['company_name'].tolist() == ['Acme', 'Globex']
+    assert read_lead_set(path)[0]['acquisition_score'].tolist() == [90.0, 40.0]
+    assert list_lead_sets(str(tmp_path)) == ['q3_leads']
+
+def test_names_never_resolve_to_files_in_the_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'leads.csv').write_text('company_name\nAcme\n')
+    save_lead_set(pd.DataFrame({'company_name': ['Globex']}), 'leads.csv', root='sets')
+
+    loaded, _ = load_lead_set('leads.csv', root='sets')
+    assert loaded['company_name'].tolist() == ['Globex']
@@ -0,0 +1,19 @@
+import scraper
+from pipeline import LeadPipeline
+from scoring import rescore
+
+def test_failed_lookups_score_zero(monkeypatch):
+    monkeypatch.setattr(scraper, 'rate_limit', lambda domain=None: None)
+
+    def enrich(company_name, domain):
+        if company_name.startswith('Broken'):
+            raise RuntimeError('lookup failed')
+        return scraper.enrich_company(company_name, domain)
+
+    df = LeadPipeline(enrich_fn=enrich).run([('Broken Cloud Co', ''), ('Acme Cloud Co', '')])
+
+    assert df['enriched_at'].isna().tolist() == [True, False]
+    assert df['acquisition_score'].tolist()[0] == 0
+    assert df['acquisition_score'].tolist()[1] > 0
+    # Factors are zeroed too, so a weight change keeps the failed row at 0
+    assert rescore(df, {'industry': 100}).tolist()[0] == 0
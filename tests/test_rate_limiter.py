@@ -0,0 +1,74 @@
+import pytest
+
+from rate_limiter import DomainRateLimiter
+
+class FakeClock:
+    """Manual clock whose sleep just advances time"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def limiter(clock, **kwargs):
+    return DomainRateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+def test_burst_then_rate(clock):
+    limits = limiter(clock, rate=2, burst=3)
+    for _ in range(3):
+        assert limits.try_acquire('a.com') == 0
+    assert limits.try_acquire('a.com') == pytest.approx(0.5)
+    clock.now += 0.5
+    assert limits.try_acquire('a.com') == 0
+
+def test_acquire_sleeps_until_allowed(clock):
+    limits = limiter(clock, rate=4)
+    for _ in range(5):
+        limits.acquire('a.com')
+    assert clock.sleeps == pytest.approx([0.25] * 4)
+    assert clock.now == pytest.approx(1.0)
+
+def test_domains_are_paced_independently(clock):
+    limits = limiter(clock, rate=1)
+    assert limits.try_acquire('a.com') == 0
+    assert limits.try_acquire('b.com') == 0
+    assert limits.try_acquire('a.com') == pytest.approx(1.0)
+
+def test_global_ceiling_applies_across_domains(clock):
+    limits = limiter(clock, rate=10, burst=10, global_rate=2, global_burst=2)
+    assert limits.try_acquire('a.com') == 0
+    assert limits.try_acquire('b.com') == 0
+    assert limits.try_acquire('c.com') == pytest.approx(0.5)
+
+def test_refused_request_consumes_no_tokens(clock):
+    limits = limiter(clock, rate=1, global_rate=100)
+    limits.acquire('a.com')
+    for _ in range(3):
+        assert limits.try_acquire('a.com') > 0
+    clock.now += 1.0
+    assert limits.try_acquire('a.com') == 0
+
+def test_idle_domains_are_pruned(clock, monkeypatch):
+    monkeypatch.setattr(DomainRateLimiter, 'MAX_TRACKED_DOMAINS', 3)
+    limits = limiter(clock, rate=1)
+    for domain in ['a.com', 'b.com', 'c.com']:
+        limits.acquire(domain)
+    clock.now += 1.0
+    limits.acquire('d.com')
+    assert set(limits._buckets) == {'d.com'}
+
+def test_zero_rate_disables_per_domain_limit(clock):
+    limits = limiter(clock, rate=0)
+    for _ in range(100):
+        limits.acquire('a.com')
+    assert clock.sleeps == []
@@ -0,0 +1,60 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scoring import (
+    COMPANY_SIZE_POINTS, DEFAULT_WEIGHTS, GROWTH_SIGNAL_POINTS, INDUSTRY_POINTS, REVENUE_POINTS,
+    TECH_HUBS, calculate_acquisition_fit_scores, score_leads
+)
+from scraper import calculate_acquisition_fit_score
+
+REVENUE_VALUES = list(REVENUE_POINTS) + ['Unknown', '']
+INDUSTRY_VALUES = list(INDUSTRY_POINTS) + ['Other', 'Unknown', '']
+SIGNALS = [signal for signals, _ in GROWTH_SIGNAL_POINTS for signal in signals] + ['Tech sector growth']
+SIZE_VALUES = [marker + ' employees' for marker, _ in COMPANY_SIZE_POINTS] + ['1-10 employees', '']
+LOCATION_VALUES = [hub + ', XX' for hub in TECH_HUBS] + ['Los Angeles, CA', 'Dallas, TX', 'Miami, FL', 'Denver, CO', '']
+
+def random_leads(rng, n):
+    rows = []
+    for _ in range(n):
+        rows.append({
+            'revenue_range': rng.choice(REVENUE_VALUES),
+            'industry': rng.choice(INDUSTRY_VALUES),
+            'growth_signals': ', '.join(rng.sample(SIGNALS, rng.randint(0, 4))) or 'None detected',
+            'email': rng.choice(['', 'info@acme.com']),
+            'phone': rng.choice(['', '(415) 555-0100']),
+            'linkedin': rng.choice(['', 'https://linkedin.com/company/acme']),
+            'company_size': rng.choice(SIZE_VALUES),
+            'location': rng.choice(LOCATION_VALUES),
+        })
+    return rows
+
+def random_weights(rng):
+    return {factor: rng.uniform(0, 40) for factor in DEFAULT_WEIGHTS}
+
+@pytest.mark.parametrize('seed', range(5))
+def test_vectorized_scores_match_scalar(seed):
+    rng = random.Random(seed)
+    rows = random_leads(rng, 500)
+    weights = None if seed == 0 else random_weights(rng)
+
+    expected = [calculate_acquisition_fit_score(row, weights) for row in rows]
+    scores = calculate_acquisition_fit_scores(pd.DataFrame(rows), weights)
+
+    np.testing.assert_array_equal(scores.to_numpy(), expected)
+
+def test_categorical_columns_score_like_strings():
+    rows = random_leads(random.Random(7), 200)
+    df = pd.DataFrame(rows)
+    categorical = df.astype({col: 'category' for col in ['industry', 'revenue_range', 'company_size', 'location']})
+
+    pd.testing.assert_frame_equal(score_leads(categorical), score_leads(df))
+
+def test_missing_values_score_as_empty_strings():
+    rows = random_leads(random.Random(11), 200)
+    df = pd.DataFrame(rows).replace('', np.nan)
+
+    expected = [calculate_acquisition_fit_score(row) for row in rows]
+    np.testing.assert_array_equal(calculate_acquisition_fit_scores(df).to_numpy(), expected)
@@ -0,0 +1,74 @@
+import os
+import random
+
+import pandas as pd
+import pytest
+
+import scraper
+from enrichment_cache import EnrichmentCache
+
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sample_leads.csv')
+WORDS = ['Acme', 'Cloud', 'Health', 'Global', 'AI', 'Data', 'Retail', 'Bank', 'Factory', 'Systems', 'North', 'Labs']
+
+def sample_leads():
+    df = pd.read_csv(SAMPLE_PATH)
+    domains = df['domain'].fillna('') if 'domain' in df.columns else [''] * len(df)
+    return list(zip(df['company_name'], domains))
+
+def random_leads(rng, n):
+    leads = []
+    for i in range(n):
+        name = ' '.join(rng.sample(WORDS, rng.randint(1, 3))) + rng.choice(['', ' Inc', ', LLC', f' {i}'])
+        domain = rng.choice(['', '', f'site{i}.io', 'unknown.com'])
+        leads.append((name, domain))
+    return leads
+
+@pytest.fixture
+def seeded(monkeypatch):
+    monkeypatch.setattr(scraper, 'ENRICHMENT_SEED', 1234)
+    # Pacing is not under test here and would only add sleeps
+    monkeypatch.setattr(scraper, 'rate_limit', lambda domain=None: None)
+    return 1234
+
+def test_batch_matches_per_lead_search(seeded):
+    leads = sample_leads() + random_leads(random.Random(0), 1000)
+    names, domains = zip(*leads)
+
+    batch = scraper.search_company_batch(list(names), list(domains))
+    expected = pd.DataFrame([scraper.search_company_info(name, domain, paced=False) for name, domain in leads])
+
+    pd.testing.assert_frame_equal(batch, expected[batch.columns], check_dtype=False)
+
+def test_seed_argument_overrides_global_seed(seeded):
+    leads = random_leads(random.Random(1), 50)
+    names, domains = zip(*leads)
+    assert scraper.search_company_batch(names, domains, seed=seeded).equals(scraper.search_company_batch(names, domains))
+    assert not scraper.search_company_batch(names, domains, seed=seeded + 1).equals(scraper.search_company_batch(names, domains))
+
+def test_cache_is_keyed_by_seed(tmp_path, monkeypatch, seeded):
+    cache = EnrichmentCache(str(tmp_path / 'cache.sqlite3'))
+    monkeypatch.setattr(scraper, '_enrichment_cache', cache)
+
+    first = scraper.enrich_company('Acme Cloud Systems')
+    monkeypatch.setattr(scraper, 'ENRICHMENT_SEED', seeded + 1)
+    other = scraper.enrich_company('Acme Cloud Systems')
+
+    assert other == scraper.search_company_info('Acme Cloud Systems', paced=False)
+    assert other != first
+    monkeypatch.setattr(scraper, 'ENRICHMENT_SEED', seeded)
+    assert scraper.enrich_company('Acme Cloud Systems') == first
+    assert cache.stats()['hits'] == 1
+    cache.close()
+
+def test_enrich_companies_matches_enrich_company(tmp_path, monkeypatch, seeded):
+    cache = EnrichmentCache(str(tmp_path / 'cache.sqlite3'))
+    monkeypatch.setattr(scraper, '_enrichment_cache', cache)
+    leads = random_leads(random.Random(2), 200)
+    # Half of the leads are already cached
+    for name, domain in leads[::2]:
+        scraper.enrich_company(name, domain)
+
+    results = scraper.enrich_companies(leads)
+
+    assert results == [scraper.search_company_info(name, domain, paced=False) for name, domain in leads]
+    cache.close()
@@ -0,0 +1,80 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from http_client import HttpClient
+from metrics import metrics
+
+@pytest.fixture
+def client():
+    client = HttpClient(backoff_factor=0, retries=3, timeout=(1, 0.3))
+    yield client
+    client.close()
+
+def test_connections_are_reused(server, client):
+    for _ in range(5):
+        assert client.get(server.url).text == 'ok'
+    assert server.requests == 5
+    assert len(server.connections) == 1
+
+def test_threads_share_the_pool(server):
+    client = HttpClient(pool_maxsize=2)
+    barrier = threading.Barrier(4)
+
+    def work():
+        barrier.wait()
+        for _ in range(5):
+            client.get(server.url)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    client.close()
+
+    assert server.requests == 20
+    # At most one connection per concurrent thread, not one per request
+    assert len(server.connections) <= 4
+
+@pytest.mark.parametrize('status', [429, 500, 502, 503, 504])
+def test_retry_statuses_are_retried(server, client, status):
+    server.responses = [(status, {}, ''), (status, {}, ''), (200, {}, 'done')]
+    before = metrics.snapshot()['counters'].get('http.retries', 0)
+
+    response = client.get(server.url)
+
+    assert response.status_code == 200 and response.text == 'done'
+    assert server.requests == 3
+    retries = metrics.snapshot()['counters'].get('http.retries', 0) - before
+    assert retries == (2 if metrics.enabled else 0)
+
+def test_retry_after_is_honoured(server, client):
+    server.responses = [(503, {'Retry-After': '1'}, ''), (200, {}, 'done')]
+    start = time.monotonic()
+    assert client.get(server.url).text == 'done'
+    assert time.monotonic() - start >= 1
+
+def test_gives_up_after_the_last_retry(server, client):
+    server.responses = [(503, {}, '')] * 4
+    with pytest.raises(requests.exceptions.RetryError):
+        client.get(server.url)
+    assert server.requests == 4
+
+def test_client_errors_are_not_retried(server, client):
+    server.responses = [(404, {}, 'missing')]
+    assert client.get(server.url).status_code == 404
+    assert server.requests == 1
+
+def test_read_timeout(server):
+    server.delay = 0.5
+    client = HttpClient(retries=1, backoff_factor=0, timeout=(1, 0.1))
+    start = time.monotonic()
+    with pytest.raises((requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        client.get(server.url)
+    client.close()
+    # One retry, then the timeout surfaces instead of waiting for the slow server
+    assert server.requests == 2
+    assert time.monotonic() - start < 0.5